@@ -96,6 +96,8 @@ root_agent = PortfolioAgent(
         You have access to Dazbo's portfolio data via two main sets of tools:
         1. `search_portfolio`: Use this tool for ALL broad queries and counting (e.g., "How many blogs?",
            "What Python work has he done?"). It is highly optimized for discovery and returns concise summaries.
+           It returns the best matches first, with counts per type. If it reports more results, call it again with
+           the same query and the given `cursor` only if the user needs them.
         2. Firestore MCP Tools:
            - `get_document`: Use this for "surgical" retrieval when you have a specific ID.
            - `list_collections`: Use this to discover the available collection IDs.
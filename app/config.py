@@ -41,6 +41,27 @@ class Settings(BaseSettings):
 
     # Firestore
     firestore_database_id: str = "(default)"
+    # In-process read cache for list endpoints. Set the TTL to 0 to disable.
+    firestore_cache_ttl_seconds: float = 60.0
+    firestore_cache_max_entries: int = 32
+    firestore_cache_max_items: int = 5000
+    # Serve reads from in-memory mirrors kept current by Firestore realtime listeners
+    firestore_realtime_mirror: bool = False
+
+    # HTTP caching: Cache-Control max-age (seconds) per API collection. 0 means clients must always revalidate.
+    http_cache_max_age: dict[str, int] = {
+        "projects": 300,
+        "applications": 300,
+        "blogs": 300,
+        "videos": 300,
+        "experience": 3600,
+        "content": 3600,
+    }
+    http_cache_default_max_age: int = 60
+
+    # API pagination: page size when only `start_after` is given, and the largest `limit` accepted
+    api_default_page_size: int = 50
+    api_max_page_size: int = 200
 
     # Agent
     app_name: str = "dazbo_portfolio"  # must use underscores, not hyphens
@@ -50,6 +71,51 @@ class Settings(BaseSettings):
     max_enrichment_input_chars: int = 15000
     gemini_temp: float = 0.8
 
+    # AI enrichment during ingestion: calls in flight, Gemini requests per minute (0 for no limit),
+    # and retries of 429 / 5xx errors with exponential backoff starting at `enrichment_retry_base_seconds`
+    enrichment_concurrency: int = 8
+    enrichment_requests_per_minute: int = 60
+    enrichment_max_retries: int = 4
+    enrichment_retry_base_seconds: float = 2.0
+    # Enrichments are cached in Firestore by content hash; the least recently used beyond this many are evicted
+    enrichment_cache_max_entries: int = 5000
+    # Delay added to each simulated enrichment call (`ingest --simulate`), to benchmark concurrency offline
+    simulated_enrichment_latency_seconds: float = 0.0
+    # Processes parsing Medium archive HTML during ingestion; 0 means one per CPU core
+    archive_parse_workers: int = 0
+    # Shared HTTP client used by the ingestion connectors. Connect retries apply only to failed connection attempts;
+    # error responses are not retried by the client.
+    http_client_http2: bool = True
+    http_client_max_connections: int = 20
+    http_client_max_keepalive_connections: int = 10
+    http_client_keepalive_expiry_seconds: float = 30.0
+    http_client_timeout_seconds: float = 30.0
+    http_client_connect_timeout_seconds: float = 10.0
+    http_client_connect_retries: int = 2
+    # Dev.to article detail requests in flight during ingestion. Throttled responses (429 / 503) halve this and are
+    # retried after the server's Retry-After, or with exponential backoff from `devto_retry_base_seconds`.
+    devto_detail_concurrency: int = 4
+    devto_max_retries: int = 3
+    devto_retry_base_seconds: float = 1.0
+
+    # Semantic search: embeddings are written at ingest time (`--embed`) and queried by `search_portfolio`
+    semantic_search_enabled: bool = False
+    embedding_provider: str = "gemini"  # "gemini", or "hashing" for a deterministic local stand-in
+    embedding_model: str = "gemini-embedding-001"
+    embedding_dimensions: int = 768
+    semantic_search_top_k: int = 10
+    # Vector index: "flat" (exact brute-force) or "ivf" (inverted file, approximate). 0 lists means sqrt(n).
+    vector_index_method: str = "flat"
+    vector_index_ivf_lists: int = 0
+    vector_index_ivf_probes: int = 4
+    # search_portfolio output budget: results per call, total characters per call, and characters per description.
+    # Further results are paged with the cursor included in the output.
+    search_result_limit: int = 20
+    search_result_max_chars: int = 6000
+    search_snippet_max_chars: int = 200
+    # Reciprocal rank fusion constant used to merge keyword and semantic rankings
+    search_rrf_k: int = 60
+
     # Note that this prompt is replaced at deploy time
     dazbo_system_prompt: str = "You are Dazbo's portfolio assistant. You help visitors navigate his projects and blogs. Always provide links/URLs when mentioning specific projects or blogs."
 
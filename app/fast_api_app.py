@@ -5,16 +5,19 @@ How: Configures FastAPI with ADK integration, Telemetry, and Firestore services
 Note: Chat sessions are ephemeral and stored in-memory (not persisted to Firestore).
 """
 
+import asyncio
 import html
 import json
 import logging
 import os
 from contextlib import asynccontextmanager
+from datetime import UTC
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Annotated, Literal
 
 import anyio
 import google.auth
-from fastapi import BackgroundTasks, Depends, FastAPI, Header, HTTPException, Request, Response
-from fastapi.encoders import jsonable_encoder
+from fastapi import BackgroundTasks, Depends, FastAPI, Header, HTTPException, Query, Request, Response
 from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from google.adk.agents.run_config import RunConfig, StreamingMode
@@ -49,11 +52,15 @@ from app.models.video import Video
 from app.seo_constants import get_person_schema
 from app.services.application_service import ApplicationService
 from app.services.blog_service import BlogService
+from app.services.collection_mirror import CollectionMirror
 from app.services.content_service import ContentService
+from app.services.embedding_service import EmbeddingService
 from app.services.experience_service import ExperienceService
-from app.services.firestore import close_client, get_client
+from app.services.firestore import close_client, get_client, get_sync_client
+from app.services.firestore_base import CollectionCache, EncodedSnapshot, new_collection_cache
 from app.services.project_service import ProjectService
 from app.services.video_service import VideoService
+from app.tools import portfolio_search
 
 # Suppress noisy OpenTelemetry attribute warnings
 os.environ["OTEL_PYTHON_LOG_LEVEL"] = "ERROR"
@@ -88,6 +95,34 @@ AGENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 session_service_uri = None
 
 
+CACHED_SERVICE_NAMES = [
+    "project_service",
+    "application_service",
+    "blog_service",
+    "content_service",
+    "experience_service",
+    "video_service",
+    "embedding_service",
+]
+
+
+def _log_cache_stats(app: FastAPI):
+    for name in CACHED_SERVICE_NAMES:
+        service = getattr(app.state, name, None)
+        cache = getattr(service, "cache", None)
+        if isinstance(cache, CollectionCache):
+            logger.info(f"Cache stats for {service.collection_name}: {cache.stats()}")
+
+
+def _invalidate_caches(app: FastAPI):
+    """Drops cached snapshots, e.g. after an ingestion run that wrote through other service instances."""
+    for name in CACHED_SERVICE_NAMES:
+        service = getattr(app.state, name, None)
+        cache = getattr(service, "cache", None)
+        if isinstance(cache, CollectionCache):
+            cache.invalidate()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Initialize Firestore client
@@ -95,16 +130,47 @@ async def lifespan(app: FastAPI):
     app.state.firestore_db = db
 
     # Initialize Services
-    app.state.project_service = ProjectService(db)
-    app.state.application_service = ApplicationService(db)
-    app.state.blog_service = BlogService(db)
-    app.state.content_service = ContentService(db)
-    app.state.experience_service = ExperienceService(db)
-    app.state.video_service = VideoService(db)
+    app.state.project_service = ProjectService(db, cache=new_collection_cache())
+    app.state.application_service = ApplicationService(db, cache=new_collection_cache())
+    app.state.blog_service = BlogService(db, cache=new_collection_cache())
+    app.state.content_service = ContentService(db, cache=new_collection_cache())
+    app.state.experience_service = ExperienceService(db, cache=new_collection_cache())
+    app.state.video_service = VideoService(db, cache=new_collection_cache())
+    app.state.embedding_service = EmbeddingService(db, cache=new_collection_cache())
     app.state.session_service = InMemorySessionService()
 
+    # Optionally keep live mirrors of the portfolio collections, so reads don't hit Firestore
+    mirrors: list[CollectionMirror] = []
+    if settings.firestore_realtime_mirror:
+        sync_db = get_sync_client()
+        loop = asyncio.get_running_loop()
+        for name in CACHED_SERVICE_NAMES:
+            # Embeddings are only read by semantic search, so they aren't worth a listener otherwise
+            if name == "embedding_service" and not settings.semantic_search_enabled:
+                continue
+            service = getattr(app.state, name)
+            mirror = CollectionMirror(sync_db.collection(service.collection_name), loop=loop)
+            service.attach_mirror(mirror)
+            mirror.start()
+            mirrors.append(mirror)
+        logger.info(f"Started realtime mirrors for {len(mirrors)} collections")
+
+    # Let the agent's search tool read through these cached services, and build its index ahead of the first query
+    portfolio_search.use_services(
+        app.state.project_service,
+        app.state.blog_service,
+        app.state.video_service,
+        embedding_service=app.state.embedding_service,
+    )
+    warm_search_index = asyncio.create_task(portfolio_search.warm_index())
+
     yield
     # Clean up
+    warm_search_index.cancel()
+    portfolio_search.use_services()
+    for mirror in mirrors:
+        mirror.stop()
+    _log_cache_stats(app)
     close_client()
 
 
@@ -289,56 +355,181 @@ async def trigger_refresh(
                 yaml_file=None,
                 about_file=None,
                 project_id=settings.google_cloud_project,
-                simulate=False
+                simulate=False,
+                embed=settings.semantic_search_enabled,
             )
             logger.info("Background ingestion completed successfully.")
         except Exception as err:
             logger.error(f"Error during background ingestion: {err}")
         finally:
+            # Ingestion writes through its own service instances, so drop our cached snapshots
+            _invalidate_caches(app)
             app.state.is_ingesting = False
 
     background_tasks.add_task(run_ingestion)
     return {"status": "refresh triggered"}
 
 
+def _cache_control(collection: str) -> str:
+    max_age = settings.http_cache_max_age.get(collection, settings.http_cache_default_max_age)
+    return f"public, max-age={max_age}" if max_age > 0 else "no-cache"
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against our ETag, as required by RFC 9110."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates
+
+
+def _is_not_modified(request: Request, encoded: EncodedSnapshot) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match takes precedence; If-Modified-Since is ignored when it is present
+        return _etag_matches(if_none_match, encoded.etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    # Without a Last-Modified date, only the ETag can validate the client's copy
+    if if_modified_since and encoded.last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        # HTTP dates have one-second resolution
+        return encoded.last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def _encoded_json_response(request: Request, encoded: EncodedSnapshot, collection: str) -> Response:
+    """
+    Writes a pre-encoded JSON body straight to the response, with no per-request serialisation.
+    Returns 304 Not Modified when the client's validators show it already has this body.
+    """
+    headers = {"ETag": encoded.etag, "Cache-Control": _cache_control(collection)}
+    if (last_modified := encoded.last_modified) is not None:
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=UTC)
+        headers["Last-Modified"] = format_datetime(last_modified.astimezone(UTC), usegmt=True)
+    if encoded.next_cursor:
+        headers["X-Next-Cursor"] = encoded.next_cursor
+        next_url = request.url.include_query_params(start_after=encoded.next_cursor)
+        headers["Link"] = f'<{next_url}>; rel="next"'
+    if _is_not_modified(request, encoded):
+        return Response(status_code=304, headers=headers)
+    return Response(content=encoded.body, media_type="application/json", headers=headers)
+
+
+PageLimit = Annotated[
+    int | None,
+    Query(ge=1, le=settings.api_max_page_size, description="Return at most this many items, starting a paginated listing"),
+]
+StartAfter = Annotated[
+    str | None, Query(description="Cursor from the previous page's X-Next-Cursor header; returns the following page")
+]
+
+
+async def _list_response(
+    request: Request,
+    service,
+    collection: str,
+    limit: int | None,
+    start_after: str | None,
+    fields=None,
+) -> Response:
+    """Serves a full listing, or a single page when `limit` or `start_after` is given."""
+    if start_after and limit is None:
+        limit = settings.api_default_page_size
+    try:
+        encoded = await service.list_json(fields=fields, limit=limit, start_after=start_after)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return _encoded_json_response(request, encoded, collection)
+
+
 @app.get("/api/projects", response_model=list[Project])
 @limiter.limit("60/minute")
-async def list_projects(request: Request, service: ProjectService = Depends(get_project_service)):
-    """List all projects."""
-    data = await service.list()
-    return JSONResponse(content=jsonable_encoder(data))
+async def list_projects(
+    request: Request,
+    limit: PageLimit = None,
+    start_after: StartAfter = None,
+    service: ProjectService = Depends(get_project_service),
+):
+    """List all projects, or one page of them with `limit` / `start_after`."""
+    return await _list_response(request, service, "projects", limit, start_after)
 
 
 @app.get("/api/applications", response_model=list[Application])
 @limiter.limit("60/minute")
-async def list_applications(request: Request, service: ApplicationService = Depends(get_application_service)):
-    """List all curated applications."""
-    data = await service.list()
-    return JSONResponse(content=jsonable_encoder(data))
+async def list_applications(
+    request: Request,
+    limit: PageLimit = None,
+    start_after: StartAfter = None,
+    service: ApplicationService = Depends(get_application_service),
+):
+    """List all curated applications, or one page of them with `limit` / `start_after`."""
+    return await _list_response(request, service, "applications", limit, start_after)
 
 
 @app.get("/api/blogs", response_model=list[Blog])
 @limiter.limit("60/minute")
-async def list_blogs(request: Request, service: BlogService = Depends(get_blog_service)):
-    """List all blog posts."""
-    data = await service.list()
-    return JSONResponse(content=jsonable_encoder(data))
+async def list_blogs(
+    request: Request,
+    view: Literal["full", "summary"] = "full",
+    fields: str | None = None,
+    limit: PageLimit = None,
+    start_after: StartAfter = None,
+    service: BlogService = Depends(get_blog_service),
+):
+    """
+    List all blog posts, or one page of them with `limit` / `start_after`.
+    `view=summary` returns only the fields needed for a blog card, and `fields=a,b` returns only the named fields.
+    Use `/api/blogs/{blog_id}` to fetch a single post's full body.
+    """
+    projection = None
+    if fields:
+        projection = [f.strip() for f in fields.split(",") if f.strip()]
+    elif view == "summary":
+        projection = BlogService.SUMMARY_FIELDS
+    return await _list_response(request, service, "blogs", limit, start_after, fields=projection)
+
+
+@app.get("/api/blogs/{blog_id}", response_model=Blog)
+@limiter.limit("60/minute")
+async def get_blog(blog_id: str, request: Request, service: BlogService = Depends(get_blog_service)):
+    """Retrieve a single blog post, including its full markdown body."""
+    blog = await service.get(blog_id)
+    if not blog:
+        return JSONResponse(status_code=404, content={"message": "Blog not found"})
+    # Blogs record no modification time, so the response carries only an ETag
+    encoded = EncodedSnapshot.from_body(blog.model_dump_json().encode("utf-8"))
+    return _encoded_json_response(request, encoded, "blogs")
 
 
 @app.get("/api/videos", response_model=list[Video])
 @limiter.limit("60/minute")
-async def list_videos(request: Request, service: VideoService = Depends(get_video_service)):
-    """List all YouTube videos."""
-    data = await service.list()
-    return JSONResponse(content=jsonable_encoder(data))
+async def list_videos(
+    request: Request,
+    limit: PageLimit = None,
+    start_after: StartAfter = None,
+    service: VideoService = Depends(get_video_service),
+):
+    """List all YouTube videos, or one page of them with `limit` / `start_after`."""
+    return await _list_response(request, service, "videos", limit, start_after)
 
 
 @app.get("/api/experience", response_model=list[Experience])
 @limiter.limit("60/minute")
-async def list_experience(request: Request, service: ExperienceService = Depends(get_experience_service)):
-    """List all work experience."""
-    data = await service.list()
-    return JSONResponse(content=jsonable_encoder(data))
+async def list_experience(
+    request: Request,
+    limit: PageLimit = None,
+    start_after: StartAfter = None,
+    service: ExperienceService = Depends(get_experience_service),
+):
+    """List all work experience, or one page of them with `limit` / `start_after`."""
+    return await _list_response(request, service, "experience", limit, start_after)
 
 
 @app.get("/api/content/{slug}", response_model=Content)
@@ -348,7 +539,8 @@ async def get_content(slug: str, request: Request, service: ContentService = Dep
     doc = await service.get(slug)
     if not doc:
         return JSONResponse(status_code=404, content={"message": "Content not found"})
-    return JSONResponse(content=jsonable_encoder(doc))
+    encoded = EncodedSnapshot.from_body(doc.model_dump_json().encode("utf-8"), last_modified=doc.last_updated)
+    return _encoded_json_response(request, encoded, "content")
 
 
 @app.get("/sitemap.xml")
@@ -25,4 +25,5 @@ class Blog(BaseModel):
     markdown_content: str | None = None
     ai_summary: str | None = None
     author_url: str | None = None
+    fingerprint: str | None = Field(None, exclude=True, description="Content hash used to skip unchanged writes")
     created_at: datetime = Field(default_factory=datetime.now)
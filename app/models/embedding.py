@@ -0,0 +1,19 @@
+"""
+Description: Embedding data model.
+Why: Stores one semantic search vector per blog or project, alongside the portfolio data in Firestore.
+How: Uses Pydantic BaseModel. The document ID is "<kind>:<item id>", e.g. "blog:medium:my-post".
+"""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class Embedding(BaseModel):
+    id: str | None = None
+    kind: str = Field(..., description="The kind of item embedded, e.g. 'blog' or 'project'")
+    item_id: str = Field(..., description="Firestore document ID of the embedded item")
+    model: str = Field(..., description="The embedding provider and model that produced the vector")
+    vector: list[float]
+    content_hash: str = Field(..., description="Hash of the embedded text, used to skip unchanged items")
+    created_at: datetime = Field(default_factory=datetime.now)
@@ -0,0 +1,19 @@
+"""
+Description: Enrichment cache data model.
+Why: Stores the AI summary and tags generated for a piece of content, so the same content is never enriched twice.
+How: Uses Pydantic BaseModel. The document ID is a hash of the model, prompt version and normalised input text.
+"""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class Enrichment(BaseModel):
+    id: str | None = None
+    model: str = Field(..., description="The Gemini model that generated the enrichment")
+    prompt_version: str = Field(..., description="Version of the enrichment prompt used")
+    summary: str
+    tags: list[str] = Field(default_factory=list)
+    created_at: datetime = Field(default_factory=datetime.now)
+    last_used_at: datetime = Field(default_factory=datetime.now, description="Used to evict least recently used entries")
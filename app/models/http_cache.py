@@ -0,0 +1,22 @@
+"""
+Description: HTTP response cache data model.
+Why: Lets ingestion connectors make conditional requests (`If-None-Match` / `If-Modified-Since`) on the next run,
+     and rebuild their results from the stored data when the server answers 304 Not Modified.
+How: Uses Pydantic BaseModel. The document ID is a hash of the request URL. `data` holds only the parts of the
+     response body that the connector needs, to stay well within Firestore's document size limit.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class HttpCacheEntry(BaseModel):
+    id: str | None = None
+    url: str = Field(..., description="The request URL, including its query string")
+    etag: str | None = None
+    last_modified: str | None = None
+    next_url: str | None = Field(None, description="The `next` page link of a paginated response")
+    data: Any = None
+    fetched_at: datetime = Field(default_factory=datetime.now)
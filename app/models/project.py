@@ -24,4 +24,5 @@ class Project(BaseModel):
     updated_at: datetime | None = None
     is_manual: bool = True
     metadata_only: bool = False
+    fingerprint: str | None = Field(None, exclude=True, description="Content hash used to skip unchanged writes")
     created_at: datetime = Field(default_factory=datetime.now)
@@ -20,3 +20,4 @@ class Video(BaseModel):
     video_url: str = Field(..., description="The direct URL to the YouTube video")
     is_manual: bool = Field(True, description="Indicates if the video was added manually")
     source_platform: str = Field("youtube", description="The source platform of the video (e.g., youtube)")
+    fingerprint: str | None = Field(None, exclude=True, description="Content hash used to skip unchanged writes")
@@ -7,9 +7,9 @@ How: Inherits from FirestoreService and specifies the "applications" collection.
 from google.cloud.firestore import AsyncClient
 
 from app.models.application import Application
-from app.services.firestore_base import FirestoreService
+from app.services.firestore_base import CollectionCache, FirestoreService
 
 
 class ApplicationService(FirestoreService[Application]):
-    def __init__(self, db: AsyncClient):
-        super().__init__(db, "applications", Application)
+    def __init__(self, db: AsyncClient, cache: CollectionCache | None = None):
+        super().__init__(db, "applications", Application, cache=cache)
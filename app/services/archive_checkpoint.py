@@ -0,0 +1,86 @@
+"""
+Description: Checkpoint journal for Medium archive ingestion.
+Why: A full archive ingest can be interrupted (e.g. a Cloud Run timeout or Gemini quota exhaustion). Without a record
+     of what was already saved, a restart has to read, enrich and write every post again.
+How: `ArchiveCheckpoint` keeps a JSON Lines journal next to the zip. The first line holds the SHA-256 of the zip, and
+     each later line records a post (member name and CRC) whose outcome was persisted. When resuming, the journal is
+     only trusted if the zip's hash matches, and a post is only skipped if its CRC in the zip still matches.
+"""
+
+import hashlib
+import json
+import logging
+import zipfile
+from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX = ".checkpoint.jsonl"
+_READ_CHUNK_BYTES = 1024 * 1024
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_READ_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ArchiveCheckpoint:
+    """
+    Records which members of a Medium export zip have been processed and persisted.
+    Without `resume`, any previous journal for the zip is discarded and a new one is started.
+    """
+
+    def __init__(self, zip_path: str, resume: bool = False, journal_path: str | None = None):
+        self.journal_path = journal_path or zip_path + JOURNAL_SUFFIX
+        self.zip_hash = file_sha256(zip_path)
+        with zipfile.ZipFile(zip_path, "r") as z:
+            self._crcs = {info.filename: info.CRC for info in z.infolist()}
+        self._done: set[tuple[str, int]] = self._load() if resume else set()
+        if not self._done:
+            # Start a new journal; appending to it later only adds lines
+            with open(self.journal_path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"zip_sha256": self.zip_hash}) + "\n")
+
+    @property
+    def done_count(self) -> int:
+        return len(self._done)
+
+    def is_done(self, member: str) -> bool:
+        return (member, self._crcs.get(member)) in self._done
+
+    def record(self, members: Iterable[str]) -> None:
+        """Appends members to the journal. Call only once their outcome has been persisted."""
+        entries = [(m, self._crcs[m]) for m in members if m in self._crcs]
+        if not entries:
+            return
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps({"member": m, "crc": crc}) + "\n" for m, crc in entries)
+        self._done.update(entries)
+
+    def _load(self) -> set[tuple[str, int]]:
+        try:
+            with open(self.journal_path, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return set()
+
+        try:
+            header = json.loads(lines[0]) if lines else {}
+        except json.JSONDecodeError:
+            header = {}
+        if header.get("zip_sha256") != self.zip_hash:
+            logger.warning(f"Checkpoint {self.journal_path} is for a different archive; starting from the beginning")
+            return set()
+
+        done = set()
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+                done.add((entry["member"], entry["crc"]))
+            except (json.JSONDecodeError, KeyError, TypeError):
+                # e.g. a line cut short when the previous run was killed
+                continue
+        return done
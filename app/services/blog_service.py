@@ -2,18 +2,26 @@
 Description: Blog service implementation.
 Why: Handles business logic and Firestore operations for blog posts.
 How: Extends `FirestoreService` for `Blog` model and `blogs` collection.
+     `SUMMARY_FIELDS` is the lightweight projection used by the blog carousel; it omits `markdown_content`.
 """
 
+from typing import Any
+
 from google.cloud import firestore
 
 from app.config import settings
 from app.models.blog import Blog
-from app.services.firestore_base import FirestoreService
+from app.services.firestore_base import CollectionCache, FirestoreService
 
 
 class BlogService(FirestoreService[Blog]):
-    def __init__(self, db: firestore.AsyncClient):
-        super().__init__(db, "blogs", Blog)
+    # Sort by date descending
+    order_by = "date"
+    # Fields needed to render a blog card. Full bodies are fetched one post at a time.
+    SUMMARY_FIELDS = ("title", "summary", "ai_summary", "date", "platform", "url", "image_url", "tags", "is_private")
+
+    def __init__(self, db: firestore.AsyncClient, cache: CollectionCache | None = None):
+        super().__init__(db, "blogs", Blog, cache=cache)
 
     def _enrich_blog_data(self, data: dict) -> dict:
         """Enrich blog data with computed fields."""
@@ -25,23 +33,22 @@ class BlogService(FirestoreService[Blog]):
             data["author_url"] = settings.devto_profile
         return data
 
-    async def get(self, item_id: str) -> Blog | None:
-        doc_ref = self.collection.document(item_id)
-        doc = await doc_ref.get()
-        if doc.exists:
-            data = doc.to_dict()
-            data["id"] = doc.id
-            data = self._enrich_blog_data(data)
-            return self.model_class(**data)
-        return None
-
-    async def list(self) -> list[Blog]:
-        # Sort by date descending
-        docs = self.collection.order_by("date", direction=firestore.Query.DESCENDING).stream()
-        items = []
-        async for doc in docs:
-            data = doc.to_dict()
-            data["id"] = doc.id
-            data = self._enrich_blog_data(data)
-            items.append(self.model_class(**data))
-        return items
+    def _to_model(self, doc) -> Blog:
+        data = doc.to_dict()
+        data["id"] = doc.id
+        data = self._enrich_blog_data(data)
+        return self.model_class(**data)
+
+    def _select_fields(self, fields: tuple[str, ...]) -> tuple[str, ...]:
+        # author_url is computed from platform rather than stored
+        if "author_url" in fields and "platform" not in fields:
+            return (*fields, "platform")
+        return fields
+
+    def _project(self, doc, fields: tuple[str, ...]) -> dict[str, Any]:
+        data = self._enrich_blog_data(doc.to_dict() or {})
+        projected = {"id": doc.id}
+        for field in fields:
+            if field in data:
+                projected[field] = data[field]
+        return projected
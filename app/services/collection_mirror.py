@@ -0,0 +1,130 @@
+"""
+Description: Live in-memory mirror of a Firestore collection.
+Why: Lets read endpoints serve from memory instead of streaming whole collections from Firestore on every request.
+How: Subscribes to a realtime `on_snapshot` listener on a (sync) collection reference and applies each
+     ADDED / MODIFIED / REMOVED delta to a local dict of document snapshots.
+Note: Firestore realtime listeners are only available on the sync client and their callbacks run on a
+      background thread, so state is guarded by a lock and change notifications are handed back to the event loop.
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# A position in an ordered listing: (order field value, document ID)
+type PagePosition = tuple[Any, str]
+
+
+def firestore_sort_key(value: Any) -> tuple[int, Any]:
+    """
+    Returns a key that orders values the way Firestore orders mixed-type fields:
+    null < boolean < number < timestamp < string < everything else.
+    """
+    if value is None:
+        return (0, 0)
+    if isinstance(value, bool):
+        return (1, value)
+    if isinstance(value, int | float):
+        return (2, value)
+    if isinstance(value, datetime):
+        return (3, value.timestamp())
+    if isinstance(value, str):
+        return (4, value)
+    return (9, str(value))
+
+
+class CollectionMirror:
+    """
+    Keeps an always-current copy of a collection's document snapshots.
+
+    Until the first snapshot arrives `ready` is False and callers should fall back to querying Firestore.
+    """
+
+    def __init__(self, collection_ref, loop: asyncio.AbstractEventLoop | None = None):
+        self.collection_ref = collection_ref
+        self.loop = loop
+        self.version = 0
+        self._docs: dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._watch = None
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """Registers a callback that is invoked (on the event loop, if one was given) after each delta."""
+        self._listeners.append(callback)
+
+    def start(self) -> None:
+        """Subscribes to the collection's realtime updates."""
+        if self._watch is None:
+            self._watch = self.collection_ref.on_snapshot(self._on_snapshot)
+
+    def stop(self) -> None:
+        """Unsubscribes from realtime updates. The last known state is kept but no longer served."""
+        if self._watch is not None:
+            self._watch.unsubscribe()
+            self._watch = None
+        self._ready.clear()
+
+    def _on_snapshot(self, docs, changes, read_time) -> None:
+        with self._lock:
+            for change in changes:
+                doc = change.document
+                if change.type.name == "REMOVED":
+                    self._docs.pop(doc.id, None)
+                else:
+                    self._docs[doc.id] = doc
+            self.version += 1
+        self._ready.set()
+        logger.debug(f"Applied {len(changes)} changes to mirror of {self.collection_ref.id} (version {self.version})")
+        self._notify()
+
+    def _notify(self) -> None:
+        for callback in self._listeners:
+            if self.loop is not None and not self.loop.is_closed():
+                self.loop.call_soon_threadsafe(callback)
+            else:
+                callback()
+
+    def get(self, doc_id: str):
+        """Returns the mirrored document snapshot, or None if it doesn't exist."""
+        with self._lock:
+            return self._docs.get(doc_id)
+
+    def documents(
+        self, order_by: str | None = None, start_after: PagePosition | None = None, limit: int | None = None
+    ) -> list:
+        """
+        Returns the mirrored document snapshots.
+        With `order_by`, matches Firestore's `order_by(field, DESCENDING)`: documents missing the field are
+        excluded, and ties are broken by document ID.
+        With `start_after`, only documents after that position are returned, as with a Firestore query cursor.
+        """
+        with self._lock:
+            docs = list(self._docs.values())
+
+        if not order_by:
+            docs.sort(key=lambda d: d.id)
+            if start_after is not None:
+                docs = [d for d in docs if d.id > start_after[1]]
+            return docs[:limit]
+
+        keyed = []
+        for doc in docs:
+            data = doc.to_dict() or {}
+            if order_by in data:
+                keyed.append((firestore_sort_key(data[order_by]), doc.id, doc))
+        if start_after is not None:
+            after = (firestore_sort_key(start_after[0]), start_after[1])
+            keyed = [k for k in keyed if (k[0], k[1]) < after]
+        keyed.sort(key=lambda k: (k[0], k[1]), reverse=True)
+        return [doc for _, _, doc in keyed[:limit]]
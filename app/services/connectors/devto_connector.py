@@ -1,22 +1,44 @@
 """
 Description: Dev.to ingestion connector.
 Why: Fetches blog post metadata from Dev.to API to populate the portfolio.
-How: Uses httpx to call Dev.to API and maps results to Blog model.
+How: Uses httpx to call Dev.to API and maps results to Blog model. The list and per-article detail requests share
+     one pooled client (the injected one during ingestion), so they reuse connections rather than reconnecting.
+     Detail requests run concurrently under an `AdaptiveLimiter`, which backs off when Dev.to answers 429 / 503,
+     and throttled requests are retried after the server's `Retry-After`.
 """
 
+import asyncio
 import logging
+import random
 import time
 
 import httpx
 
+from app.config import settings
 from app.models.blog import Blog
+from app.services.http_client import AdaptiveLimiter, borrow_client, retry_after_seconds
 
 logger = logging.getLogger(__name__)
 
+THROTTLED_STATUS_CODES = frozenset({429, 503})
+
 
 class DevToConnector:
-    def __init__(self, base_url: str = "https://dev.to/api"):
+    def __init__(
+        self,
+        base_url: str = "https://dev.to/api",
+        client: httpx.AsyncClient | None = None,
+        detail_concurrency: int | None = None,
+        max_retries: int | None = None,
+        retry_base_seconds: float | None = None,
+    ):
         self.base_url = base_url
+        self.client = client
+        self.detail_concurrency = detail_concurrency or settings.devto_detail_concurrency
+        self.max_retries = settings.devto_max_retries if max_retries is None else max_retries
+        self.retry_base_seconds = settings.devto_retry_base_seconds if retry_base_seconds is None else retry_base_seconds
+        # The limiter of the latest fetch, so callers can report how often Dev.to throttled it
+        self.limiter: AdaptiveLimiter | None = None
 
     async def fetch_posts(
         self, username: str, limit: int | None = None, existing_urls: set[str] | None = None
@@ -25,12 +47,13 @@ class DevToConnector:
         Fetches blog posts for a given Dev.to username.
         """
         existing_urls = existing_urls or set()
-        async with httpx.AsyncClient() as client:
+        self.limiter = limiter = AdaptiveLimiter(self.detail_concurrency)
+        async with borrow_client(self.client) as client:
             # Request per_page=100 and a cache-busting timestamp to fetch full article history
             # and prevent Dev.to's Fastly CDN edge cache from serving stale responses.
             timestamp = int(time.time())
             url = f"{self.base_url}/articles?username={username}&per_page=100&_t={timestamp}"
-            response = await client.get(url)
+            response = await self._get(client, limiter, url)
             response.raise_for_status()
             articles_data = response.json()
 
@@ -38,59 +61,92 @@ class DevToConnector:
             # We first check if the user exists to throw a helpful error if articles are empty
             if not articles_data:
                 user_url = f"{self.base_url}/users/by_username?url={username}"
-                user_resp = await client.get(user_url)
+                user_resp = await self._get(client, limiter, user_url)
                 if user_resp.status_code == 404:
                     raise ValueError(f"Dev.to user '{username}' not found.")
 
             if limit:
                 articles_data = articles_data[:limit]
 
-            blogs = []
+            articles = []
             for article in articles_data:
                 title = article.get("title", "")
                 if title.startswith("[Boost]"):
                     logger.info(f"Skipping (quickie): {title}")
                     continue
+                articles.append(article)
+
+            # Fetch full article content to get markdown, for articles not already existing
+            bodies = await asyncio.gather(
+                *(self._fetch_body(client, limiter, article, existing_urls) for article in articles)
+            )
+
+        blogs = []
+        for article, body_markdown in zip(articles, bodies, strict=True):
+            title = article.get("title", "")
+
+            # Filter "quickie" posts based on word count
+            if body_markdown:
+                word_count = len(body_markdown.split())
+                if word_count < 200:
+                    logger.info(f"Skipping (quickie - too short): {title} ({word_count} words)")
+                    continue
 
-                article_url = article.get("url")
-
-                # Fetch full article content to get markdown if not already existing
-                article_id = article.get("id")
-                body_markdown = None
-                if article_id and article_url not in existing_urls:
-                    try:
-                        detail_url = f"{self.base_url}/articles/{article_id}"
-                        detail_resp = await client.get(detail_url)
-                        if detail_resp.status_code == 200:
-                            body_markdown = detail_resp.json().get("body_markdown")
-
-                            # Filter "quickie" posts based on word count
-                            if body_markdown:
-                                word_count = len(body_markdown.split())
-                                if word_count < 200:
-                                    logger.info(f"Skipping (quickie - too short): {title} ({word_count} words)")
-                                    continue
-                    except Exception as e:
-                        logger.warning(f"Failed to fetch content for article {article_id}: {e}")
-
-                # Basic mapping
-                # date is published_at, e.g. "2026-01-18T10:00:00Z"
-                date_iso = article.get("published_at", "").split("T")[0]
-                tags = article.get("tag_list", [])
-                image_url = article.get("cover_image") or article.get("social_image") or None
-
-                blog = Blog(
-                    title=title,
-                    summary=article.get("description") or "",
-                    date=date_iso,
-                    platform="Dev.to",
-                    url=article_url,
-                    image_url=image_url,
-                    source_platform="devto_api",
-                    is_manual=False,
-                    markdown_content=body_markdown,
-                    tags=tags,
-                )
-                blogs.append(blog)
+            # Basic mapping
+            # date is published_at, e.g. "2026-01-18T10:00:00Z"
+            date_iso = article.get("published_at", "").split("T")[0]
+            tags = article.get("tag_list", [])
+            image_url = article.get("cover_image") or article.get("social_image") or None
+
+            blog = Blog(
+                title=title,
+                summary=article.get("description") or "",
+                date=date_iso,
+                platform="Dev.to",
+                url=article.get("url"),
+                image_url=image_url,
+                source_platform="devto_api",
+                is_manual=False,
+                markdown_content=body_markdown,
+                tags=tags,
+            )
+            blogs.append(blog)
 
         return blogs
+
+    async def _fetch_body(
+        self, client: httpx.AsyncClient, limiter: AdaptiveLimiter, article: dict, existing_urls: set[str]
+    ) -> str | None:
+        """The article's Markdown body, or None if it is already stored or could not be fetched."""
+        article_id = article.get("id")
+        if not article_id or article.get("url") in existing_urls:
+            return None
+        try:
+            detail_resp = await self._get(client, limiter, f"{self.base_url}/articles/{article_id}")
+            if detail_resp.status_code == 200:
+                return detail_resp.json().get("body_markdown")
+        except Exception as e:
+            logger.warning(f"Failed to fetch content for article {article_id}: {e}")
+        return None
+
+    async def _get(self, client: httpx.AsyncClient, limiter: AdaptiveLimiter, url: str) -> httpx.Response:
+        """GETs `url` within `limiter`, retrying throttled responses. Returns the last response if retries run out."""
+        attempt = 0
+        while True:
+            async with limiter:
+                response = await client.get(url)
+            if response.status_code not in THROTTLED_STATUS_CODES:
+                limiter.on_success()
+                return response
+
+            delay = retry_after_seconds(response)
+            if delay is None:
+                # Full jitter, as for enrichment retries
+                delay = random.uniform(0, self.retry_base_seconds * 2**attempt)
+            limiter.on_throttled(delay)
+            if attempt >= self.max_retries:
+                return response
+            attempt += 1
+            logger.warning(
+                f"Dev.to throttled {url} ({response.status_code}), retry {attempt}/{self.max_retries} in {delay:.1f}s"
+            )
@@ -1,32 +1,60 @@
 """
 Description: GitHub ingestion connector.
 Why: Fetches repository metadata from GitHub to populate the portfolio.
-How: Uses httpx to call GitHub API and maps results to Project model.
+How: Uses httpx to call GitHub API and maps results to Project model. Requests go through the shared client when one
+     is injected (see `app.services.http_client`). Repositories are fetched 100 per page, following the `Link`
+     header. With an HTTP cache, each page's ETag is kept and sent back as `If-None-Match`, so pages that haven't
+     changed come back as 304 Not Modified and are rebuilt from the cache.
 """
 
 from datetime import datetime
+from typing import Any
 
 import httpx
 
+from app.models.http_cache import HttpCacheEntry
 from app.models.project import Project
+from app.services import http_cache_service
+from app.services.http_client import borrow_client
+
+PER_PAGE = 100
+# Repository fields used by the mapping below; only these are cached
+REPO_FIELDS = (
+    "name",
+    "description",
+    "html_url",
+    "stargazers_count",
+    "topics",
+    "language",
+    "private",
+    "fork",
+    "created_at",
+    "updated_at",
+)
 
 
 class GitHubConnector:
-    def __init__(self, base_url: str = "https://api.github.com"):
+    def __init__(self, base_url: str = "https://api.github.com", client: httpx.AsyncClient | None = None, cache: Any = None):
         self.base_url = base_url
+        self.client = client
+        # An HttpCacheService (or a simulated one); None disables conditional requests
+        self.cache = cache
+        self.pages = 0
+        self.not_modified = 0
 
     async def fetch_repositories(self, username: str) -> list[Project]:
         """
         Fetches public repositories for a given GitHub username.
         """
-        url = f"{self.base_url}/users/{username}/repos"
-        params = {"type": "public"}
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, params=params)
-            if response.status_code == 404:
-                raise ValueError(f"GitHub user '{username}' not found.")
-            response.raise_for_status()
-            repos_data = response.json()
+        url: str | None = str(
+            httpx.URL(f"{self.base_url}/users/{username}/repos", params={"type": "public", "per_page": PER_PAGE})
+        )
+        repos_data = []
+        self.pages = self.not_modified = 0
+        async with borrow_client(self.client) as client:
+            while url:
+                repos, url = await self._fetch_page(client, url, username)
+                repos_data.extend(repos)
 
         projects = []
         for repo in repos_data:
@@ -57,3 +85,22 @@ class GitHubConnector:
             projects.append(project)
 
         return projects
+
+    async def _fetch_page(self, client: httpx.AsyncClient, url: str, username: str) -> tuple[list[dict], str | None]:
+        """Fetches one page of repositories. Returns its repositories and the URL of the next page, if any."""
+        cached = await http_cache_service.lookup(self.cache, url)
+        response = await client.get(url, headers=http_cache_service.conditional_headers(cached))
+        self.pages += 1
+        if response.status_code == 304 and cached is not None:
+            self.not_modified += 1
+            return cached.data or [], cached.next_url
+        if response.status_code == 404:
+            raise ValueError(f"GitHub user '{username}' not found.")
+        response.raise_for_status()
+
+        repos = [{field: repo.get(field) for field in REPO_FIELDS} for repo in response.json()]
+        next_url = response.links.get("next", {}).get("url")
+        if self.cache is not None:
+            entry = HttpCacheEntry(url=url, etag=response.headers.get("ETag"), next_url=next_url, data=repos)
+            await http_cache_service.store(self.cache, entry)
+        return repos, next_url
@@ -2,196 +2,190 @@
 Description: Medium archive ingestion connector.
 Why: Parses Medium export zip files to retrieve full blog history and content.
 How: Uses zipfile, BeautifulSoup for HTML parsing, and markdownify for markdown conversion.
+     Parsing and conversion are CPU-bound, so posts are read from the zip on the event loop and parsed in a pool of
+     `parse_workers` processes, while up to `concurrency` AI enrichment calls run in the background. A bounded window
+     of posts is in flight at once, and results are still yielded in archive order.
+     Replies and known URLs are rejected by a byte-level pre-filter before any parsing.
+     Posts recorded in an `ArchiveCheckpoint` by an earlier, interrupted run are skipped without being read.
 """
 
+import asyncio
 import logging
+import multiprocessing
+import os
 import zipfile
-from collections.abc import AsyncGenerator
-from datetime import datetime
-
-from bs4 import BeautifulSoup
-from markdownify import markdownify as md
+from collections.abc import AsyncGenerator, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
+from app.config import settings
 from app.models.blog import Blog
+from app.services.archive_checkpoint import ArchiveCheckpoint
+from app.services.connectors.medium_html import ParsedPost, init_parse_worker, parse_in_worker, prefilter_post
 from app.services.content_enrichment_service import ContentEnrichmentService
+from app.services.enrichment_scheduler import ordered_map
 
 logger = logging.getLogger(__name__)
 
 
 class MediumArchiveConnector:
-    def __init__(self, ai_service: ContentEnrichmentService):
+    def __init__(self, ai_service: ContentEnrichmentService, concurrency: int = 1, parse_workers: int | None = None):
         self.ai_service = ai_service
+        # Posts being enriched at once; results are still yielded in archive order
+        self.concurrency = max(1, concurrency)
+        # Processes parsing HTML; 0 means one per CPU core
+        workers = settings.archive_parse_workers if parse_workers is None else parse_workers
+        self.parse_workers = workers or os.cpu_count() or 1
 
     async def fetch_posts(
-        self, zip_path: str, existing_urls: set[str] | None = None, on_progress=None
+        self,
+        zip_path: str,
+        existing_urls: set[str] | None = None,
+        on_progress=None,
+        checkpoint: ArchiveCheckpoint | None = None,
     ) -> AsyncGenerator[tuple[str, Blog | None, str], None]:
         """
         Parses a Medium export zip file and yields processing status.
         Yields: (status, blog, filename)
-        status: "processed", "skipped_draft", "skipped_not_blog", "skipped_existing", "error"
+        status: "processed", "skipped_draft", "skipped_not_blog", "skipped_existing", "skipped_checkpoint", "error"
         """
-        existing_urls = existing_urls or set()
+        known_urls = frozenset(existing_urls or ())
+        # Worker processes are only started once the first post is submitted
+        pool = ProcessPoolExecutor(
+            max_workers=self.parse_workers,
+            # Forking a process that runs gRPC / HTTP client threads can deadlock the child
+            mp_context=multiprocessing.get_context("forkserver"),
+            initializer=init_parse_worker,
+            initargs=(known_urls,),
+        )
         try:
             with zipfile.ZipFile(zip_path, "r") as z:
                 # Medium exports posts in the 'posts/' directory as HTML files
                 post_files = [f for f in z.namelist() if f.startswith("posts/") and f.endswith(".html")]
-                total_files = len(post_files)
-
-                for i, post_file in enumerate(post_files, 1):
-                    # Check for draft in filename
-                    if "draft_" in post_file.lower():
-                        if on_progress:
-                            on_progress(i, total_files, post_file, "Skipping draft")
-                        yield "skipped_draft", None, post_file
-                        continue
-
-                    if on_progress:
-                        on_progress(i, total_files, post_file, "Reading file")
-
-                    try:
-                        with z.open(post_file) as f:
-                            html_content = f.read().decode("utf-8")
-                            status, blog = await self._parse_html(
-                                html_content, i, total_files, post_file, existing_urls, on_progress
-                            )
-                            yield status, blog, post_file
-
-                    except Exception as e:
-                        logger.error(f"Error processing file {post_file}: {e}")
+                entries = self._read_posts(z, post_files, known_urls, on_progress, checkpoint)
+                finish = partial(self._finish, pool, asyncio.Semaphore(self.concurrency))
+
+                # Enough posts in flight to keep every parse worker and enrichment slot busy. The window also bounds
+                # how many raw posts are held in memory.
+                window = self.concurrency + 2 * self.parse_workers
+                async for (_, post_file, _, _), outcome, error in ordered_map(entries, finish, window):
+                    if error:
+                        logger.error(f"Error processing file {post_file}: {error}")
                         yield "error", None, post_file
                         continue
+                    assert outcome is not None
+                    status, blog = outcome
+                    yield status, blog, post_file
 
         except Exception as e:
             logger.error(f"Error reading Medium archive {zip_path}: {e}")
             # Ensure we stop if the zip itself fails
             pass
-
-    async def _parse_html(
-        self, html_content: str, index: int, total: int, filename: str, existing_urls: set[str], on_progress=None
-    ) -> tuple[str, Blog | None]:
+        finally:
+            # Don't block the event loop on posts that will never be consumed
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _read_posts(
+        self,
+        z: zipfile.ZipFile,
+        post_files: list[str],
+        existing_urls: frozenset[str],
+        on_progress=None,
+        checkpoint: ArchiveCheckpoint | None = None,
+    ) -> Iterator[tuple[int, str, str, bytes | None]]:
         """
-        Parses a single Medium post HTML file.
-        Returns: (status, Blog)
+        Reads each post file, yielding (index, filename, status, raw HTML), with status "read" unless skipped.
+        Posts that the byte-level pre-filter rejects are never sent to the parse workers.
         """
-        soup = BeautifulSoup(html_content, "html.parser")
-
-        # Skip comments and replies
-        # 1. Medium often uses 'u-in-reply-to' class for replies
-        if soup.find(class_="u-in-reply-to") or soup.find(class_="p-in-reply-to"):
-            return "skipped_not_blog", None
-
-        # 2. Content - Medium wraps the main content in section.e-content
-        content_section = soup.find("section", class_="e-content")
-        if not content_section:
-            return "skipped_not_blog", None
-
-        # 3. Heuristic: Real blogs in Medium export have subheadings (h3).
-        # Comments and short replies typically do not.
-        if not content_section.find("h3"):
-            return "skipped_not_blog", None
-
-        # Metadata extraction based on Medium's export format
-        title_tag = soup.find("title")
-        title = title_tag.text.strip() if title_tag else "Untitled"
-
-        if on_progress:
-            on_progress(index, total, filename, "Parsing content")
-
-        # Link / URL
-        url_tag = soup.find("a", class_="u-url")
-        url = url_tag["href"] if url_tag and url_tag.has_attr("href") else ""
-
-        if not url:
-            # Fallback to canonical link often found in footer
-            canonical_tag = soup.find("a", class_="p-canonical")
-            if canonical_tag and canonical_tag.has_attr("href"):
-                url = canonical_tag["href"]
-
-        # Normalize URL: strip query parameters and trailing slashes
-        if url:
-            url = url.split("?")[0].rstrip("/")
-
-        # Check if URL already exists
-        if url and url in existing_urls:
-            return "skipped_existing", None
-
-        # Publication Date
-        date_tag = soup.find("time", class_="dt-published")
-        date_iso = ""
-        if date_tag and date_tag.has_attr("datetime"):
+        total_files = len(post_files)
+        for i, post_file in enumerate(post_files, 1):
+            if checkpoint and checkpoint.is_done(post_file):
+                if on_progress:
+                    on_progress(i, total_files, post_file, "Already done")
+                yield i, post_file, "skipped_checkpoint", None
+                continue
+
+            # Check for draft in filename
+            if "draft_" in post_file.lower():
+                if on_progress:
+                    on_progress(i, total_files, post_file, "Skipping draft")
+                yield i, post_file, "skipped_draft", None
+                continue
+
+            if on_progress:
+                on_progress(i, total_files, post_file, "Reading file")
+
             try:
-                # Medium uses ISO format in datetime attribute
-                dt = datetime.fromisoformat(date_tag["datetime"].replace("Z", "+00:00"))
-                date_iso = dt.date().isoformat()
-            except Exception:
-                pass
-
-        # Subtitle
-        subtitle_tag = soup.find("p", class_="p-summary")
-        subtitle = subtitle_tag.text if subtitle_tag else ""
-
-        # Tags
-        tags = []
-        tags_list = soup.find("ul", class_="p-tags")
-        if not tags_list:
-            tags_list = soup.find("ul", class_="tags")  # Fallback class
-
-        if tags_list:
-            tags = [li.text for li in tags_list.find_all("li")]
-
-        # Paywall detection (Heuristic)
-        is_private = "Member-only story" in content_section.get_text()
-
-        # Convert content to Markdown
-        # Markdownify rules: h1 -> #, h2 -> ##, h3 -> ###
-        markdown_body = md(
-            str(content_section),
-            heading_style="ATX",
-            bullets="-",
-        )
+                with z.open(post_file) as f:
+                    raw_html = f.read()
+            except Exception as e:
+                logger.error(f"Error processing file {post_file}: {e}")
+                yield i, post_file, "error", None
+                continue
+
+            status = prefilter_post(raw_html, existing_urls)
+            if status:
+                yield i, post_file, status, None
+                continue
+            yield i, post_file, "read", raw_html
+
+    async def _finish(
+        self, pool: ProcessPoolExecutor, enrich_slots: asyncio.Semaphore, entry: tuple[int, str, str, bytes | None]
+    ) -> tuple[str, Blog | None]:
+        """Parses a post in the process pool, enriches it (if an AI service is configured) and builds its Blog."""
+        _, _, status, raw_html = entry
+        if status != "read":
+            return status, None
+
+        status, post = await asyncio.get_running_loop().run_in_executor(pool, parse_in_worker, raw_html)
+        if status != "parsed":
+            return status, None
 
         # AI Enrichment (Summary and Tags)
-        ai_summary = None
+        enrichment = None
         if self.ai_service:
-            if on_progress:
-                on_progress(index, total, filename, "Processing content")
+            async with enrich_slots:
+                enrichment = await self.ai_service.enrich_content(post.text)
+        return "processed", self._build_blog(post, enrichment)
 
-            enrichment_data = await self.ai_service.enrich_content(content_section.get_text())
-            ai_summary = enrichment_data.get("summary")
+    def _build_blog(self, post: ParsedPost, enrichment: dict | None) -> Blog:
+        tags = post.tags
+        ai_summary = None
+        if enrichment:
+            ai_summary = enrichment.get("summary")
 
             # Use AI tags if no tags found in HTML
-            if not tags and enrichment_data.get("tags"):
-                tags = enrichment_data.get("tags")
+            if not tags and enrichment.get("tags"):
+                tags = enrichment.get("tags")
 
         # Fallback to AI summary if subtitle is missing
-        final_summary = subtitle or ai_summary or None
+        final_summary = post.subtitle or ai_summary or None
 
         # Frontmatter
         frontmatter = "---\n"
-        frontmatter += f"title: {title}\n"
-        if date_iso:
-            frontmatter += f"date: {date_iso}\n"
-        if url:
-            frontmatter += f"url: {url}\n"
+        frontmatter += f"title: {post.title}\n"
+        if post.date_iso:
+            frontmatter += f"date: {post.date_iso}\n"
+        if post.url:
+            frontmatter += f"url: {post.url}\n"
         if final_summary:
             frontmatter += f"subtitle: {final_summary}\n"
         if tags:
             frontmatter += f"tags: {', '.join(tags)}\n"
         frontmatter += "---\n\n"
 
-        markdown_content = frontmatter + f"# {title}\n\n" + markdown_body
+        markdown_content = frontmatter + f"# {post.title}\n\n" + post.markdown_body
 
-        blog = Blog(
-            title=title,
+        return Blog(
+            title=post.title,
             summary=final_summary,
-            date=date_iso,
+            date=post.date_iso,
             platform="Medium",
-            url=url,
+            url=post.url,
             source_platform="medium_archive",
             tags=tags,
             is_manual=False,
-            is_private=is_private,
+            is_private=post.is_private,
             markdown_content=markdown_content,
             ai_summary=ai_summary,
         )
-        return "processed", blog
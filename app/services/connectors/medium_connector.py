@@ -1,82 +1,180 @@
 """
 Description: Medium ingestion connector.
 Why: Fetches blog post metadata from Medium RSS feed to populate the portfolio.
-How: Uses httpx to fetch RSS and xml.etree.ElementTree to parse XML.
+How: Streams the feed with httpx (through the shared client when one is injected) into an incremental
+     `xml.etree.ElementTree.XMLPullParser`. Each `<item>` is turned into a Blog as soon as its closing tag arrives and
+     is then dropped from the tree, so neither the decoded feed nor the whole tree is held in memory.
+     With an HTTP cache, the feed's ETag / Last-Modified, a hash of the whole feed and a hash of each item's content
+     are kept between runs. Only a 304 Not Modified is answered from the cache without parsing. A 200 response is
+     always parsed as it streams, even if it is byte-identical to the cached feed, as the feed hash is only known
+     once the whole body has been read. Its unchanged items still skip the Markdown conversion.
 """
 
+import hashlib
 import re
 import xml.etree.ElementTree as ET
+from collections.abc import AsyncIterator
 from email.utils import parsedate_to_datetime
+from typing import Any
 
 import httpx
 from markdownify import markdownify as md
 
 from app.models.blog import Blog
+from app.models.http_cache import HttpCacheEntry
+from app.services import http_cache_service
+from app.services.http_client import borrow_client
+
+CONTENT_ENCODED_TAG = "{http://purl.org/rss/1.0/modules/content/}encoded"
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
 
 
 class MediumConnector:
-    def __init__(self, feed_url_template: str = "https://medium.com/feed/@{username}"):
+    def __init__(
+        self,
+        feed_url_template: str = "https://medium.com/feed/@{username}",
+        client: httpx.AsyncClient | None = None,
+        cache: Any = None,
+    ):
         self.feed_url_template = feed_url_template
+        self.client = client
+        # An HttpCacheService (or a simulated one); None disables conditional requests and item reuse
+        self.cache = cache
+        self.not_modified = False
+        self.reused = 0
 
-    async def fetch_posts(self, username: str) -> list[Blog]:
+    async def fetch_posts(self, username: str, existing_urls: set[str] | None = None) -> list[Blog]:
         """
         Fetches blog posts from a given Medium username's RSS feed.
+        `existing_urls` are the (normalised) URLs of posts already stored with their Markdown content. Only these may
+        be returned from the cache, with `markdown_content` left as None for the caller to keep the stored content.
         """
+        return [blog async for blog in self.stream_posts(username, existing_urls)]
+
+    async def stream_posts(self, username: str, existing_urls: set[str] | None = None) -> AsyncIterator[Blog]:
+        """Like `fetch_posts`, but yields each post as soon as it has been parsed from the feed."""
         # Clean username: remove leading @ if present to avoid double @ in template
         clean_username = username.lstrip("@")
         url = self.feed_url_template.format(username=clean_username)
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            if response.status_code == 404:
-                raise ValueError(f"Medium user '{username}' not found or no public feed available.")
-            response.raise_for_status()
-            rss_content = response.text
-
-        root = ET.fromstring(rss_content)
-        items = root.findall(".//item")
-
-        blogs = []
-        for item in items:
-            title = item.find("title").text if item.find("title") is not None else "Untitled"
-            link = item.find("link").text if item.find("link") is not None else ""
-
-            # Normalize URL: strip query parameters and ensure trailing slash consistency
-            if link:
-                link = link.split("?")[0].rstrip("/")
-
-            pub_date_raw = item.find("pubDate").text if item.find("pubDate") is not None else ""
-
-            # Convert RFC 2822 to ISO 8601
-            try:
-                date_dt = parsedate_to_datetime(pub_date_raw)
-                date_iso = date_dt.date().isoformat()
-            except Exception:
-                date_iso = ""
-
-            # Content and Summary
-            content_encoded = item.find("{http://purl.org/rss/1.0/modules/content/}encoded")
-            summary = None
-            markdown_content = None
-
-            if content_encoded is not None and content_encoded.text:
+        existing_urls = existing_urls or set()
+        self.not_modified = False
+        self.reused = 0
+
+        cached = await http_cache_service.lookup(self.cache, url)
+        cached_data = (cached.data or {}) if cached else {}
+        cached_items = {item["url"]: item for item in cached_data.get("items", [])}
+        # The cache can only stand in for the feed if every post it describes is still stored
+        reusable = cached is not None and cached_items.keys() <= existing_urls
+
+        cache_items: list[dict] = []
+        digest = hashlib.sha256()
+        async with borrow_client(self.client) as client:
+            headers = http_cache_service.conditional_headers(cached) if reusable else {}
+            async with client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 304 and reusable:
+                    self.not_modified = True
+                    for item in cached_items.values():
+                        yield self._cached_blog(item)
+                    return
+                if response.status_code == 404:
+                    raise ValueError(f"Medium user '{username}' not found or no public feed available.")
+                response.raise_for_status()
+
+                parser = ET.XMLPullParser(events=("start", "end"))
+                channel = None
+                async for chunk in response.aiter_bytes():
+                    digest.update(chunk)
+                    parser.feed(chunk)
+                    for event, elem in parser.read_events():
+                        if event == "start" and elem.tag == "channel":
+                            channel = elem
+                        elif event == "end" and elem.tag == "item":
+                            yield self._parse_item(elem, cached_items, existing_urls, cache_items)
+                            # Drop the handled item, so the tree never holds more than the item being parsed
+                            if channel is not None:
+                                channel.remove(elem)
+                            elem.clear()
+                parser.close()
+
+        feed_hash = digest.hexdigest()
+        # A byte-identical feed from a server that ignores conditional requests. It has already been parsed, so this
+        # only reports that nothing changed.
+        self.not_modified = reusable and cached_data.get("feed_hash") == feed_hash
+
+        if self.cache is not None:
+            entry = HttpCacheEntry(
+                url=url,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                data={"feed_hash": feed_hash, "items": cache_items},
+            )
+            await http_cache_service.store(self.cache, entry)
+
+    def _parse_item(
+        self, item: ET.Element, cached_items: dict[str, dict], existing_urls: set[str], cache_items: list[dict]
+    ) -> Blog:
+        """Maps one RSS `<item>` to a Blog, recording its metadata and content hash in `cache_items`."""
+        title = item.findtext("title") or "Untitled"
+        link = item.findtext("link") or ""
+
+        # Normalize URL: strip query parameters and ensure trailing slash consistency
+        if link:
+            link = link.split("?")[0].rstrip("/")
+
+        pub_date_raw = item.findtext("pubDate") or ""
+
+        # Convert RFC 2822 to ISO 8601
+        try:
+            date_dt = parsedate_to_datetime(pub_date_raw)
+            date_iso = date_dt.date().isoformat()
+        except Exception:
+            date_iso = ""
+
+        # Content and Summary
+        content_html = item.findtext(CONTENT_ENCODED_TAG)
+        summary = None
+        markdown_content = None
+        content_hash = None
+
+        if content_html:
+            content_hash = _sha256(content_html)
+            cached_item = cached_items.get(link)
+            if cached_item and cached_item.get("content_hash") == content_hash and link in existing_urls:
+                # Unchanged since the last run, and already stored: skip the Markdown conversion
+                summary = cached_item.get("summary")
+                self.reused += 1
+            else:
                 # Convert full HTML content to Markdown
-                markdown_content = md(content_encoded.text, heading_style="ATX", bullets="-")
+                markdown_content = md(content_html, heading_style="ATX", bullets="-")
 
                 # Simple HTML strip for basic summary fallback
-                clean_text = re.sub(r"<[^>]+>", "", content_encoded.text)
+                clean_text = re.sub(r"<[^>]+>", "", content_html)
                 clean_text = " ".join(clean_text.split())
                 summary = clean_text[:200] + "..." if len(clean_text) > 200 else clean_text
 
-            blog = Blog(
-                title=title,
-                summary=summary,
-                date=date_iso,
-                platform="Medium",
-                url=link,
-                source_platform="medium_rss",
-                is_manual=False,
-                markdown_content=markdown_content,
-            )
-            blogs.append(blog)
-
-        return blogs
+        cache_items.append({"url": link, "title": title, "date": date_iso, "summary": summary, "content_hash": content_hash})
+        return Blog(
+            title=title,
+            summary=summary,
+            date=date_iso,
+            platform="Medium",
+            url=link,
+            source_platform="medium_rss",
+            is_manual=False,
+            markdown_content=markdown_content,
+        )
+
+    def _cached_blog(self, item: dict) -> Blog:
+        self.reused += 1
+        return Blog(
+            title=item["title"],
+            summary=item.get("summary"),
+            date=item.get("date") or "",
+            platform="Medium",
+            url=item["url"],
+            source_platform="medium_rss",
+            is_manual=False,
+        )
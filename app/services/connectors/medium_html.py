@@ -0,0 +1,172 @@
+"""
+Description: HTML parsing for posts in a Medium export archive.
+Why: Parsing with BeautifulSoup and converting to Markdown is CPU-bound, so `MediumArchiveConnector` runs it in
+     worker processes. Keeping it in its own module means each worker only imports BeautifulSoup and markdownify.
+How: `prefilter_post` rejects replies, other non-blog posts and already-known URLs by scanning the raw bytes, so
+     most of an archive never needs a DOM. It only rejects posts that `parse_post_html` would also reject.
+     `parse_post_html` extracts a post's metadata and Markdown body. A pool's workers are set up with
+     `init_parse_worker`, and `parse_in_worker` parses raw HTML bytes against the URLs to skip.
+"""
+
+import html
+import re
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+from markdownify import markdownify as md
+
+# Replies carry one of these classes on an element. Text can't contain a raw "<", so this only matches inside a tag.
+_REPLY_CLASS_RE = re.compile(rb"""<[^<>]*\bclass\s*=\s*["'][^"'<>]*(?<![\w-])[up]-in-reply-to(?![\w-])""")
+_H3_RE = re.compile(rb"<h3\b", re.IGNORECASE)
+_A_TAG_RE = re.compile(rb"<a\s[^>]*>", re.IGNORECASE)
+_CLASS_ATTR_RE = re.compile(rb"""\bclass\s*=\s*["']([^"']*)["']""", re.IGNORECASE)
+_HREF_ATTR_RE = re.compile(rb"""\bhref\s*=\s*["']([^"']*)["']""", re.IGNORECASE)
+
+
+def normalize_post_url(url: str) -> str:
+    """Strips query parameters and trailing slashes."""
+    return url.split("?")[0].rstrip("/")
+
+
+def _link_href(raw_html: bytes, css_class: bytes) -> str | None:
+    """Returns the href of the first <a> with `css_class`, or None if that link is missing or has no href."""
+    for tag in _A_TAG_RE.finditer(raw_html):
+        classes = _CLASS_ATTR_RE.search(tag.group())
+        if classes and css_class in classes.group(1).split():
+            href = _HREF_ATTR_RE.search(tag.group())
+            return html.unescape(href.group(1).decode("utf-8", "replace")) if href else None
+    return None
+
+
+def prefilter_post(raw_html: bytes, existing_urls: frozenset[str] | set[str]) -> str | None:
+    """
+    Classifies a post from its raw bytes, without building a DOM.
+    Returns "skipped_not_blog" or "skipped_existing" when the post can be rejected, or None if it needs a full parse.
+    """
+    if b"e-content" not in raw_html or not _H3_RE.search(raw_html) or _REPLY_CLASS_RE.search(raw_html):
+        return "skipped_not_blog"
+    if existing_urls:
+        url = _link_href(raw_html, b"u-url") or _link_href(raw_html, b"p-canonical")
+        if url and normalize_post_url(url) in existing_urls:
+            return "skipped_existing"
+    return None
+
+
+class ParsedPost:
+    """Fields extracted from a post's HTML, before AI enrichment."""
+
+    __slots__ = ("date_iso", "is_private", "markdown_body", "subtitle", "tags", "text", "title", "url")
+
+    def __init__(self, title, url, date_iso, subtitle, tags, is_private, markdown_body, text):
+        self.title = title
+        self.url = url
+        self.date_iso = date_iso
+        self.subtitle = subtitle
+        self.tags = tags
+        self.is_private = is_private
+        self.markdown_body = markdown_body
+        self.text = text
+
+
+def parse_post_html(html_content: str, existing_urls: frozenset[str] | set[str]) -> tuple[str, ParsedPost | None]:
+    """
+    Parses a single Medium post HTML file. Runs in a parse worker process, so it must not touch shared state.
+    Returns: (status, parsed post), with status "parsed" when the post should be enriched and saved
+    """
+    soup = BeautifulSoup(html_content, "html.parser")
+
+    # Skip comments and replies
+    # 1. Medium often uses 'u-in-reply-to' class for replies
+    if soup.find(class_="u-in-reply-to") or soup.find(class_="p-in-reply-to"):
+        return "skipped_not_blog", None
+
+    # 2. Content - Medium wraps the main content in section.e-content
+    content_section = soup.find("section", class_="e-content")
+    if not content_section:
+        return "skipped_not_blog", None
+
+    # 3. Heuristic: Real blogs in Medium export have subheadings (h3).
+    # Comments and short replies typically do not.
+    if not content_section.find("h3"):
+        return "skipped_not_blog", None
+
+    # Metadata extraction based on Medium's export format
+    title_tag = soup.find("title")
+    title = title_tag.text.strip() if title_tag else "Untitled"
+
+    # Link / URL
+    url_tag = soup.find("a", class_="u-url")
+    url = url_tag["href"] if url_tag and url_tag.has_attr("href") else ""
+
+    if not url:
+        # Fallback to canonical link often found in footer
+        canonical_tag = soup.find("a", class_="p-canonical")
+        if canonical_tag and canonical_tag.has_attr("href"):
+            url = canonical_tag["href"]
+
+    # Normalize URL: strip query parameters and trailing slashes
+    if url:
+        url = normalize_post_url(url)
+
+    # Check if URL already exists
+    if url and url in existing_urls:
+        return "skipped_existing", None
+
+    # Publication Date
+    date_tag = soup.find("time", class_="dt-published")
+    date_iso = ""
+    if date_tag and date_tag.has_attr("datetime"):
+        try:
+            # Medium uses ISO format in datetime attribute
+            dt = datetime.fromisoformat(date_tag["datetime"].replace("Z", "+00:00"))
+            date_iso = dt.date().isoformat()
+        except Exception:
+            pass
+
+    # Subtitle
+    subtitle_tag = soup.find("p", class_="p-summary")
+    subtitle = subtitle_tag.text if subtitle_tag else ""
+
+    # Tags
+    tags = []
+    tags_list = soup.find("ul", class_="p-tags")
+    if not tags_list:
+        tags_list = soup.find("ul", class_="tags")  # Fallback class
+
+    if tags_list:
+        tags = [li.text for li in tags_list.find_all("li")]
+
+    # Paywall detection (Heuristic)
+    is_private = "Member-only story" in content_section.get_text()
+
+    # Convert content to Markdown
+    # Markdownify rules: h1 -> #, h2 -> ##, h3 -> ###
+    markdown_body = md(
+        str(content_section),
+        heading_style="ATX",
+        bullets="-",
+    )
+
+    return "parsed", ParsedPost(
+        title=title,
+        url=url,
+        date_iso=date_iso,
+        subtitle=subtitle,
+        tags=tags,
+        is_private=is_private,
+        markdown_body=markdown_body,
+        text=content_section.get_text(),
+    )
+
+
+# URLs to skip, set in each parse worker process by `init_parse_worker`
+_worker_existing_urls: frozenset[str] = frozenset()
+
+
+def init_parse_worker(existing_urls: frozenset[str]) -> None:
+    global _worker_existing_urls
+    _worker_existing_urls = existing_urls
+
+
+def parse_in_worker(raw_html: bytes) -> tuple[str, ParsedPost | None]:
+    return parse_post_html(raw_html.decode("utf-8"), _worker_existing_urls)
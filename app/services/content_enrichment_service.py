@@ -11,6 +11,14 @@ from google.genai import Client, types
 
 from app.config import settings
 
+# Bump whenever the prompt below changes, so cached enrichments made with the old prompt are regenerated
+PROMPT_VERSION = "1"
+
+
+def enrichment_input(text: str) -> str:
+    """Returns the part of `text` that is sent to the model."""
+    return text[: settings.max_enrichment_input_chars]
+
 
 class ContentEnrichmentService:
     def __init__(self):
@@ -30,7 +38,7 @@ class ContentEnrichmentService:
         Returns: {"summary": str, "tags": list[str]}
         """
         # Limit input text to avoid overwhelming the model or hitting response limits
-        truncated_text = text[: settings.max_enrichment_input_chars]
+        truncated_text = enrichment_input(text)
 
         prompt = f"""You are a professional technical writer. Analyze the following blog post content.
             1. Generate a comprehensive summary (max 225 words) focusing on key technical takeaways.
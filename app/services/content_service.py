@@ -5,7 +5,7 @@ How: Inherits from FirestoreService and specifies the Content model.
 """
 
 from app.models.content import Content
-from app.services.firestore_base import FirestoreService
+from app.services.firestore_base import CollectionCache, FirestoreService
 
 
 class ContentService(FirestoreService[Content]):
@@ -13,5 +13,5 @@ class ContentService(FirestoreService[Content]):
     Service class for interacting with the 'content' collection in Firestore.
     """
 
-    def __init__(self, db_client):
-        super().__init__(db_client, "content", Content)
+    def __init__(self, db_client, cache: CollectionCache | None = None):
+        super().__init__(db_client, "content", Content, cache=cache)
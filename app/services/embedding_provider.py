@@ -0,0 +1,85 @@
+"""
+Description: Pluggable text embedding providers.
+Why: Semantic search needs vectors for documents (at ingest) and queries (at search time) from the same model.
+How: `GeminiEmbeddingProvider` calls the Gemini embeddings API via google-genai.
+     `HashingEmbeddingProvider` is a deterministic, offline stand-in (feature hashing of word tokens) for tests,
+     simulation runs and local development. `get_embedding_provider` picks one from settings.
+"""
+
+import hashlib
+import math
+from abc import ABC, abstractmethod
+
+from google.genai import Client, types
+
+from app.config import settings
+from app.services.search_index import tokenize
+
+
+class EmbeddingProvider(ABC):
+    """Base class for embedding providers. `name` identifies the model, so vectors from different models never mix."""
+
+    name: str = "base"
+    dimensions: int = 0
+    # Maximum number of texts sent in a single embedding request
+    batch_size: int = 100
+
+    @abstractmethod
+    async def embed(self, texts: list[str], task: str = "document") -> list[list[float]]:
+        """Returns one vector per text. `task` is "document" for indexed content or "query" for search queries."""
+
+
+class GeminiEmbeddingProvider(EmbeddingProvider):
+    def __init__(self, model: str | None = None, dimensions: int | None = None):
+        if settings.google_genai_use_vertexai:
+            self.client = Client(
+                vertexai=True, project=settings.google_cloud_project, location=settings.google_cloud_location
+            )
+        else:
+            self.client = Client(api_key=settings.gemini_api_key)
+        self.model = model or settings.embedding_model
+        self.dimensions = dimensions or settings.embedding_dimensions
+        self.name = f"gemini:{self.model}:{self.dimensions}"
+
+    async def embed(self, texts: list[str], task: str = "document") -> list[list[float]]:
+        response = await self.client.aio.models.embed_content(
+            model=self.model,
+            contents=texts,
+            config=types.EmbedContentConfig(
+                task_type="RETRIEVAL_QUERY" if task == "query" else "RETRIEVAL_DOCUMENT",
+                output_dimensionality=self.dimensions,
+            ),
+        )
+        return [list(e.values or []) for e in response.embeddings or []]
+
+
+class HashingEmbeddingProvider(EmbeddingProvider):
+    """
+    Deterministic bag-of-words embeddings: each token is hashed to a signed dimension and the result is L2 normalised.
+    Texts sharing words get similar vectors, which is enough to exercise the semantic search pipeline offline.
+    """
+
+    def __init__(self, dimensions: int = 256):
+        self.dimensions = dimensions
+        self.name = f"hashing:{dimensions}"
+
+    def _embed_one(self, text: str) -> list[float]:
+        vector = [0.0] * self.dimensions
+        for token in tokenize(text):
+            h = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+            vector[h % self.dimensions] += 1.0 if h >> 63 else -1.0
+        norm = math.sqrt(sum(v * v for v in vector))
+        return [v / norm for v in vector] if norm else vector
+
+    async def embed(self, texts: list[str], task: str = "document") -> list[list[float]]:
+        return [self._embed_one(text) for text in texts]
+
+
+def get_embedding_provider(name: str | None = None) -> EmbeddingProvider:
+    """Returns the configured embedding provider."""
+    name = name or settings.embedding_provider
+    if name == "gemini":
+        return GeminiEmbeddingProvider()
+    if name == "hashing":
+        return HashingEmbeddingProvider()
+    raise ValueError(f"Unknown embedding provider: {name}")
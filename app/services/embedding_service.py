@@ -0,0 +1,44 @@
+"""
+Description: Service for managing semantic search embeddings in Firestore.
+Why: Provides specific methods for interacting with the 'embeddings' collection.
+How: Inherits from the generic FirestoreService. `document_text` defines what is embedded for each kind of item.
+"""
+
+import hashlib
+
+from google.cloud import firestore
+from pydantic import BaseModel
+
+from app.models.embedding import Embedding
+from app.services.firestore_base import CollectionCache, FirestoreService
+
+
+def embedding_id(kind: str, item_id: str) -> str:
+    return f"{kind}:{item_id}"
+
+
+def document_text(item: BaseModel) -> str:
+    """Returns the text embedded for a blog or project: title, summaries / description and tags."""
+    parts = [getattr(item, "title", "")]
+    for field in ("summary", "ai_summary", "description"):
+        value = getattr(item, field, None)
+        if value:
+            parts.append(value)
+    tags = getattr(item, "tags", None)
+    if tags:
+        parts.append("Tags: " + ", ".join(tags))
+    return "\n".join(parts)
+
+
+def content_hash(model: str, text: str) -> str:
+    """Hashes the embedded text together with the model, so switching models re-embeds everything."""
+    return hashlib.sha256(f"{model}\n{text}".encode()).hexdigest()
+
+
+class EmbeddingService(FirestoreService[Embedding]):
+    """
+    Service for managing embedding records in Firestore.
+    """
+
+    def __init__(self, db: firestore.AsyncClient, cache: CollectionCache | None = None):
+        super().__init__(db, "embeddings", Embedding, cache=cache)
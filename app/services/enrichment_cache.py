@@ -0,0 +1,143 @@
+"""
+Description: Persistent cache of AI enrichments (summary and tags), keyed by content.
+Why: Re-ingesting a post that lacks an `ai_summary`, or ingesting an article cross-posted to several platforms,
+     would otherwise pay for another Gemini call to produce the same enrichment.
+How: `enrichment_key` hashes the model name, prompt version and the words of the (truncated) model input, so
+     formatting differences such as Markdown vs plain text don't cause misses. Enrichments are stored in the
+     'enrichments' Firestore collection by `EnrichmentCacheService`, which evicts the least recently used entries.
+     A hit refreshes the entry's `last_used_at` at most once a day, with a write that doesn't read the entry back.
+     `CachedEnrichmentService` wraps an enrichment service with the same `enrich_content` interface: it answers from
+     the cache, shares in-flight calls for identical content, and only calls the model on a miss.
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+from datetime import datetime, timedelta
+from typing import Any
+
+from google.cloud import firestore
+
+from app.config import settings
+from app.models.enrichment import Enrichment
+from app.services.content_enrichment_service import PROMPT_VERSION, enrichment_input
+from app.services.firestore_base import MAX_BATCH_WRITES, FirestoreService
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"\w+")
+# Eviction only needs a rough order, so a hit refreshes `last_used_at` at most this often
+LAST_USED_RESOLUTION = timedelta(days=1)
+
+
+def enrichment_key(model: str, text: str, prompt_version: str = PROMPT_VERSION) -> str:
+    words = " ".join(_WORD_RE.findall(enrichment_input(text).lower()))
+    return hashlib.sha256(f"{model}\n{prompt_version}\n{words}".encode()).hexdigest()
+
+
+class EnrichmentCacheService(FirestoreService[Enrichment]):
+    """
+    Service for managing cached enrichments in Firestore.
+    """
+
+    order_by = "last_used_at"
+
+    def __init__(self, db: firestore.AsyncClient):
+        super().__init__(db, "enrichments", Enrichment)
+
+    async def prune(self, max_entries: int) -> int:
+        """
+        Deletes all but the `max_entries` most recently used enrichments. Returns the number deleted.
+        The entries are counted with an aggregation query, so only the surplus is read, least recently used first,
+        and it is deleted in batches.
+        """
+        ((count,),) = await self.collection.count().get()
+        surplus = int(count.value) - max_entries
+        if surplus <= 0:
+            return 0
+
+        query = self.collection.order_by(self.order_by, direction=firestore.Query.ASCENDING).limit(surplus).select([])
+        deleted = 0
+        batch = self.db.batch()
+        pending = 0
+        async for doc in query.stream():
+            batch.delete(doc.reference)
+            pending += 1
+            if pending == MAX_BATCH_WRITES:
+                await batch.commit()
+                deleted += pending
+                batch, pending = self.db.batch(), 0
+        if pending:
+            await batch.commit()
+            deleted += pending
+        if deleted:
+            self._invalidate_cache()
+        return deleted
+
+
+class CachedEnrichmentService:
+    """Answers `enrich_content` from the enrichment cache, calling `service` only for content not seen before."""
+
+    def __init__(self, service: Any, store: Any, model: str | None = None):
+        self.service = service
+        # An EnrichmentCacheService, or a SimulatedFirestoreService wrapping one for dry runs
+        self.store = store
+        self.model = model or settings.model
+        self.hits = 0
+        self.misses = 0
+        # Calls made during this run, so identical content enriched concurrently shares one model call
+        self._calls: dict[str, asyncio.Future[dict]] = {}
+
+    @property
+    def concurrency(self) -> int:
+        return getattr(self.service, "concurrency", 1)
+
+    async def enrich_content(self, text: str) -> dict:
+        key = enrichment_key(self.model, text)
+        call = self._calls.get(key)
+        if call is None:
+            call = self._calls[key] = asyncio.ensure_future(self._enrich(key, text))
+        try:
+            # Shielded, so one waiter being cancelled doesn't cancel the call for the others
+            result = await asyncio.shield(call)
+        except Exception:
+            # Let a later attempt retry
+            if self._calls.get(key) is call:
+                del self._calls[key]
+            raise
+        # Callers may share a result, so each gets its own tag list
+        return {**result, "tags": list(result.get("tags") or [])}
+
+    async def _enrich(self, key: str, text: str) -> dict:
+        cached = await self._lookup(key)
+        if cached is not None:
+            self.hits += 1
+            return {"summary": cached.summary, "tags": list(cached.tags)}
+
+        self.misses += 1
+        result = await self.service.enrich_content(text)
+        # Only cache complete results; a fallback without tags (e.g. unparsable JSON) is retried next time
+        if result.get("summary") and result.get("tags"):
+            await self._save(key, result)
+        return result
+
+    async def _lookup(self, key: str) -> Enrichment | None:
+        try:
+            cached = await self.store.get(key)
+            now = datetime.now()
+            if cached is not None and now - cached.last_used_at >= LAST_USED_RESOLUTION:
+                await self.store.update_fields(key, {"last_used_at": now})
+            return cached
+        except Exception as e:
+            logger.warning(f"Enrichment cache lookup failed, calling the model instead: {e}")
+            return None
+
+    async def _save(self, key: str, result: dict) -> None:
+        enrichment = Enrichment(
+            model=self.model, prompt_version=PROMPT_VERSION, summary=result["summary"], tags=result.get("tags") or []
+        )
+        try:
+            await self.store.create(enrichment, item_id=key)
+        except Exception as e:
+            logger.warning(f"Could not save enrichment to cache: {e}")
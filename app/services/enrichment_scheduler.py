@@ -0,0 +1,127 @@
+"""
+Description: Bounded-concurrency scheduler for AI enrichment calls.
+Why: Enriching posts one at a time makes a full Medium archive re-ingest take hours, as each Gemini call is
+     mostly waiting on the network. Running calls concurrently must still respect the Gemini quota.
+How: `EnrichmentScheduler` wraps an enrichment service (real or simulated) with the same `enrich_content` interface.
+     A semaphore caps calls in flight, a token bucket caps calls per minute, and 429 / 5xx errors are retried with
+     exponential backoff and jitter. `ordered_map` runs a coroutine over items with a bounded window of tasks and
+     yields results in input order, so callers can persist and report progress as if processing sequentially.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import Any
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Allows `rate` acquisitions per second on average, with bursts of up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def is_retryable(error: Exception) -> bool:
+    """True for rate limiting (429), server errors (5xx) and network timeouts."""
+    if isinstance(error, TimeoutError | ConnectionError):
+        return True
+    code = getattr(error, "code", None)
+    return isinstance(code, int) and (code == 429 or 500 <= code < 600)
+
+
+class EnrichmentScheduler:
+    """Runs `service.enrich_content` calls concurrently, within rate limits, retrying transient failures."""
+
+    def __init__(
+        self,
+        service: Any,
+        concurrency: int | None = None,
+        requests_per_minute: int | None = None,
+        max_retries: int | None = None,
+        retry_base_seconds: float | None = None,
+    ):
+        self.service = service
+        self.concurrency = max(1, concurrency or settings.enrichment_concurrency)
+        self.max_retries = settings.enrichment_max_retries if max_retries is None else max_retries
+        self.retry_base_seconds = (
+            settings.enrichment_retry_base_seconds if retry_base_seconds is None else retry_base_seconds
+        )
+        self.retries = 0
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        rpm = settings.enrichment_requests_per_minute if requests_per_minute is None else requests_per_minute
+        # 0 means no rate limit; otherwise allow a burst of one call per worker
+        self._bucket = TokenBucket(rpm / 60, capacity=self.concurrency) if rpm else None
+
+    async def enrich_content(self, text: str) -> dict:
+        attempt = 0
+        while True:
+            if self._bucket:
+                await self._bucket.acquire()
+            try:
+                async with self._semaphore:
+                    return await self.service.enrich_content(text)
+            except Exception as e:
+                if attempt >= self.max_retries or not is_retryable(e):
+                    raise
+                # Full jitter, so concurrent workers that were throttled together don't retry together
+                delay = random.uniform(0, self.retry_base_seconds * 2**attempt)
+                attempt += 1
+                self.retries += 1
+                logger.warning(f"Enrichment failed ({e}), retry {attempt}/{self.max_retries} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+
+async def ordered_map[T, R](
+    items: Iterable[T], func: Callable[[T], Awaitable[R]], window: int
+) -> AsyncIterator[tuple[T, R | None, Exception | None]]:
+    """
+    Runs `func` over `items` with up to `window` calls in flight, yielding (item, result, error) in input order.
+    Items are pulled from `items` lazily, so a generator that parses input is interleaved with the calls.
+    If the consumer stops early, calls still in flight are cancelled.
+    """
+    pending: deque[tuple[T, asyncio.Future[R]]] = deque()
+    iterator = iter(items)
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < max(1, window):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.append((item, asyncio.ensure_future(func(item))))
+            if not pending:
+                return
+            item, future = pending.popleft()
+            try:
+                result = await future
+            except Exception as e:
+                yield item, None, e
+            else:
+                yield item, result, None
+    finally:
+        for _, future in pending:
+            future.cancel()
@@ -2,6 +2,7 @@
 Description: Firestore client singleton manager.
 Why: Prevents resource leaks by ensuring a single Firestore client instance is shared across the application and tools.
 How: Provides `get_client()` to access the singleton and `close_client()` for cleanup.
+     `get_sync_client()` provides a sync client, which is required for realtime (`on_snapshot`) listeners.
 """
 
 from google.cloud import firestore
@@ -9,6 +10,7 @@ from google.cloud import firestore
 from app.config import settings
 
 _db: firestore.AsyncClient | None = None
+_sync_db: firestore.Client | None = None
 
 
 def get_client() -> firestore.AsyncClient:
@@ -21,11 +23,24 @@ def get_client() -> firestore.AsyncClient:
     return _db
 
 
+def get_sync_client() -> firestore.Client:
+    """
+    Returns the singleton sync Firestore client, used for realtime listeners. Initializes it if not already created.
+    """
+    global _sync_db
+    if _sync_db is None:
+        _sync_db = firestore.Client(project=settings.google_cloud_project, database=settings.firestore_database_id)
+    return _sync_db
+
+
 def close_client():
     """
-    Closes the singleton Firestore client if it exists.
+    Closes the singleton Firestore clients if they exist.
     """
-    global _db
+    global _db, _sync_db
     if _db:
         _db.close()
         _db = None
+    if _sync_db:
+        _sync_db.close()
+        _sync_db = None
@@ -2,20 +2,366 @@
 Description: Generic Firestore service base class.
 Why: Provides reusable CRUD operations for Pydantic models backed by Firestore.
 How: Implements `create`, `get`, `list`, `update`, `delete` using python 3.12+ generics.
+     `list` results can be served from an optional in-process `CollectionCache`, which is
+     invalidated whenever the service writes to its collection. Reads can also be served from
+     an attached `CollectionMirror`, which is kept current by a realtime listener.
+     `list_json` returns the final encoded response body plus a strong ETag, encoded once per cached snapshot.
+     `list_json(fields=...)` pushes a field projection down into the query with `select()`, so only the
+     requested fields are read from Firestore and sent to the client.
+     `list_json(limit=..., start_after=...)` returns one page, ordered by `order_by` then document ID so
+     that the opaque `start_after` cursor is stable even when many documents share the same date.
+     `bulk_upsert` groups writes into batches of up to 500 (Firestore's limit) without reading documents back.
+     Models with a `fingerprint` field store a hash of their content, so `bulk_upsert` can skip unchanged items.
+     Fields declared with `exclude=True`, such as `fingerprint`, are written to Firestore but never served by the API.
 """
 
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from datetime import UTC, datetime
+from functools import partial
+from types import GenericAlias
+from typing import Any, cast
+
 from google.cloud import firestore
-from pydantic import BaseModel
+from google.cloud.firestore_v1.field_path import FieldPath
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+from app.config import settings
+from app.services.collection_mirror import CollectionMirror, PagePosition
+
+logger = logging.getLogger(__name__)
+
+_projection_adapter = TypeAdapter(list[dict[str, Any]])
+
+# Firestore commits at most 500 writes in one batch
+MAX_BATCH_WRITES = 500
+
+
+# Fields that don't count as content: the ID, when the record was first stored, and the fingerprint itself
+FINGERPRINT_EXCLUDE = frozenset({"id", "created_at", "fingerprint"})
+
+
+def content_fingerprint(item: BaseModel) -> str:
+    """Returns a SHA-256 hash of the item's content fields, independent of field order."""
+    data = item.model_dump(mode="json", exclude=set(FINGERPRINT_EXCLUDE))
+    raw = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def apply_fingerprint(item: BaseModel) -> str | None:
+    """Sets `fingerprint` on models that have one and returns it. Returns None for other models."""
+    if "fingerprint" not in type(item).model_fields:
+        return None
+    item.fingerprint = content_fingerprint(item)
+    return item.fingerprint
+
+
+class BulkWriteResult(BaseModel):
+    """
+    Outcome of one item in `bulk_upsert`: `error` is None when the document was written,
+    or was left alone because its content was `unchanged`.
+    """
+
+    id: str | None
+    error: str | None = None
+    unchanged: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class EncodedSnapshot(BaseModel):
+    """
+    A JSON-encoded response body, its strong ETag and when that body was first seen (None if that isn't known).
+    For a page of results, `next_cursor` is the `start_after` token for the following page (None on the last page).
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    body: bytes
+    etag: str
+    last_modified: datetime | None = None
+    next_cursor: str | None = None
+
+    @classmethod
+    def from_body(
+        cls, body: bytes, last_modified: datetime | None = None, next_cursor: str | None = None
+    ) -> "EncodedSnapshot":
+        digest = hashlib.sha256(body)
+        if next_cursor:
+            # A page whose next page changed is a different response, even if its own items didn't change
+            digest.update(next_cursor.encode("utf-8"))
+        return cls(
+            body=body,
+            etag=f'"{digest.hexdigest()}"',
+            last_modified=last_modified,
+            next_cursor=next_cursor,
+        )
+
+
+def _encode_projection(items: list[dict[str, Any]]) -> EncodedSnapshot:
+    return EncodedSnapshot.from_body(_projection_adapter.dump_json(items), last_modified=datetime.now(UTC))
+
+
+def encode_cursor(value: Any, doc_id: str) -> str:
+    """Encodes a page position (order field value, document ID) as an opaque URL-safe token."""
+    if isinstance(value, datetime):
+        value = {"ts": value.isoformat()}
+    raw = json.dumps([value, doc_id], separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> PagePosition:
+    """Decodes a token from `encode_cursor`. Raises ValueError if the token is malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        value, doc_id = json.loads(raw)
+        if isinstance(value, dict):
+            value = datetime.fromisoformat(value["ts"])
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("Invalid start_after cursor") from e
+    if not isinstance(doc_id, str) or not doc_id:
+        raise ValueError("Invalid start_after cursor")
+    return value, doc_id
+
+
+class _CacheEntry:
+    __slots__ = ("encoded", "items", "stored_at")
+
+    def __init__(self, items: tuple[Any, ...]):
+        self.stored_at = time.monotonic()
+        self.items = items
+        self.encoded: EncodedSnapshot | None = None
+
+
+class CollectionCache:
+    """
+    In-process read-through cache of query snapshots for a single Firestore collection.
+
+    Snapshots are keyed by query (e.g. "list") and expire after `ttl_seconds`.
+    Memory is bounded by `max_entries` (LRU eviction of whole snapshots) and `max_items`
+    (snapshots larger than this are never cached). Any write through the owning service
+    calls `invalidate()`, which drops every snapshot and bumps `version`.
+    Each snapshot can also hold its encoded JSON body, so serialisation only happens once per snapshot.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0, max_entries: int = 32, max_items: int = 5000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_items = max_items
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        # Last encoded body per key. Survives invalidation so an unchanged body keeps its Last-Modified.
+        self._last_encoded: OrderedDict[str, EncodedSnapshot] = OrderedDict()
+        # In-flight loads per key, shared by concurrent misses for that key
+        self._loading: dict[str, asyncio.Future[tuple[Any, ...]]] = {}
+
+    def _get_entry(self, key: str) -> _CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def get(self, key: str) -> tuple[Any, ...] | None:
+        """Returns the cached snapshot for `key`, or None if missing or expired."""
+        entry = self._get_entry(key)
+        return entry.items if entry else None
+
+    def put(self, key: str, items: list[Any]) -> None:
+        """Stores a snapshot, evicting the least recently used entries if over capacity."""
+        if len(items) > self.max_items:
+            logger.debug(f"Not caching '{key}': {len(items)} items exceeds max_items={self.max_items}")
+            return
+        self._entries[key] = _CacheEntry(tuple(items))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[list[Any]]]) -> list[Any]:
+        """
+        Returns the snapshot for `key`, calling `loader` on a miss.
+        Concurrent misses for the same key are coalesced into a single load; misses for other keys don't wait on it.
+        """
+        return list(await self._get_snapshot(key, loader))
+
+    async def _get_snapshot(self, key: str, loader: Callable[[], Awaitable[list[Any]]]) -> tuple[Any, ...]:
+        items = self.get(key)
+        if items is not None:
+            self.hits += 1
+            return items
+
+        task = self._loading.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._load(key, loader, self.version))
+            self._loading[key] = task
+        else:
+            # Another request is already loading this key
+            self.hits += 1
+        # Shielded, so a cancelled request doesn't cancel the load for the others waiting on it
+        return await asyncio.shield(task)
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[list[Any]]], version: int) -> tuple[Any, ...]:
+        try:
+            items = tuple(await loader())
+        finally:
+            # Invalidation may already have replaced this load with a newer one
+            if self._loading.get(key) is asyncio.current_task():
+                del self._loading[key]
+        # Don't store a snapshot that was invalidated while it was being loaded
+        if version == self.version:
+            self.put(key, items)
+        return items
+
+    async def get_or_encode(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[list[Any]]],
+        encoder: Callable[[list[Any]], EncodedSnapshot],
+    ) -> EncodedSnapshot:
+        """Returns the encoded body for the snapshot at `key`, encoding it only if the snapshot is new."""
+        items = await self._get_snapshot(key, loader)
+        # Reuse the stored encoding only if the entry still holds the snapshot `items` came from
+        entry = self._entries.get(key)
+        if entry is not None and entry.items is not items:
+            entry = None
+        if entry is not None and entry.encoded is not None:
+            return entry.encoded
+        encoded = encoder(list(items))
+        previous = self._last_encoded.get(key)
+        if previous is not None and previous.etag == encoded.etag:
+            encoded = previous
+        self._last_encoded[key] = encoded
+        self._last_encoded.move_to_end(key)
+        while len(self._last_encoded) > self.max_entries:
+            self._last_encoded.popitem(last=False)
+        if entry is not None:
+            entry.encoded = encoded
+        return encoded
+
+    def invalidate(self) -> None:
+        """Drops all cached snapshots for the collection."""
+        self._entries.clear()
+        # Later misses must not join loads that may have read the collection before this write
+        self._loading.clear()
+        self.version += 1
+        self.invalidations += 1
+
+    def stats(self) -> dict[str, int]:
+        """Returns hit/miss counters and current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+            "version": self.version,
+        }
+
+
+def new_collection_cache() -> CollectionCache | None:
+    """Creates a read cache for one collection from settings, or None if caching is disabled."""
+    if settings.firestore_cache_ttl_seconds <= 0:
+        return None
+    return CollectionCache(
+        ttl_seconds=settings.firestore_cache_ttl_seconds,
+        max_entries=settings.firestore_cache_max_entries,
+        max_items=settings.firestore_cache_max_items,
+    )
 
 
 class FirestoreService[T: BaseModel]:
-    def __init__(self, db: firestore.AsyncClient, collection_name: str, model_class: type[T]):
+    # Field used to sort `list` results in descending order. None means Firestore's default (document ID) order.
+    order_by: str | None = None
+
+    def __init__(
+        self,
+        db: firestore.AsyncClient,
+        collection_name: str,
+        model_class: type[T],
+        cache: CollectionCache | None = None,
+    ):
         self.db = db
+        self.collection_name = collection_name
         self.collection = db.collection(collection_name)
         self.model_class = model_class
+        self.cache = cache
+        self.mirror: CollectionMirror | None = None
+        # The alias is built at runtime, as `model_class` is a value rather than a static type
+        self._list_adapter = TypeAdapter(cast(type[list[T]], GenericAlias(list, (model_class,))))
+
+    def attach_mirror(self, mirror: CollectionMirror) -> None:
+        """Serves reads from a live mirror of the collection once it has received its first snapshot."""
+        self.mirror = mirror
+        # Every delta applied to the mirror makes cached snapshots stale
+        mirror.add_listener(self._invalidate_cache)
+
+    def _mirror_ready(self) -> bool:
+        return self.mirror is not None and self.mirror.ready
+
+    def _to_model(self, doc) -> T:
+        """Converts a Firestore document snapshot into the service's model."""
+        data = doc.to_dict()
+        data["id"] = doc.id
+        return self.model_class(**data)
+
+    def _to_document(self, item: T) -> dict[str, Any]:
+        """Converts a model into its Firestore payload. The ID is the document ID, so it isn't stored."""
+        data = item.model_dump(mode="json", exclude={"id"})
+        # Excluded fields are left out of API responses, but are still stored
+        for name, field in type(item).model_fields.items():
+            if field.exclude and name != "id":
+                data[name] = getattr(item, name)
+        return data
+
+    def _project(self, doc, fields: tuple[str, ...]) -> dict[str, Any]:
+        """Converts a (possibly projected) document snapshot into a dict holding only `id` and `fields`."""
+        data = doc.to_dict() or {}
+        projected = {"id": doc.id}
+        for field in fields:
+            if field in data:
+                projected[field] = data[field]
+        return projected
+
+    def _select_fields(self, fields: tuple[str, ...]) -> tuple[str, ...]:
+        """Returns the stored fields that must be read to build `fields`. Override when some fields are computed."""
+        return fields
+
+    def _normalise_fields(self, fields: Iterable[str]) -> tuple[str, ...]:
+        """Validates requested field names and returns them in model order, so equivalent requests share a cache key."""
+        requested = set(fields)
+        unknown = requested - {name for name, field in self.model_class.model_fields.items() if not field.exclude}
+        if unknown:
+            raise ValueError(f"Unknown field(s) for {self.collection_name}: {', '.join(sorted(unknown))}")
+        return tuple(f for f in self.model_class.model_fields if f in requested and f != "id")
+
+    def _cursor_after(self, doc) -> str:
+        """Returns the `start_after` token for the page that follows `doc`."""
+        value = (doc.to_dict() or {}).get(self.order_by) if self.order_by else None
+        return encode_cursor(value, doc.id)
+
+    def _invalidate_cache(self) -> None:
+        if self.cache:
+            self.cache.invalidate()
 
     async def create(self, item: T, item_id: str | None = None) -> T:
-        data = item.model_dump(mode="json", exclude={"id"})  # Exclude ID from payload, we use doc ID
+        data = self._to_document(item)
 
         # If item has explicit ID set, use it.
         if item.id:
@@ -28,28 +374,191 @@ class FirestoreService[T: BaseModel]:
             _, doc_ref = await self.collection.add(data)
             item_id = doc_ref.id
 
+        self._invalidate_cache()
         # Return a copy with the ID set
         return item.model_copy(update={"id": item_id})
 
+    async def bulk_upsert(
+        self,
+        items: Iterable[T],
+        batch_size: int = MAX_BATCH_WRITES,
+        fingerprints: Mapping[str, str | None] | None = None,
+    ) -> list[BulkWriteResult]:
+        """
+        Creates each item's document, or overwrites its fields if it exists, using batched writes.
+        Every item must have an `id`. Unlike `update`, documents are not read back after writing.
+        A batch is atomic, so an error fails every item in that batch; later batches are still written.
+        `fingerprints` maps document IDs to their stored `fingerprint`; items whose content hashes to the same
+        value are not written. Returns one result per item, in order.
+        """
+        results: list[BulkWriteResult] = []
+        batch = None
+        pending: dict[str, BulkWriteResult] = {}
+        for item in items:
+            if not item.id:
+                results.append(BulkWriteResult(id=None, error="Item has no ID"))
+                continue
+            fingerprint = apply_fingerprint(item)
+            if fingerprint and fingerprints and fingerprints.get(item.id) == fingerprint:
+                results.append(BulkWriteResult(id=item.id, unchanged=True))
+                continue
+            # A document is written at most once per batch
+            if len(pending) >= batch_size or item.id in pending:
+                await self._commit_batch(batch, pending.values())
+                batch, pending = None, {}
+            if batch is None:
+                batch = self.db.batch()
+            data = self._to_document(item)
+            batch.set(self.collection.document(item.id), data, merge=True)
+            result = BulkWriteResult(id=item.id)
+            pending[item.id] = result
+            results.append(result)
+        if pending:
+            await self._commit_batch(batch, pending.values())
+
+        if any(result.ok and not result.unchanged for result in results):
+            self._invalidate_cache()
+        return results
+
+    async def _commit_batch(self, batch, results: Iterable[BulkWriteResult]) -> None:
+        try:
+            await batch.commit()
+        except Exception as e:
+            logger.error(f"Batched write to {self.collection_name} failed: {e}")
+            for result in results:
+                result.error = str(e)
+
     async def get(self, item_id: str) -> T | None:
+        if self._mirror_ready():
+            doc = self.mirror.get(item_id)
+            return self._to_model(doc) if doc is not None else None
+
         doc_ref = self.collection.document(item_id)
         doc = await doc_ref.get()
         if doc.exists:
-            data = doc.to_dict()
-            data["id"] = doc.id
-            return self.model_class(**data)
+            return self._to_model(doc)
         return None
 
-    async def list(self) -> list[T]:
-        # Simple list all, pagination can be added later
-        docs = self.collection.stream()
+    def _encode_list(self, items: list[T]) -> EncodedSnapshot:
+        return EncodedSnapshot.from_body(self._list_adapter.dump_json(items), last_modified=datetime.now(UTC))
+
+    def _list_query(self):
+        if self.order_by:
+            return self.collection.order_by(self.order_by, direction=firestore.Query.DESCENDING)
+        return self.collection
+
+    async def _fetch_list(self) -> list[T]:
+        if self._mirror_ready():
+            return [self._to_model(doc) for doc in self.mirror.documents(order_by=self.order_by)]
+
+        # Full listing; use `list_page` for bounded reads
         items = []
-        async for doc in docs:
-            data = doc.to_dict()
-            data["id"] = doc.id
-            items.append(self.model_class(**data))
+        async for doc in self._list_query().stream():
+            items.append(self._to_model(doc))
         return items
 
+    async def _fetch_projection(self, fields: tuple[str, ...]) -> list[dict[str, Any]]:
+        if self._mirror_ready():
+            return [self._project(doc, fields) for doc in self.mirror.documents(order_by=self.order_by)]
+
+        query = self._list_query().select(list(self._select_fields(fields)))
+        items = []
+        async for doc in query.stream():
+            items.append(self._project(doc, fields))
+        return items
+
+    def _page_query(self, limit: int, start_after: PagePosition | None):
+        # Document ID is the tie-breaker, so documents sharing an order value are neither skipped nor repeated
+        if self.order_by:
+            query = self.collection.order_by(self.order_by, direction=firestore.Query.DESCENDING).order_by(
+                FieldPath.document_id(), direction=firestore.Query.DESCENDING
+            )
+        else:
+            query = self.collection.order_by(FieldPath.document_id())
+        if start_after is not None:
+            value, doc_id = start_after
+            cursor = {"__name__": doc_id}
+            if self.order_by:
+                cursor = {self.order_by: value, **cursor}
+            query = query.start_after(cursor)
+        # Read one extra document to find out whether there is a next page
+        return query.limit(limit + 1)
+
+    async def _fetch_page(
+        self, limit: int, start_after: PagePosition | None, fields: tuple[str, ...] | None = None
+    ) -> list[tuple[Any, str | None]]:
+        """
+        Returns up to `limit` (item, cursor) pairs. Only the last pair has a cursor, and only if more documents follow.
+        Items are models, or dicts when `fields` is given.
+        """
+        if self._mirror_ready():
+            docs = self.mirror.documents(order_by=self.order_by, start_after=start_after, limit=limit + 1)
+        else:
+            query = self._page_query(limit, start_after)
+            if fields is not None:
+                selected = self._select_fields(fields)
+                if self.order_by and self.order_by not in selected:
+                    # The order value is needed to build the next cursor
+                    selected = (*selected, self.order_by)
+                query = query.select(list(selected))
+            docs = [doc async for doc in query.stream()]
+
+        has_more = len(docs) > limit
+        docs = docs[:limit]
+        rows = []
+        for i, doc in enumerate(docs):
+            item = self._to_model(doc) if fields is None else self._project(doc, fields)
+            cursor = self._cursor_after(doc) if has_more and i == len(docs) - 1 else None
+            rows.append((item, cursor))
+        return rows
+
+    def _encode_page(self, rows: list[tuple[Any, str | None]], projected: bool) -> EncodedSnapshot:
+        items = [item for item, _ in rows]
+        body = _projection_adapter.dump_json(items) if projected else self._list_adapter.dump_json(items)
+        return EncodedSnapshot.from_body(body, last_modified=datetime.now(UTC), next_cursor=rows[-1][1] if rows else None)
+
+    async def list_page(self, limit: int, start_after: str | None = None) -> tuple[list[T], str | None]:
+        """Returns up to `limit` items after the `start_after` cursor, plus the cursor for the next page (or None)."""
+        rows = await self._fetch_page(limit, decode_cursor(start_after) if start_after else None)
+        return [item for item, _ in rows], rows[-1][1] if rows else None
+
+    async def list(self) -> list[T]:
+        if self.cache is None:
+            return await self._fetch_list()
+        return await self.cache.get_or_load("list", self._fetch_list)
+
+    async def list_json(
+        self, fields: Iterable[str] | None = None, limit: int | None = None, start_after: str | None = None
+    ) -> EncodedSnapshot:
+        """
+        Returns the `list` result as a ready-to-send JSON body with a strong ETag.
+        With a cache, the body is only re-encoded when the cached snapshot changes.
+        With `fields`, each item only carries `id` plus those fields, and only they are read from Firestore.
+        With `limit`, returns a single page starting after the `start_after` cursor; see `next_cursor`.
+        Raises ValueError if `fields` names a field the model doesn't have, or the cursor is invalid.
+        """
+        if fields is not None:
+            fields = self._normalise_fields(fields)
+
+        if limit is not None:
+            position = decode_cursor(start_after) if start_after else None
+            loader = partial(self._fetch_page, limit, position, fields)
+            encoder = partial(self._encode_page, projected=fields is not None)
+            if self.cache is None:
+                return encoder(await loader())
+            key = f"page:{limit}:{start_after or ''}:{','.join(fields) if fields is not None else '*'}"
+            return await self.cache.get_or_encode(key, loader, encoder)
+
+        if fields is None:
+            if self.cache is None:
+                return self._encode_list(await self._fetch_list())
+            return await self.cache.get_or_encode("list", self._fetch_list, self._encode_list)
+
+        loader = partial(self._fetch_projection, fields)
+        if self.cache is None:
+            return _encode_projection(await loader())
+        return await self.cache.get_or_encode(f"list:{','.join(fields)}", loader, _encode_projection)
+
     async def update(self, item_id: str, item_data: dict) -> T | None:
         doc_ref = self.collection.document(item_id)
         # Using update() which fails if doc doesn't exist
@@ -57,13 +566,20 @@ class FirestoreService[T: BaseModel]:
         # We likely want update semantics
         try:
             await doc_ref.update(item_data)
+            self._invalidate_cache()
             # Fetch updated to return full object
             return await self.get(item_id)
         except Exception:
             # Handle not found or other errors
             return None
 
+    async def update_fields(self, item_id: str, item_data: dict) -> None:
+        """Like `update`, but doesn't read the document back. Raises if the document doesn't exist."""
+        await self.collection.document(item_id).update(item_data)
+        self._invalidate_cache()
+
     async def delete(self, item_id: str) -> bool:
         doc_ref = self.collection.document(item_id)
         await doc_ref.delete()
+        self._invalidate_cache()
         return True
@@ -0,0 +1,62 @@
+"""
+Description: Service for the persistent HTTP response cache used by the ingestion connectors.
+Why: The daily refresh re-downloads feeds and API pages that rarely change. Keeping each response's validators
+     (ETag / Last-Modified) lets the next run send a conditional request and skip unchanged responses.
+How: Stores `HttpCacheEntry` documents in the 'http_cache' Firestore collection, keyed by a hash of the URL.
+     `lookup` and `store` never raise: a cache failure just means an unconditional request next time.
+"""
+
+import hashlib
+import logging
+from typing import Any
+
+from google.cloud import firestore
+
+from app.models.http_cache import HttpCacheEntry
+from app.services.firestore_base import FirestoreService
+
+logger = logging.getLogger(__name__)
+
+
+def http_cache_key(url: str) -> str:
+    return hashlib.sha256(url.encode()).hexdigest()
+
+
+def conditional_headers(entry: HttpCacheEntry | None) -> dict[str, str]:
+    """Request headers that ask the server to answer 304 if the cached response is still current."""
+    headers = {}
+    if entry and entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry and entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
+
+
+class HttpCacheService(FirestoreService[HttpCacheEntry]):
+    """
+    Service for managing cached HTTP responses in Firestore.
+    """
+
+    def __init__(self, db: firestore.AsyncClient):
+        super().__init__(db, "http_cache", HttpCacheEntry)
+
+
+async def lookup(cache: Any, url: str) -> HttpCacheEntry | None:
+    """Returns the cached entry for `url` from `cache` (an HttpCacheService, or a simulated one), if any."""
+    if cache is None:
+        return None
+    try:
+        return await cache.get(http_cache_key(url))
+    except Exception as e:
+        logger.warning(f"HTTP cache lookup failed for {url}: {e}")
+        return None
+
+
+async def store(cache: Any, entry: HttpCacheEntry) -> None:
+    """Saves `entry` to `cache`, replacing any previous entry for its URL."""
+    if cache is None:
+        return
+    try:
+        await cache.create(entry, item_id=http_cache_key(entry.url))
+    except Exception as e:
+        logger.warning(f"Could not save HTTP cache entry for {entry.url}: {e}")
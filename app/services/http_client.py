@@ -0,0 +1,113 @@
+"""
+Description: Shared HTTP client for the ingestion connectors.
+Why: Each connector call used to open its own `httpx.AsyncClient`, so every fetch (and every Dev.to article detail
+     request) paid for a new connection and TLS handshake, with httpx's default timeouts and no retries.
+How: `create_http_client` builds one connection-pooled HTTP/2 client with keep-alive, limits, timeouts and retries of
+     failed connection attempts, taken from settings. Error responses are not retried here; connectors that need
+     that (Dev.to) retry them themselves. `ingest_resources` creates the client once, passes it to every connector and
+     closes it at the end of the run. `borrow_client` lets a connector use the injected client, or a temporary one
+     when it is used on its own. `AdaptiveLimiter` bounds concurrent requests to one API and backs off when the
+     server throttles (429 with `Retry-After`).
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager, suppress
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from app.config import settings
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Creates a pooled client configured from settings. The caller must close it (`aclose` or `async with`)."""
+    limits = httpx.Limits(
+        max_connections=settings.http_client_max_connections,
+        max_keepalive_connections=settings.http_client_max_keepalive_connections,
+        keepalive_expiry=settings.http_client_keepalive_expiry_seconds,
+    )
+    timeout = httpx.Timeout(settings.http_client_timeout_seconds, connect=settings.http_client_connect_timeout_seconds)
+    # Transport retries cover failures to connect (e.g. DNS hiccups or refused connections), not error responses
+    transport = httpx.AsyncHTTPTransport(
+        http2=settings.http_client_http2, limits=limits, retries=settings.http_client_connect_retries
+    )
+    return httpx.AsyncClient(transport=transport, timeout=timeout)
+
+
+@asynccontextmanager
+async def borrow_client(client: httpx.AsyncClient | None) -> AsyncGenerator[httpx.AsyncClient]:
+    """Yields `client` if given (leaving it open for its owner), otherwise a temporary client closed on exit."""
+    if client is not None:
+        yield client
+        return
+    async with create_http_client() as temporary:
+        yield temporary
+
+
+def retry_after_seconds(response: httpx.Response) -> float | None:
+    """The delay requested by a `Retry-After` header (seconds or an HTTP date), or None if absent or invalid."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+class AdaptiveLimiter:
+    """
+    Caps requests in flight at a limit that adapts to throttling: each throttled response halves the limit and
+    pauses every request until the server's `Retry-After` has passed; each run of `limit` successes raises it by one,
+    back up to `max_limit`.
+    """
+
+    def __init__(self, max_limit: int):
+        self.max_limit = max(1, max_limit)
+        self.limit = self.max_limit
+        self.throttled = 0
+        self._in_flight = 0
+        self._successes = 0
+        self._resume_at = 0.0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> "AdaptiveLimiter":
+        async with self._condition:
+            while True:
+                pause = self._resume_at - time.monotonic()
+                if pause > 0:
+                    # Released early if another request changes the state, then re-checked
+                    with suppress(TimeoutError):
+                        await asyncio.wait_for(self._condition.wait(), timeout=pause)
+                elif self._in_flight >= self.limit:
+                    await self._condition.wait()
+                else:
+                    self._in_flight += 1
+                    return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def on_success(self) -> None:
+        self._successes += 1
+        if self._successes >= self.limit and self.limit < self.max_limit:
+            self.limit += 1
+            self._successes = 0
+
+    def on_throttled(self, delay: float) -> None:
+        self.throttled += 1
+        self._successes = 0
+        self.limit = max(1, self.limit // 2)
+        self._resume_at = max(self._resume_at, time.monotonic() + delay)
@@ -7,19 +7,12 @@ How: Extends `FirestoreService` for `Project` model and `projects` collection.
 from google.cloud import firestore
 
 from app.models.project import Project
-from app.services.firestore_base import FirestoreService
+from app.services.firestore_base import CollectionCache, FirestoreService
 
 
 class ProjectService(FirestoreService[Project]):
-    def __init__(self, db: firestore.AsyncClient):
-        super().__init__(db, "projects", Project)
+    # Sort by created_at descending
+    order_by = "created_at"
 
-    async def list(self) -> list[Project]:
-        # Sort by created_at descending
-        docs = self.collection.order_by("created_at", direction=firestore.Query.DESCENDING).stream()
-        items = []
-        async for doc in docs:
-            data = doc.to_dict()
-            data["id"] = doc.id
-            items.append(self.model_class(**data))
-        return items
+    def __init__(self, db: firestore.AsyncClient, cache: CollectionCache | None = None):
+        super().__init__(db, "projects", Project, cache=cache)
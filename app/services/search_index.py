@@ -0,0 +1,240 @@
+"""
+Description: In-memory inverted index over portfolio items.
+Why: Lets the agent's search tool rank matches without linearly scanning every title, tag and summary on each call.
+How: Tokenises configured fields of each item into a term -> postings map and ranks with BM25, summing per-field
+     scores weighted by a field boost. `sync` updates the index incrementally: unchanged items are skipped,
+     changed items are re-tokenised and items that disappeared are removed.
+     `reciprocal_rank_fusion` merges rankings from different retrievers (e.g. keyword and vector) into one.
+"""
+
+import bisect
+import logging
+import math
+import re
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Weight of a query term matching only the start of an indexed term (e.g. "type" -> "typescript")
+PREFIX_MATCH_WEIGHT = 0.5
+
+
+def tokenize(text: str) -> list[str]:
+    """Splits text into lowercase word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class SearchHit(BaseModel):
+    """A ranked search result, with the indexed fields that matched the query."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    key: str
+    kind: str
+    item: Any
+    score: float
+    matched_fields: set[str]
+
+
+def reciprocal_rank_fusion(rankings: Iterable[list[SearchHit]], k: int = 60) -> list[SearchHit]:
+    """
+    Fuses several best-first rankings: each hit scores the sum of 1 / (k + rank) over the rankings it appears in.
+    Scores from different retrievers aren't comparable, but ranks are, so no score normalisation is needed.
+    """
+    fused: dict[str, SearchHit] = {}
+    for ranking in rankings:
+        for rank, hit in enumerate(ranking, start=1):
+            contribution = 1 / (k + rank)
+            existing = fused.get(hit.key)
+            if existing is None:
+                fused[hit.key] = hit.model_copy(update={"score": contribution, "matched_fields": set(hit.matched_fields)})
+            else:
+                existing.score += contribution
+                existing.matched_fields |= hit.matched_fields
+    return sorted(fused.values(), key=lambda hit: (-hit.score, hit.key))
+
+
+class _IndexedDoc:
+    __slots__ = ("fingerprint", "item", "kind", "lengths", "terms")
+
+    def __init__(self, kind: str, item: Any, fingerprint: int, lengths: dict[str, int], terms: set[str]):
+        self.kind = kind
+        self.item = item
+        self.fingerprint = fingerprint
+        self.lengths = lengths
+        # Kept so removal doesn't depend on the item's current (possibly mutated) field values
+        self.terms = terms
+
+
+def _field_text(item: Any, field: str) -> str:
+    value = getattr(item, field, None)
+    if value is None:
+        return ""
+    if isinstance(value, list | tuple | set):
+        return " ".join(str(v) for v in value)
+    return str(value)
+
+
+class SearchIndex:
+    """
+    BM25 inverted index over items of several kinds (e.g. "project", "blog"), each with its own field boosts.
+
+    Multi-term queries match items containing every term (in any indexed field); matches are ranked by score.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._docs: dict[str, _IndexedDoc] = {}
+        self._keys_by_kind: dict[str, set[str]] = defaultdict(set)
+        self._boosts: dict[str, dict[str, float]] = {}
+        # term -> doc key -> field -> term frequency
+        self._postings: dict[str, dict[str, dict[str, int]]] = defaultdict(dict)
+        self._field_totals: dict[str, int] = defaultdict(int)
+        self._field_counts: dict[str, int] = defaultdict(int)
+        self._vocabulary: list[str] | None = None
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def count(self, kind: str) -> int:
+        return len(self._keys_by_kind.get(kind, ()))
+
+    def get(self, key: str) -> Any | None:
+        """Returns the indexed item for a key of the form "<kind>:<id>", or None."""
+        doc = self._docs.get(key)
+        return doc.item if doc else None
+
+    def sync(self, kind: str, items: Iterable[Any], fields: dict[str, float]) -> int:
+        """
+        Makes the index's items of `kind` match `items`, indexing `fields` with the given boosts.
+        Returns the number of items that were added, re-indexed or removed.
+        """
+        self._boosts[kind] = fields
+        seen: set[str] = set()
+        changed = 0
+        for item in items:
+            key = self._doc_key(kind, item)
+            seen.add(key)
+            doc = self._docs.get(key)
+            if doc is not None and doc.item is item:
+                # Same object as last time (e.g. from a cached snapshot), so nothing to do
+                continue
+            texts = {field: _field_text(item, field) for field in fields}
+            fingerprint = hash(tuple(texts.items()))
+            if doc is not None:
+                if doc.fingerprint == fingerprint:
+                    doc.item = item
+                    continue
+                self._remove(key)
+            self._add(key, kind, item, texts, fingerprint)
+            changed += 1
+
+        for key in self._keys_by_kind[kind] - seen:
+            self._remove(key)
+            changed += 1
+
+        if changed:
+            logger.debug(f"Search index: {changed} {kind} changes, {len(self._docs)} items indexed")
+        return changed
+
+    @staticmethod
+    def _doc_key(kind: str, item: Any) -> str:
+        item_id = getattr(item, "id", None)
+        if item_id:
+            return f"{kind}:{item_id}"
+        # Unsaved items have no ID, so fall back to something that identifies their content
+        return f"{kind}:#{getattr(item, 'url', None) or getattr(item, 'title', None) or id(item)}"
+
+    def _add(self, key: str, kind: str, item: Any, texts: dict[str, str], fingerprint: int) -> None:
+        lengths = {}
+        terms = set()
+        for field, text in texts.items():
+            tokens = tokenize(text)
+            if not tokens:
+                continue
+            lengths[field] = len(tokens)
+            self._field_totals[field] += len(tokens)
+            self._field_counts[field] += 1
+            terms.update(tokens)
+            for token in tokens:
+                postings = self._postings[token]
+                if not postings:
+                    self._vocabulary = None
+                fields = postings.setdefault(key, {})
+                fields[field] = fields.get(field, 0) + 1
+        self._docs[key] = _IndexedDoc(kind, item, fingerprint, lengths, terms)
+        self._keys_by_kind[kind].add(key)
+
+    def _remove(self, key: str) -> None:
+        doc = self._docs.pop(key)
+        self._keys_by_kind[doc.kind].discard(key)
+        for field, length in doc.lengths.items():
+            self._field_totals[field] -= length
+            self._field_counts[field] -= 1
+        for token in doc.terms:
+            postings = self._postings[token]
+            postings.pop(key, None)
+            if not postings:
+                del self._postings[token]
+                self._vocabulary = None
+
+    def _expand(self, term: str) -> list[tuple[str, float]]:
+        """Returns the indexed terms a query term matches: itself, plus terms it is a prefix of."""
+        matches = [(term, 1.0)] if term in self._postings else []
+        if len(term) < 2:
+            return matches
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        i = bisect.bisect_right(vocabulary, term)
+        while i < len(vocabulary) and vocabulary[i].startswith(term):
+            matches.append((vocabulary[i], PREFIX_MATCH_WEIGHT))
+            i += 1
+        return matches
+
+    def search(self, query: str, kinds: Iterable[str] | None = None) -> list[SearchHit]:
+        """Returns items matching every term of `query`, best first."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self._docs:
+            return []
+        allowed = set(kinds) if kinds is not None else None
+        total_docs = len(self._docs)
+
+        scores: dict[str, float] | None = None
+        matched: dict[str, set[str]] = defaultdict(set)
+        for term in terms:
+            term_scores: dict[str, float] = defaultdict(float)
+            for indexed_term, weight in self._expand(term):
+                postings = self._postings[indexed_term]
+                idf = math.log(1 + (total_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                for key, field_tfs in postings.items():
+                    doc = self._docs[key]
+                    if allowed is not None and doc.kind not in allowed:
+                        continue
+                    boosts = self._boosts[doc.kind]
+                    for field, tf in field_tfs.items():
+                        length_ratio = doc.lengths[field] / (self._field_totals[field] / self._field_counts[field])
+                        norm = tf * (self.k1 + 1) / (tf + self.k1 * (1 - self.b + self.b * length_ratio))
+                        term_scores[key] += weight * idf * boosts.get(field, 1.0) * norm
+                        matched[key].add(field)
+            if scores is None:
+                scores = dict(term_scores)
+            else:
+                scores = {key: score + term_scores[key] for key, score in scores.items() if key in term_scores}
+            if not scores:
+                return []
+
+        ranked = sorted(scores.items(), key=lambda kv: (-kv[1], kv[0]))
+        return [
+            SearchHit(
+                key=key, kind=self._docs[key].kind, item=self._docs[key].item, score=score, matched_fields=matched[key]
+            )
+            for key, score in ranked
+        ]
@@ -4,11 +4,14 @@ Why: Provides an in-memory wrapper around FirestoreService for dry runs.
 How: Intercepts read/write operations and applies them to an in-memory dictionary.
 """
 
+import asyncio
 import uuid
+from collections.abc import Iterable, Mapping
 
 from pydantic import BaseModel
 
-from app.services.firestore_base import FirestoreService
+from app.config import settings
+from app.services.firestore_base import MAX_BATCH_WRITES, BulkWriteResult, FirestoreService, apply_fingerprint
 
 
 class SimulatedFirestoreService[T: BaseModel]:
@@ -38,6 +41,26 @@ class SimulatedFirestoreService[T: BaseModel]:
         self._items[item_id] = new_item
         return new_item
 
+    async def bulk_upsert(
+        self,
+        items: Iterable[T],
+        batch_size: int = MAX_BATCH_WRITES,
+        fingerprints: Mapping[str, str | None] | None = None,
+    ) -> list[BulkWriteResult]:
+        await self._ensure_initialized()
+        results = []
+        for item in items:
+            if not item.id:
+                results.append(BulkWriteResult(id=None, error="Item has no ID"))
+                continue
+            fingerprint = apply_fingerprint(item)
+            if fingerprint and fingerprints and fingerprints.get(item.id) == fingerprint:
+                results.append(BulkWriteResult(id=item.id, unchanged=True))
+                continue
+            self._items[item.id] = item.model_copy()
+            results.append(BulkWriteResult(id=item.id))
+        return results
+
     async def get(self, item_id: str) -> T | None:
         await self._ensure_initialized()
         return self._items.get(item_id)
@@ -56,6 +79,12 @@ class SimulatedFirestoreService[T: BaseModel]:
         self._items[item_id] = updated_item
         return updated_item
 
+    async def update_fields(self, item_id: str, item_data: dict) -> None:
+        await self._ensure_initialized()
+        if item_id not in self._items:
+            raise KeyError(item_id)
+        self._items[item_id] = self._items[item_id].model_copy(update=item_data)
+
     async def delete(self, item_id: str) -> bool:
         await self._ensure_initialized()
         if item_id in self._items:
@@ -65,11 +94,19 @@ class SimulatedFirestoreService[T: BaseModel]:
 
 
 class SimulatedContentEnrichmentService:
+    def __init__(self, latency_seconds: float | None = None):
+        # Stands in for Gemini response time, so enrichment throughput can be measured offline
+        if latency_seconds is None:
+            latency_seconds = settings.simulated_enrichment_latency_seconds
+        self.latency_seconds = latency_seconds
+
     async def enrich_content(self, text: str) -> dict:
         """
         Simulates AI enrichment without making API calls.
         Returns a dummy summary and tags.
         """
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
         return {
             "summary": "[SIMULATED] This is a mock AI summary generated during a dry run. It prevents actual Gemini API calls to save time and tokens.",
             "tags": ["simulated", "dry-run", "mock"],
@@ -0,0 +1,131 @@
+"""
+Description: In-memory nearest-neighbour index over embedding vectors.
+Why: Lets `search_portfolio` answer a semantic query with a single top-k lookup instead of scanning documents.
+How: Vectors are L2 normalised into a NumPy matrix, so cosine similarity is a matrix-vector product.
+     "flat" scores every vector (exact). "ivf" clusters vectors with spherical k-means and only scores the
+     vectors in the `n_probe` clusters closest to the query (approximate, sub-linear).
+     `sync` updates the index incrementally; the matrix and clusters are rebuilt lazily on the next search.
+"""
+
+import logging
+import math
+from collections.abc import Iterable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+VECTOR_INDEX_METHODS = ("flat", "ivf")
+
+
+def _normalise(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class VectorIndex:
+    """Cosine-similarity index of vectors keyed by string (e.g. "blog:<id>")."""
+
+    def __init__(self, method: str = "flat", n_lists: int = 0, n_probe: int = 4, kmeans_iterations: int = 10):
+        if method not in VECTOR_INDEX_METHODS:
+            raise ValueError(f"Unknown vector index method: {method}")
+        self.method = method
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.kmeans_iterations = kmeans_iterations
+        self.dimensions: int | None = None
+        self._vectors: dict[str, np.ndarray] = {}
+        self._fingerprints: dict[str, str] = {}
+        # Built lazily from _vectors
+        self._keys: list[str] = []
+        self._matrix: np.ndarray | None = None
+        self._centroids: np.ndarray | None = None
+        self._lists: list[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def sync(self, entries: Iterable[tuple[str, str, list[float]]]) -> int:
+        """
+        Makes the index hold exactly `entries` of (key, fingerprint, vector).
+        Vectors whose fingerprint is unchanged are not re-read. Returns the number of keys added, changed or removed.
+        """
+        seen = set()
+        changed = 0
+        for key, fingerprint, vector in entries:
+            seen.add(key)
+            if self._fingerprints.get(key) == fingerprint:
+                continue
+            array = np.asarray(vector, dtype=np.float32)
+            if self.dimensions is None:
+                self.dimensions = array.shape[0]
+            if array.shape != (self.dimensions,):
+                logger.warning(f"Skipping vector for {key}: {array.shape[0]} dimensions, expected {self.dimensions}")
+                continue
+            self._vectors[key] = array
+            self._fingerprints[key] = fingerprint
+            changed += 1
+
+        for key in set(self._vectors) - seen:
+            del self._vectors[key]
+            del self._fingerprints[key]
+            changed += 1
+
+        if not self._vectors:
+            self.dimensions = None
+        if changed:
+            self._matrix = None
+        return changed
+
+    def _build(self) -> None:
+        self._keys = list(self._vectors)
+        self._matrix = _normalise(np.stack([self._vectors[key] for key in self._keys])) if self._keys else None
+        self._centroids = None
+        self._lists = []
+        if self.method == "ivf" and self._matrix is not None:
+            self._build_ivf(self._matrix)
+
+    def _build_ivf(self, matrix: np.ndarray) -> None:
+        n = matrix.shape[0]
+        n_lists = min(self.n_lists or max(1, round(math.sqrt(n))), n)
+        rng = np.random.default_rng(0)
+        centroids = matrix[rng.choice(n, size=n_lists, replace=False)]
+        for _ in range(self.kmeans_iterations):
+            assignments = np.argmax(matrix @ centroids.T, axis=1)
+            for i in range(n_lists):
+                members = matrix[assignments == i]
+                # An empty cluster keeps its previous centroid
+                if len(members):
+                    centroids[i] = members.sum(axis=0)
+            centroids = _normalise(centroids)
+        assignments = np.argmax(matrix @ centroids.T, axis=1)
+        self._centroids = centroids
+        self._lists = [np.flatnonzero(assignments == i) for i in range(n_lists)]
+        logger.debug(f"Built IVF index: {n} vectors in {n_lists} lists")
+
+    def search(self, vector: list[float], k: int) -> list[tuple[str, float]]:
+        """Returns up to `k` (key, cosine similarity) pairs, most similar first."""
+        if self._matrix is None:
+            self._build()
+        if self._matrix is None or k <= 0:
+            return []
+        query = np.asarray(vector, dtype=np.float32)
+        if query.shape != (self._matrix.shape[1],):
+            raise ValueError(f"Query has {query.shape[0]} dimensions, index has {self._matrix.shape[1]}")
+        query = _normalise(query)
+
+        if self._centroids is not None:
+            n_probe = min(self.n_probe, len(self._lists))
+            nearest_lists = np.argsort(-(self._centroids @ query))[:n_probe]
+            rows = np.concatenate([self._lists[i] for i in nearest_lists])
+        else:
+            rows = np.arange(self._matrix.shape[0])
+        if rows.size == 0:
+            return []
+
+        scores = self._matrix[rows] @ query
+        k = min(k, rows.size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self._keys[rows[i]], float(scores[i])) for i in top]
@@ -7,7 +7,7 @@ How: Inherits from the generic FirestoreService.
 from google.cloud import firestore
 
 from app.models.video import Video
-from app.services.firestore_base import FirestoreService
+from app.services.firestore_base import CollectionCache, FirestoreService
 
 
 class VideoService(FirestoreService[Video]):
@@ -15,5 +15,5 @@ class VideoService(FirestoreService[Video]):
     Service for managing video records in Firestore.
     """
 
-    def __init__(self, db: firestore.AsyncClient):
-        super().__init__(db, "videos", Video)
+    def __init__(self, db: firestore.AsyncClient, cache: CollectionCache | None = None):
+        super().__init__(db, "videos", Video, cache=cache)
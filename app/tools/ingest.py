@@ -1,15 +1,22 @@
 """
 Description: CLI tool for ingesting portfolio resources.
 Why: Orchestrates the fetching of data from various sources (GitHub, Medium, Dev.to) and saves it to Firestore.
-How: Uses Typer for CLI, and service connectors for data fetching.
+How: Uses Typer for CLI, and service connectors for data fetching. The GitHub, Medium RSS and Dev.to fetches run
+     concurrently over one shared, pooled HTTP client, while reconciling each source into Firestore stays sequential.
+     If a stage fails, fetches that are still running are cancelled. Stage timings are reported at the end.
 """
 
 import asyncio
 import os
 import re
+import time
 import zipfile
+from collections.abc import Awaitable, Iterable
 from datetime import UTC, datetime
+from functools import lru_cache, partial
+from typing import Any
 
+import httpx
 import typer
 import yaml
 from google.cloud import firestore
@@ -27,9 +34,11 @@ from app.config import settings
 from app.models.application import Application
 from app.models.blog import Blog
 from app.models.content import Content
+from app.models.embedding import Embedding
 from app.models.project import Project
 from app.models.video import Video
 from app.services.application_service import ApplicationService
+from app.services.archive_checkpoint import ArchiveCheckpoint
 from app.services.blog_service import BlogService
 from app.services.connectors.devto_connector import DevToConnector
 from app.services.connectors.github_connector import GitHubConnector
@@ -37,6 +46,12 @@ from app.services.connectors.medium_archive_connector import MediumArchiveConnec
 from app.services.connectors.medium_connector import MediumConnector
 from app.services.content_enrichment_service import ContentEnrichmentService
 from app.services.content_service import ContentService
+from app.services.embedding_provider import EmbeddingProvider, HashingEmbeddingProvider, get_embedding_provider
+from app.services.embedding_service import EmbeddingService, content_hash, document_text, embedding_id
+from app.services.enrichment_cache import CachedEnrichmentService, EnrichmentCacheService
+from app.services.enrichment_scheduler import EnrichmentScheduler, ordered_map
+from app.services.http_cache_service import HttpCacheService
+from app.services.http_client import create_http_client
 from app.services.project_service import ProjectService
 from app.services.simulated_service import SimulatedContentEnrichmentService, SimulatedFirestoreService
 from app.services.video_service import VideoService
@@ -44,6 +59,9 @@ from app.services.video_service import VideoService
 app = typer.Typer(help="Ingest portfolio resources from external platforms.")
 console = Console()
 
+# Medium archive posts are saved and checkpointed in groups of this size
+ARCHIVE_CHECKPOINT_INTERVAL = 25
+
 
 def slugify(text: str) -> str:
     """
@@ -55,6 +73,7 @@ def slugify(text: str) -> str:
     return text
 
 
+@lru_cache(maxsize=8192)
 def normalize_url(url: str | None) -> str:
     """
     Normalize a URL by stripping query parameters and trailing slashes.
@@ -67,6 +86,46 @@ def normalize_url(url: str | None) -> str:
     return url.split("?")[0].rstrip("/")
 
 
+class ReconciliationIndex:
+    """
+    Looks up existing items by normalised URL fields and by title while manual YAML entries are reconciled.
+    Items created or updated during the run are added back with `add`, so later entries in the same file that
+    duplicate them are found too. Items are only indexed once, so reconciling N entries against M items is O(N + M).
+    """
+
+    __slots__ = ("_by_title", "_by_url", "ambiguous_titles", "touched_ids")
+
+    def __init__(self, items: Iterable[Any], url_fields: tuple[str, ...]):
+        self._by_url: dict[str, dict[str, Any]] = {field: {} for field in url_fields}
+        self._by_title: dict[str, Any] = {}
+        # Titles shared by more than one existing item, which can't be used to match safely
+        self.ambiguous_titles: set[str] = set()
+        # IDs created or updated during this run
+        self.touched_ids: set[str] = set()
+        for item in items:
+            self._index(item)
+
+    def _index(self, item: Any) -> None:
+        for field, index in self._by_url.items():
+            if url := normalize_url(getattr(item, field, None)):
+                index[url] = item
+        if item.title in self._by_title and self._by_title[item.title].id != item.id:
+            self.ambiguous_titles.add(item.title)
+        self._by_title[item.title] = item
+
+    def add(self, item: Any) -> None:
+        """Indexes an item created or updated by this run."""
+        self._index(item)
+        self.touched_ids.add(item.id)
+
+    def by_url(self, field: str, url: str | None) -> Any | None:
+        normalized = normalize_url(url)
+        return self._by_url[field].get(normalized) if normalized else None
+
+    def by_title(self, title: str) -> Any | None:
+        return self._by_title.get(title)
+
+
 async def _process_manual_projects(
     project_list: list[dict],
     service: ProjectService | ApplicationService,
@@ -78,8 +137,8 @@ async def _process_manual_projects(
     Helper to process manual project/application entries.
     """
     existing_items = await service.list()
-    existing_urls = {normalize_url(p.repo_url): p.id for p in existing_items if p.repo_url}
-    existing_demo_urls = {normalize_url(p.demo_url): p.id for p in existing_items if p.demo_url}
+    index = ReconciliationIndex(existing_items, ("repo_url", "demo_url"))
+    writes = []
 
     for proj_data in project_list:
         # Enforce manual flags if not already set
@@ -92,29 +151,22 @@ async def _process_manual_projects(
             console.print(f"[red]Validation Error for {default_source} {proj_data.get('title')}: {validation_err}[/red]")
             continue
 
-        # Map for titles
-        existing_title_map = {}
-        ambiguous_titles = set()
-        for existing_p in existing_items:
-            if existing_p.title in existing_title_map:
-                ambiguous_titles.add(existing_p.title)
-            existing_title_map[existing_p.title] = existing_p.id
-
-        match_id = None
-        norm_repo = normalize_url(p.repo_url)
-        norm_demo = normalize_url(p.demo_url)
-
-        if norm_repo and norm_repo in existing_urls:
-            match_id = existing_urls[norm_repo]
-        elif norm_demo and norm_demo in existing_demo_urls:
-            match_id = existing_demo_urls[norm_demo]
-        elif p.title in existing_title_map:
-            if p.title in ambiguous_titles:
-                console.print(
-                    f"[bold red]Error: Title '{p.title}' matches multiple existing items. Cannot safely upsert by title. Skipping.[/bold red]"
-                )
-                continue
-            match_id = existing_title_map[p.title]
+        match = index.by_url("repo_url", p.repo_url) or index.by_url("demo_url", p.demo_url)
+        if match is None and p.title in index.ambiguous_titles:
+            console.print(
+                f"[bold red]Error: Title '{p.title}' matches multiple existing items. Cannot safely upsert by title. Skipping.[/bold red]"
+            )
+            continue
+        match = match or index.by_title(p.title)
+        match_id = match.id if match else None
+
+        if match_id in index.touched_ids:
+            console.print(
+                f"[bold yellow]Skipping duplicate {default_source} entry '{p.title}': "
+                f"it matches an earlier entry in the same file (ID: {match_id}).[/bold yellow]"
+            )
+            stats["skipped"] += 1
+            continue
 
         desired_id = None
         if p.id:
@@ -128,13 +180,16 @@ async def _process_manual_projects(
 
         if match_id:
             p.id = match_id
-            await service.update(p.id, p.model_dump(exclude={"id"}))
             console.print(f"Updated {default_source.capitalize()}: {p.title}")
             stats["updated"] += 1
         else:
-            await service.create(p, item_id=desired_id)
+            p.id = desired_id
             console.print(f"Created {default_source.capitalize()}: {p.title} (ID: {desired_id})")
             stats["new"] += 1
+        writes.append(p)
+        index.add(p)
+
+    await _save_all(service, writes, default_source, existing_items, stats)
 
 
 async def _process_manual_videos(video_list: list[dict], service: VideoService, stats: dict, simulate: bool = False):
@@ -146,23 +201,17 @@ async def _process_manual_videos(video_list: list[dict], service: VideoService,
     # Scoped to manual/youtube only as per spec
     existing_manual_items = [v for v in existing_items if v.is_manual and v.source_platform == "youtube"]
 
-    existing_urls = {normalize_url(v.video_url): v for v in existing_manual_items if v.video_url}
+    index = ReconciliationIndex(existing_manual_items, ("video_url",))
 
     # Check for duplicate titles in Firestore which could lead to accidental cleanup deletions
-    existing_titles = {}
-    duplicate_titles = set()
-    for v in existing_manual_items:
-        if v.title in existing_titles:
-            duplicate_titles.add(v.title)
-        existing_titles[v.title] = v
-
-    if duplicate_titles:
+    if index.ambiguous_titles:
         console.print(
-            f"[bold yellow]Warning: Found duplicate titles in Firestore for manual videos: {', '.join(duplicate_titles)}. "
+            f"[bold yellow]Warning: Found duplicate titles in Firestore for manual videos: {', '.join(index.ambiguous_titles)}. "
             "This may lead to cleanup prompts for the duplicates.[/bold yellow]"
         )
 
-    touched_ids = set()
+    writes = []
+    replaced_ids = []
 
     for video_data in video_list:
         video_data.setdefault("is_manual", True)
@@ -174,9 +223,17 @@ async def _process_manual_videos(video_list: list[dict], service: VideoService,
             console.print(f"[red]Validation Error for video {video_data.get('title')}: {validation_err}[/red]")
             continue
 
-        norm_url = normalize_url(v.video_url)
-        match_by_url = existing_urls.get(norm_url)
-        match_by_title = existing_titles.get(v.title)
+        match_by_url = index.by_url("video_url", v.video_url)
+        match_by_title = index.by_title(v.title)
+
+        earlier = match_by_url or match_by_title
+        if earlier and earlier.id in index.touched_ids:
+            console.print(
+                f"[bold yellow]Skipping duplicate video entry '{v.title}': "
+                f"it matches an earlier entry in the same file (ID: {earlier.id}).[/bold yellow]"
+            )
+            stats["skipped"] += 1
+            continue
 
         action = None  # "create", "update", "replacement", "skip"
         target_id = None
@@ -204,7 +261,7 @@ async def _process_manual_videos(video_list: list[dict], service: VideoService,
         if action in ["update", "update_title", "replacement"]:
             v.id = target_id
             # Always mark the current matching ID as touched so it's not deleted by the cleanup loop
-            touched_ids.add(target_id)
+            index.touched_ids.add(target_id)
 
             prompt_msg = f"Update video '{v.title}'?"
             if action == "replacement":
@@ -220,34 +277,38 @@ async def _process_manual_videos(video_list: list[dict], service: VideoService,
                 stats["updated"] += 1
             elif typer.confirm(prompt_msg, default=True):
                 if action == "replacement" and desired_id != target_id:
-                    # CRITICAL FIX: Ensure v.id is None so service.create uses desired_id
-                    v.id = None
-                    # Perform migration-style update: create new, delete old
-                    await service.create(v, item_id=desired_id)
-                    await service.delete(target_id)
+                    # Perform migration-style update: create new, then delete old once the new one is saved
+                    v.id = desired_id
+                    replaced_ids.append(target_id)
                     console.print(f"Replaced Video: {v.title} (ID: {target_id} -> {desired_id})")
-                    # Also mark the NEW ID as touched
-                    touched_ids.add(desired_id)
                 else:
-                    await service.update(v.id, v.model_dump(exclude={"id"}))
                     console.print(f"Updated Video: {v.title}")
+                writes.append(v)
                 stats["updated"] += 1
             else:
                 console.print(f"[dim]Skipped update for Video: {v.title}[/dim]")
                 stats["skipped"] += 1
         else:
+            v.id = desired_id
             if simulate:
                 console.print(f"[yellow]Would create Video: {v.title} (ID: {desired_id})[/yellow]")
                 stats["new"] += 1
             else:
-                await service.create(v, item_id=desired_id)
+                writes.append(v)
                 console.print(f"Created Video: {v.title} (ID: {desired_id})")
                 stats["new"] += 1
-                touched_ids.add(desired_id)
+        # Marks the video's (new) ID as touched, and lets later entries in the file find it
+        index.add(v)
+
+    if await _save_all(service, writes, "video", existing_items, stats) == len(writes):
+        for target_id in replaced_ids:
+            await service.delete(target_id)
+    elif replaced_ids:
+        console.print("[yellow]Kept the old IDs of replaced videos, as not all videos were saved.[/yellow]")
 
     # Deletion detection
     for existing_v in existing_manual_items:
-        if existing_v.id not in touched_ids:
+        if existing_v.id not in index.touched_ids:
             if simulate:
                 console.print(f"[magenta]Would delete stale Video: {existing_v.title} (ID: {existing_v.id})[/magenta]")
             elif typer.confirm(
@@ -348,6 +409,114 @@ async def _migrate_existing_items(blog_service, project_service, application_ser
         console.print(f"[bold red]Warning: ID migration pass failed:[/bold red] {e}")
 
 
+async def _update_embeddings(
+    blog_service, project_service, embedding_service, provider: EmbeddingProvider, stats: dict
+) -> None:
+    """
+    Stores one embedding per blog and project for semantic search.
+    Only items whose embedded text (or the embedding model) changed are sent to the provider, in batches.
+    Embeddings of items that no longer exist are deleted.
+    """
+    existing = {e.id: e for e in await embedding_service.list()}
+    seen = set()
+    pending: list[tuple[str, str, str, str, str]] = []  # (doc ID, kind, item ID, text, hash)
+
+    for kind, items in (("blog", await blog_service.list()), ("project", await project_service.list())):
+        for item in items:
+            if not item.id:
+                continue
+            doc_id = embedding_id(kind, item.id)
+            seen.add(doc_id)
+            text = document_text(item)
+            text_hash = content_hash(provider.name, text)
+            current = existing.get(doc_id)
+            if current and current.content_hash == text_hash:
+                stats["skipped"] += 1
+                continue
+            pending.append((doc_id, kind, item.id, text, text_hash))
+
+    for start in range(0, len(pending), provider.batch_size):
+        batch = pending[start : start + provider.batch_size]
+        vectors = await provider.embed([text for _, _, _, text, _ in batch], task="document")
+        embeddings = [
+            Embedding(id=doc_id, kind=kind, item_id=item_id, model=provider.name, vector=vector, content_hash=text_hash)
+            for (doc_id, kind, item_id, _, text_hash), vector in zip(batch, vectors, strict=True)
+        ]
+        for result in await embedding_service.bulk_upsert(embeddings):
+            if result.ok:
+                stats["updated" if result.id in existing else "new"] += 1
+            else:
+                console.print(f"[bold red]Failed to save embedding {result.id}:[/bold red] {result.error}")
+
+    for doc_id in existing.keys() - seen:
+        await embedding_service.delete(doc_id)
+        stats["deleted"] += 1
+
+
+async def _save_all(service, items: list, label: str, existing: list | None = None, stats: dict | None = None) -> int:
+    """
+    Upserts items (which must have IDs) in batched writes, reporting any failures.
+    Items whose content matches the fingerprint of their `existing` record are not written, and are moved
+    from "updated" to "unchanged" in `stats`. Returns the number saved or already up to date.
+    """
+    if not items:
+        return 0
+    fingerprints = {e.id: getattr(e, "fingerprint", None) for e in existing or []}
+    results = await service.bulk_upsert(items, fingerprints=fingerprints)
+    failed = [result for result in results if not result.ok]
+    for result in failed:
+        console.print(f"[bold red]Failed to save {label} {result.id}:[/bold red] {result.error}")
+    unchanged = sum(result.unchanged for result in results)
+    if unchanged and stats is not None:
+        stats["updated"] -= unchanged
+        stats["unchanged"] = stats.get("unchanged", 0) + unchanged
+    return len(results) - len(failed)
+
+
+async def _timed[R](timings: dict[str, float], stage: str, awaitable: Awaitable[R]) -> R:
+    """Awaits `awaitable`, recording how long it took under `stage`, even if it fails."""
+    started = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        timings[stage] = time.perf_counter() - started
+
+
+async def _fetch_medium_posts(blog_service, medium_user: str, connector: MediumConnector) -> list[Blog]:
+    """Fetches the Medium RSS feed, letting the connector reuse its cache for posts already stored with content."""
+    existing_blogs = await blog_service.list()
+    stored_urls = {normalize_url(b.url) for b in existing_blogs if b.url and b.markdown_content}
+    return await connector.fetch_posts(medium_user, existing_urls=stored_urls)
+
+
+async def _fetch_devto_posts(blog_service, devto_user: str, http_client: httpx.AsyncClient) -> list[Blog]:
+    """Fetches Dev.to posts, skipping the detail request for posts already stored with an AI summary."""
+    existing_blogs = await blog_service.list()
+    urls_to_skip_detail = {normalize_url(b.url) for b in existing_blogs if b.url and b.ai_summary}
+    return await DevToConnector(client=http_client).fetch_posts(devto_user, existing_urls=urls_to_skip_detail)
+
+
+def _create_enricher(enrichment_service, enrichment_cache_service) -> CachedEnrichmentService:
+    """Wraps the enrichment service (Gemini unless simulating) with the rate-limited scheduler and the cache."""
+    scheduler = EnrichmentScheduler(enrichment_service or ContentEnrichmentService())
+    return CachedEnrichmentService(scheduler, enrichment_cache_service)
+
+
+async def _enrich_blog(enricher: CachedEnrichmentService, entry: tuple[Blog, Blog | None]) -> dict | None:
+    """Enriches a (blog, existing blog) pair's content; None when there is no content to enrich."""
+    blog, _ = entry
+    if not blog.markdown_content:
+        return None
+    return await enricher.enrich_content(blog.markdown_content)
+
+
+def _apply_enrichment(blog: Blog, enrichment: dict) -> None:
+    blog.ai_summary = enrichment.get("summary")
+    ai_tags = enrichment.get("tags")
+    if ai_tags:
+        blog.tags = ai_tags
+
+
 async def ingest_resources(
     github_user: str | None,
     medium_user: str | None,
@@ -357,8 +526,46 @@ async def ingest_resources(
     about_file: str | None,
     project_id: str,
     simulate: bool = False,
+    embed: bool = False,
+    resume: bool = False,
+):
+    """
+    Ingests portfolio resources from various sources into Firestore.
+    With `embed`, also refreshes the semantic search embeddings of blogs and projects.
+    With `resume`, Medium archive posts saved by an interrupted run with the same zip are skipped.
+    All connectors share one pooled HTTP client, which is closed when the run ends.
+    """
+    async with create_http_client() as http_client:
+        await _ingest_resources(
+            github_user,
+            medium_user,
+            medium_zip,
+            devto_user,
+            yaml_file,
+            about_file,
+            project_id,
+            http_client,
+            simulate=simulate,
+            embed=embed,
+            resume=resume,
+        )
+
+
+async def _ingest_resources(
+    github_user: str | None,
+    medium_user: str | None,
+    medium_zip: str | None,
+    devto_user: str | None,
+    yaml_file: str | None,
+    about_file: str | None,
+    project_id: str,
+    http_client: httpx.AsyncClient,
+    simulate: bool = False,
+    embed: bool = False,
+    resume: bool = False,
 ):
-    """Ingests portfolio resources from various sources into Firestore."""
+    run_started = time.perf_counter()
+    timings: dict[str, float] = {}
 
     db = firestore.AsyncClient(project=project_id)
     project_service = ProjectService(db)
@@ -366,7 +573,11 @@ async def ingest_resources(
     blog_service = BlogService(db)
     content_service = ContentService(db)
     video_service = VideoService(db)
+    embedding_service = EmbeddingService(db)
+    enrichment_cache_service = EnrichmentCacheService(db)
+    http_cache_service = HttpCacheService(db)
     enrichment_service = None
+    enricher: CachedEnrichmentService | None = None
 
     if simulate:
         console.print("[bold yellow]*** RUNNING IN SIMULATION MODE ***[/bold yellow]")
@@ -375,6 +586,9 @@ async def ingest_resources(
         blog_service = SimulatedFirestoreService(blog_service)
         content_service = SimulatedFirestoreService(content_service)
         video_service = SimulatedFirestoreService(video_service)
+        embedding_service = SimulatedFirestoreService(embedding_service)
+        enrichment_cache_service = SimulatedFirestoreService(enrichment_cache_service)
+        http_cache_service = SimulatedFirestoreService(http_cache_service)
         enrichment_service = SimulatedContentEnrichmentService()
 
         console.print("\n[bold magenta]--- BEFORE SNAPSHOT ---[/bold magenta]")
@@ -389,311 +603,388 @@ async def ingest_resources(
             console.print(f"{name}: {len(items)} items")
 
     # 0. Migrate existing data to new ID format
-    await _migrate_existing_items(blog_service, project_service, application_service, video_service)
+    await _timed(
+        timings, "Migration", _migrate_existing_items(blog_service, project_service, application_service, video_service)
+    )
 
     # Statistics tracking
     stats = {
-        "github": {"new": 0, "updated": 0, "skipped": 0},
-        "medium": {"new": 0, "updated": 0, "skipped": 0, "drafts": 0, "filtered": 0},
-        "devto": {"new": 0, "updated": 0, "skipped": 0, "filtered": 0, "enriched": 0},
-        "manual": {"new": 0, "updated": 0, "skipped": 0},
+        "github": {"new": 0, "updated": 0, "unchanged": 0, "skipped": 0},
+        "medium": {"new": 0, "updated": 0, "unchanged": 0, "skipped": 0, "resumed": 0, "drafts": 0, "filtered": 0},
+        "devto": {"new": 0, "updated": 0, "unchanged": 0, "skipped": 0, "filtered": 0, "enriched": 0},
+        "manual": {"new": 0, "updated": 0, "unchanged": 0, "skipped": 0},
         "about": {"updated": 0},
-        "videos": {"new": 0, "updated": 0, "skipped": 0},
+        "videos": {"new": 0, "updated": 0, "unchanged": 0, "skipped": 0},
+        "embeddings": {"new": 0, "updated": 0, "skipped": 0, "deleted": 0},
     }
 
-    # --- About Page ---
-    if about_file:
-        console.print(f"[bold blue]Processing About File: {about_file}...[/bold blue]")
-        try:
-            with open(about_file, encoding="utf-8") as f:
-                about_body = f.read()
-
-            content = Content(title="About", body=about_body, last_updated=datetime.now(UTC))
-            # Create or update 'about' document
-            await content_service.create(content, item_id="about")
-            console.print("[green]Successfully updated About page content.[/green]")
-            stats["about"]["updated"] += 1
-        except Exception as e:
-            console.print(f"[bold red]Error processing About file:[/bold red] {e}")
+    # 1. Start fetching from the remote sources concurrently. Each section below waits for its own fetch, then
+    # reconciles the results into Firestore one source at a time, so deduplication sees the previous sections' writes.
+    fetches: dict[str, asyncio.Task] = {}
+    try:
+        if github_user:
+            console.print(f"[bold blue]Fetching GitHub repos for {github_user}...[/bold blue]")
+            github_connector = GitHubConnector(client=http_client, cache=http_cache_service)
+            fetch = github_connector.fetch_repositories(github_user)
+            fetches["github"] = asyncio.create_task(_timed(timings, "Fetch GitHub", fetch))
+        if medium_user:
+            console.print(f"[bold blue]Fetching Medium RSS feed for {medium_user}...[/bold blue]")
+            medium_connector = MediumConnector(client=http_client, cache=http_cache_service)
+            fetch = _fetch_medium_posts(blog_service, medium_user, medium_connector)
+            fetches["medium"] = asyncio.create_task(_timed(timings, "Fetch Medium RSS", fetch))
+        if devto_user:
+            console.print(f"[bold blue]Fetching Dev.to posts for {devto_user}...[/bold blue]")
+            fetch = _fetch_devto_posts(blog_service, devto_user, http_client)
+            fetches["devto"] = asyncio.create_task(_timed(timings, "Fetch Dev.to", fetch))
+
+        # --- About Page ---
+        if about_file:
+            stage_started = time.perf_counter()
+            console.print(f"[bold blue]Processing About File: {about_file}...[/bold blue]")
+            try:
+                with open(about_file, encoding="utf-8") as f:
+                    about_body = f.read()
+
+                content = Content(title="About", body=about_body, last_updated=datetime.now(UTC))
+                # Create or update 'about' document
+                await content_service.create(content, item_id="about")
+                console.print("[green]Successfully updated About page content.[/green]")
+                stats["about"]["updated"] += 1
+            except Exception as e:
+                console.print(f"[bold red]Error processing About file:[/bold red] {e}")
+            timings["About"] = time.perf_counter() - stage_started
 
-    # --- GitHub ---
-    if github_user:
-        console.print(f"[bold blue]Fetching GitHub repos for {github_user}...[/bold blue]")
-        connector = GitHubConnector()
-        try:
-            projects = await connector.fetch_repositories(github_user)
-            console.print(f"Found {len(projects)} repositories.")
-
-            existing_projects = await project_service.list()
-            existing_urls = {normalize_url(p.repo_url): p.id for p in existing_projects if p.repo_url}
-
-            for p in projects:
-                normalized_url = normalize_url(p.repo_url)
-                if normalized_url in existing_urls:
-                    p.id = existing_urls[normalized_url]
-                    await project_service.update(p.id, p.model_dump(exclude={"id"}))
-                    console.print(f"Updated: {p.title}")
-                    stats["github"]["updated"] += 1
-                else:
-                    slug = f"github:{slugify(p.title)}"
-                    await project_service.create(p, item_id=slug)
-                    console.print(f"Created: {p.title} (ID: {slug})")
-                    stats["github"]["new"] += 1
+        # --- GitHub ---
+        if github_user:
+            try:
+                projects = await fetches["github"]
+                stage_started = time.perf_counter()
+                console.print(f"Found {len(projects)} repositories.")
+                if github_connector.not_modified:
+                    console.print(
+                        f"{github_connector.not_modified} of {github_connector.pages} pages not modified (cached)."
+                    )
 
-        except Exception as e:
-            console.print(f"[bold red]Error fetching GitHub:[/bold red] {e}")
+                existing_projects = await project_service.list()
+                existing_urls = {normalize_url(p.repo_url): p.id for p in existing_projects if p.repo_url}
 
-    # --- Medium (Hybrid) ---
-    if medium_user or medium_zip:
-        console.print("[bold blue]Processing Medium content...[/bold blue]")
+                for p in projects:
+                    normalized_url = normalize_url(p.repo_url)
+                    if normalized_url in existing_urls:
+                        p.id = existing_urls[normalized_url]
+                        console.print(f"Updated: {p.title}")
+                        stats["github"]["updated"] += 1
+                    else:
+                        p.id = f"github:{slugify(p.title)}"
+                        console.print(f"Created: {p.title} (ID: {p.id})")
+                        stats["github"]["new"] += 1
+                await _save_all(project_service, projects, "GitHub project", existing_projects, stats["github"])
 
-        # 1. Fetch RSS feeds first (if enabled)
-        rss_posts: list[Blog] = []
-        if medium_user:
-            console.print(f"Fetching RSS feed for {medium_user}...")
-            rss_connector = MediumConnector()
-            try:
-                rss_posts = await rss_connector.fetch_posts(medium_user)
-                console.print(f"Found {len(rss_posts)} Medium posts in RSS.")
+                timings["GitHub"] = time.perf_counter() - stage_started
             except Exception as e:
-                console.print(f"[bold red]Error fetching Medium RSS:[/bold red] {e}")
-
-        # 2. Pre-fetch existing Firestore blogs for efficient upsert
-        console.print("Fetching existing Firestore blogs...")
-        existing_blogs = await blog_service.list()
-        existing_blog_map = {normalize_url(b.url): b for b in existing_blogs if b.url}
-
-        # 3. Process Archive (streaming)
-        if medium_zip:
-            console.print("[bold blue]Processing Medium archive...[/bold blue]")
-            if not enrichment_service:
-                enrichment_service = ContentEnrichmentService()
-            archive_connector = MediumArchiveConnector(ai_service=enrichment_service)
-            try:
-                # Count total files first
-                total_files_in_zip = 0
+                console.print(f"[bold red]Error fetching GitHub:[/bold red] {e}")
+
+        # --- Medium (Hybrid) ---
+        if medium_user or medium_zip:
+            # 1. Wait for the RSS feed (if enabled)
+            rss_posts: list[Blog] = []
+            if medium_user:
                 try:
-                    with zipfile.ZipFile(medium_zip, "r") as z:
-                        total_files_in_zip = len([f for f in z.namelist() if f.startswith("posts/") and f.endswith(".html")])
-                        if total_files_in_zip > 0:
-                            console.print(f"Found {total_files_in_zip} blog posts to process.")
-                        else:
-                            console.print("[yellow]No blog posts found in the archive.[/yellow]")
-                except FileNotFoundError:
-                    console.print(f"[bold red]Error: Zip file not found at {medium_zip}[/bold red]")
+                    rss_posts = await fetches["medium"]
+                    console.print(f"Found {len(rss_posts)} Medium posts in RSS.")
+                    if medium_connector.not_modified:
+                        console.print("Medium RSS feed not modified since the last run (cached).")
+                    elif medium_connector.reused:
+                        console.print(f"{medium_connector.reused} unchanged RSS posts reused from the cache.")
                 except Exception as e:
-                    console.print(f"[bold red]Error reading zip file metadata:[/bold red] {e}")
-
-                if total_files_in_zip > 0:
-                    with Progress(
-                        SpinnerColumn(),
-                        TextColumn("[progress.description]{task.description}"),
-                        BarColumn(bar_width=None),
-                        TaskProgressColumn(),
-                        TimeRemainingColumn(),
-                        console=console,
-                        redirect_stdout=False,
-                        redirect_stderr=False,
-                        transient=True,
-                    ) as progress:
-                        task_id = progress.add_task("Processing Medium Archive...", total=total_files_in_zip)
-
-                        def update_progress(processed, total, current_file, phase):
-                            short_file = os.path.basename(current_file)
-                            if len(short_file) > 30:
-                                short_file = short_file[:27] + "..."
-                            progress.update(
-                                task_id,
-                                completed=processed,
-                                total=total,
-                                description=f"[cyan]{phase:18}[/cyan] [white]{short_file}[/white]",
-                            )
+                    console.print(f"[bold red]Error fetching Medium RSS:[/bold red] {e}")
+            stage_started = time.perf_counter()
+            console.print("[bold blue]Processing Medium content...[/bold blue]")
 
-                        # Stream results from generator
-                        # We pass map of URLs that already have ai_summary to skip them
-                        urls_to_skip = {url for url, b in existing_blog_map.items() if b.ai_summary}
-                        async for status, blog, filename in archive_connector.fetch_posts(
-                            medium_zip, existing_urls=urls_to_skip, on_progress=update_progress
-                        ):
-                            if status == "skipped_draft":
-                                stats["medium"]["drafts"] += 1
-                                console.log(f"[yellow]Skipping (draft):[/yellow] {os.path.basename(filename)}")
-                                continue
-
-                            if status == "skipped_not_blog":
-                                stats["medium"]["filtered"] += 1
-                                console.log(f"[yellow]Skipping (not a blog):[/yellow] {os.path.basename(filename)}")
-                                continue
-
-                            if status == "skipped_existing":
-                                stats["medium"]["skipped"] += 1
-                                continue
-
-                            if status == "error":
-                                console.log(f"[red]Error processing:[/red] {os.path.basename(filename)}")
-                                continue
-
-                            if status == "processed" and blog:
-                                # Merge with RSS if available
-                                matched_rss = next(
-                                    (p for p in rss_posts if normalize_url(p.url) == normalize_url(blog.url)), None
+            # 2. Pre-fetch existing Firestore blogs for efficient upsert
+            console.print("Fetching existing Firestore blogs...")
+            existing_blogs = await blog_service.list()
+            existing_blog_map = {normalize_url(b.url): b for b in existing_blogs if b.url}
+
+            # 3. Process Archive (streaming)
+            if medium_zip:
+                # RSS posts by normalised URL, so each archive post finds its RSS counterpart in constant time
+                rss_index: dict[str, Blog] = {}
+                for p in rss_posts:
+                    rss_index.setdefault(normalize_url(p.url), p)
+                merged_rss: set[int] = set()
+                console.print("[bold blue]Processing Medium archive...[/bold blue]")
+                enricher = enricher or _create_enricher(enrichment_service, enrichment_cache_service)
+                archive_connector = MediumArchiveConnector(ai_service=enricher, concurrency=enricher.concurrency)
+                try:
+                    # Count total files first
+                    total_files_in_zip = 0
+                    try:
+                        with zipfile.ZipFile(medium_zip, "r") as z:
+                            total_files_in_zip = len(
+                                [f for f in z.namelist() if f.startswith("posts/") and f.endswith(".html")]
+                            )
+                            if total_files_in_zip > 0:
+                                console.print(f"Found {total_files_in_zip} blog posts to process.")
+                            else:
+                                console.print("[yellow]No blog posts found in the archive.[/yellow]")
+                    except FileNotFoundError:
+                        console.print(f"[bold red]Error: Zip file not found at {medium_zip}[/bold red]")
+                    except Exception as e:
+                        console.print(f"[bold red]Error reading zip file metadata:[/bold red] {e}")
+
+                    checkpoint = None
+                    if total_files_in_zip > 0 and not simulate:
+                        try:
+                            checkpoint = ArchiveCheckpoint(medium_zip, resume=resume)
+                            if checkpoint.done_count:
+                                console.print(
+                                    f"Resuming: {checkpoint.done_count} posts were already saved by a previous run."
                                 )
-                                if matched_rss:
-                                    blog.title = matched_rss.title
-                                    blog.date = matched_rss.date
-                                    rss_posts.remove(matched_rss)
-
-                                # Persist immediately
-                                normalized_url = normalize_url(blog.url)
-                                if normalized_url in existing_blog_map:
-                                    existing = existing_blog_map[normalized_url]
-                                    blog.id = existing.id
-                                    if blog.ai_summary is None:
-                                        blog.ai_summary = existing.ai_summary
-                                    blog.created_at = existing.created_at
-                                    await blog_service.update(blog.id, blog.model_dump(exclude={"id"}))
-                                    stats["medium"]["updated"] += 1
-                                else:
-                                    slug = f"medium:{slugify(blog.title)}"
-                                    await blog_service.create(blog, item_id=slug)
-                                    stats["medium"]["new"] += 1
+                        except Exception as e:
+                            console.print(
+                                f"[yellow]Could not open the archive checkpoint, so progress won't be saved:[/yellow] {e}"
+                            )
 
-            except Exception as e:
-                console.print(f"[bold red]Error parsing Medium archive:[/bold red] {e}")
-
-        # 4. Process remaining RSS blogs (those not in archive)
-        if rss_posts:
-            if not enrichment_service:
-                enrichment_service = ContentEnrichmentService()
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(bar_width=None),
-                TaskProgressColumn(),
-                TimeRemainingColumn(),
-                console=console,
-                transient=True,
-            ) as progress:
-                task = progress.add_task("Processing Medium RSS...", total=len(rss_posts))
-
-                for blog in rss_posts:
-                    progress.update(task, description=f"[cyan]Checking[/cyan] [white]{blog.title[:30]}...[/white]")
-                    normalized_url = normalize_url(blog.url)
-                    existing = existing_blog_map.get(normalized_url)
+                    if total_files_in_zip > 0:
+                        with Progress(
+                            SpinnerColumn(),
+                            TextColumn("[progress.description]{task.description}"),
+                            BarColumn(bar_width=None),
+                            TaskProgressColumn(),
+                            TimeRemainingColumn(),
+                            console=console,
+                            redirect_stdout=False,
+                            redirect_stderr=False,
+                            transient=True,
+                        ) as progress:
+                            task_id = progress.add_task("Processing Medium Archive...", total=total_files_in_zip)
+
+                            def update_progress(processed, total, current_file, phase):
+                                short_file = os.path.basename(current_file)
+                                if len(short_file) > 30:
+                                    short_file = short_file[:27] + "..."
+                                progress.update(
+                                    task_id,
+                                    completed=processed,
+                                    total=total,
+                                    description=f"[cyan]{phase:18}[/cyan] [white]{short_file}[/white]",
+                                )
 
-                    # 1. Skip if already exists and has summary
-                    if existing and existing.ai_summary:
-                        stats["medium"]["skipped"] += 1
-                        progress.advance(task)
-                        continue
+                            # Stream results from generator
+                            # We pass map of URLs that already have ai_summary to skip them
+                            urls_to_skip = {url for url, b in existing_blog_map.items() if b.ai_summary}
+                            # Saved in batches as they stream in, so an interrupted run keeps most of its work.
+                            # Posts are recorded in the checkpoint once their batch is saved.
+                            archive_writes = []
+                            archive_members = []
+
+                            async def flush_archive():
+                                nonlocal archive_writes, archive_members
+                                saved = await _save_all(
+                                    blog_service, archive_writes, "Medium blog", existing_blogs, stats["medium"]
+                                )
+                                if checkpoint and saved == len(archive_writes):
+                                    checkpoint.record(archive_members)
+                                archive_writes, archive_members = [], []
+
+                            async for status, blog, filename in archive_connector.fetch_posts(
+                                medium_zip, existing_urls=urls_to_skip, on_progress=update_progress, checkpoint=checkpoint
+                            ):
+                                if len(archive_members) >= ARCHIVE_CHECKPOINT_INTERVAL:
+                                    await flush_archive()
+
+                                if status == "skipped_checkpoint":
+                                    stats["medium"]["resumed"] += 1
+                                    continue
+
+                                if status == "error":
+                                    console.log(f"[red]Error processing:[/red] {os.path.basename(filename)}")
+                                    continue
+
+                                # Any other outcome is final, so the post needn't be read again on resume
+                                archive_members.append(filename)
+
+                                if status == "skipped_draft":
+                                    stats["medium"]["drafts"] += 1
+                                    console.log(f"[yellow]Skipping (draft):[/yellow] {os.path.basename(filename)}")
+                                    continue
+
+                                if status == "skipped_not_blog":
+                                    stats["medium"]["filtered"] += 1
+                                    console.log(f"[yellow]Skipping (not a blog):[/yellow] {os.path.basename(filename)}")
+                                    continue
+
+                                if status == "skipped_existing":
+                                    stats["medium"]["skipped"] += 1
+                                    continue
+
+                                if status == "processed" and blog:
+                                    # Merge with RSS if available
+                                    normalized_url = normalize_url(blog.url)
+                                    matched_rss = rss_index.pop(normalized_url, None)
+                                    if matched_rss:
+                                        blog.title = matched_rss.title
+                                        blog.date = matched_rss.date
+                                        merged_rss.add(id(matched_rss))
+
+                                    # Persist
+                                    if normalized_url in existing_blog_map:
+                                        existing = existing_blog_map[normalized_url]
+                                        blog.id = existing.id
+                                        if blog.ai_summary is None:
+                                            blog.ai_summary = existing.ai_summary
+                                        blog.created_at = existing.created_at
+                                        stats["medium"]["updated"] += 1
+                                    else:
+                                        blog.id = f"medium:{slugify(blog.title)}"
+                                        stats["medium"]["new"] += 1
+                                    archive_writes.append(blog)
+
+                            await flush_archive()
 
-                    # 2. Enrich if we have content and summary is missing
-                    if blog.markdown_content and (not existing or not existing.ai_summary):
-                        progress.update(task, description=f"[green]Enriching[/green] [white]{blog.title[:30]}...[/white]")
-                        try:
-                            enrichment = await enrichment_service.enrich_content(blog.markdown_content)
-                            blog.ai_summary = enrichment.get("summary")
-                            ai_tags = enrichment.get("tags")
-                            if ai_tags:
-                                blog.tags = ai_tags
-                            stats["medium"]["enriched"] = stats["medium"].get("enriched", 0) + 1
-                        except Exception as e:
-                            console.log(f"[red]Enrichment failed for {blog.title}:[/red] {e}")
+                except Exception as e:
+                    console.print(f"[bold red]Error parsing Medium archive:[/bold red] {e}")
+
+                # RSS posts merged into archive posts are done; the rest are processed below
+                rss_posts = [p for p in rss_posts if id(p) not in merged_rss]
+
+            # 4. Process remaining RSS blogs (those not in archive)
+            if rss_posts:
+                enricher = enricher or _create_enricher(enrichment_service, enrichment_cache_service)
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    BarColumn(bar_width=None),
+                    TaskProgressColumn(),
+                    TimeRemainingColumn(),
+                    console=console,
+                    transient=True,
+                ) as progress:
+                    task = progress.add_task("Processing Medium RSS...", total=len(rss_posts))
 
-                    # 3. Persist
-                    progress.update(task, description=f"[blue]Saving[/blue] [white]{blog.title[:30]}...[/white]")
-                    if existing:
-                        blog.id = existing.id
-                        if blog.ai_summary is None:
-                            blog.ai_summary = existing.ai_summary
-                        if blog.markdown_content is None:
+                    # 1. Skip if already exists and has summary
+                    to_process = []
+                    for blog in rss_posts:
+                        existing = existing_blog_map.get(normalize_url(blog.url))
+                        if existing and existing.ai_summary:
+                            stats["medium"]["skipped"] += 1
+                            progress.advance(task)
+                            continue
+                        if existing and blog.markdown_content is None:
+                            # Unchanged posts reused from the RSS cache come without content; enrich the stored content
                             blog.markdown_content = existing.markdown_content
-                        blog.created_at = existing.created_at
-                        await blog_service.update(blog.id, blog.model_dump(exclude={"id"}))
-                        stats["medium"]["updated"] += 1
-                    else:
-                        slug = f"medium:{slugify(blog.title)}"
-                        await blog_service.create(blog, item_id=slug)
-                        stats["medium"]["new"] += 1
+                        to_process.append((blog, existing))
+
+                    # 2. Enrich concurrently (summary is missing for all of these), in feed order
+                    writes = []
+                    progress.update(task, description=f"[green]Enriching[/green] [white]{len(to_process)} posts...[/white]")
+                    async for (blog, existing), enrichment, error in ordered_map(
+                        to_process, partial(_enrich_blog, enricher), enricher.concurrency
+                    ):
+                        if error:
+                            console.log(f"[red]Enrichment failed for {blog.title}:[/red] {error}")
+                        elif enrichment is not None:
+                            _apply_enrichment(blog, enrichment)
+                            stats["medium"]["enriched"] = stats["medium"].get("enriched", 0) + 1
 
-                    progress.advance(task)
+                        # 3. Persist (batched below)
+                        if existing:
+                            blog.id = existing.id
+                            if blog.ai_summary is None:
+                                blog.ai_summary = existing.ai_summary
+                            if blog.markdown_content is None:
+                                blog.markdown_content = existing.markdown_content
+                            blog.created_at = existing.created_at
+                            stats["medium"]["updated"] += 1
+                        else:
+                            blog.id = f"medium:{slugify(blog.title)}"
+                            stats["medium"]["new"] += 1
+                        writes.append(blog)
 
-    # --- Dev.to ---
-    if devto_user:
-        console.print(f"[bold blue]Fetching Dev.to posts for {devto_user}...[/bold blue]")
-        connector = DevToConnector()
-        try:
-            # Pre-fetch existing Firestore blogs for efficient upsert
-            existing_blogs = await blog_service.list()
-            existing_blog_map = {normalize_url(b.url): b for b in existing_blogs if b.url}
-            urls_to_skip_detail = {url for url, b in existing_blog_map.items() if b.ai_summary}
+                        progress.advance(task)
 
-            # We fetch all basic metadata first
-            blogs = await connector.fetch_posts(devto_user, existing_urls=urls_to_skip_detail)
-            console.print(f"Found {len(blogs)} Dev.to posts (filtered).")
+                    progress.update(task, description=f"[blue]Saving[/blue] [white]{len(writes)} posts...[/white]")
+                    await _save_all(blog_service, writes, "Medium blog", existing_blogs, stats["medium"])
+            timings["Medium"] = time.perf_counter() - stage_started
 
-            if not enrichment_service:
-                enrichment_service = ContentEnrichmentService()
+        # --- Dev.to ---
+        if devto_user:
+            try:
+                blogs = await fetches["devto"]
+                stage_started = time.perf_counter()
+                console.print(f"Found {len(blogs)} Dev.to posts (filtered).")
 
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(bar_width=None),
-                TaskProgressColumn(),
-                TimeRemainingColumn(),
-                console=console,
-                transient=True,
-            ) as progress:
-                task = progress.add_task("Processing Dev.to posts...", total=len(blogs))
+                # Re-read existing Firestore blogs, as the Medium section may have written some
+                existing_blogs = await blog_service.list()
+                existing_blog_map = {normalize_url(b.url): b for b in existing_blogs if b.url}
 
-                for b in blogs:
-                    progress.update(task, description=f"[cyan]Checking[/cyan] [white]{b.title[:30]}...[/white]")
+                enricher = enricher or _create_enricher(enrichment_service, enrichment_cache_service)
 
-                    normalized_url = normalize_url(b.url)
-                    existing = existing_blog_map.get(normalized_url)
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    BarColumn(bar_width=None),
+                    TaskProgressColumn(),
+                    TimeRemainingColumn(),
+                    console=console,
+                    transient=True,
+                ) as progress:
+                    task = progress.add_task("Processing Dev.to posts...", total=len(blogs))
 
                     # 1. Skip if already exists, has summary, and the image_url matches (or we don't need to update it)
-                    if existing and existing.ai_summary and (existing.image_url == b.image_url):
-                        stats["devto"]["skipped"] += 1
-                        progress.advance(task)
-                        continue
-
-                    # 2. Enrich if missing summary
-                    if b.markdown_content:
-                        progress.update(task, description=f"[green]Enriching[/green] [white]{b.title[:30]}...[/white]")
-                        try:
-                            enrichment = await enrichment_service.enrich_content(b.markdown_content)
-                            b.ai_summary = enrichment.get("summary")
-                            ai_tags = enrichment.get("tags")
-                            if ai_tags:
-                                b.tags = ai_tags
+                    to_process = []
+                    for b in blogs:
+                        existing = existing_blog_map.get(normalize_url(b.url))
+                        if existing and existing.ai_summary and (existing.image_url == b.image_url):
+                            stats["devto"]["skipped"] += 1
+                            progress.advance(task)
+                            continue
+                        to_process.append((b, existing))
+
+                    # 2. Enrich concurrently, in feed order
+                    writes = []
+                    progress.update(task, description=f"[green]Enriching[/green] [white]{len(to_process)} posts...[/white]")
+                    async for (b, existing), enrichment, error in ordered_map(
+                        to_process, partial(_enrich_blog, enricher), enricher.concurrency
+                    ):
+                        if error:
+                            console.log(f"[red]Enrichment failed for {b.title}:[/red] {error}")
+                        elif enrichment is not None:
+                            _apply_enrichment(b, enrichment)
                             stats["devto"]["enriched"] += 1
-                        except Exception as e:
-                            console.log(f"[red]Enrichment failed for {b.title}:[/red] {e}")
 
-                    # 3. Persist
-                    progress.update(task, description=f"[blue]Saving[/blue] [white]{b.title[:30]}...[/white]")
-                    if existing:
-                        b.id = existing.id
-                        if b.ai_summary is None:
-                            b.ai_summary = existing.ai_summary
-                        if b.markdown_content is None:
-                            b.markdown_content = existing.markdown_content
-                        b.created_at = existing.created_at
-                        await blog_service.update(b.id, b.model_dump(exclude={"id"}))
-                        stats["devto"]["updated"] += 1
-                    else:
-                        slug = f"devto:{slugify(b.title)}"
-                        await blog_service.create(b, item_id=slug)
-                        stats["devto"]["new"] += 1
+                        # 3. Persist (batched below)
+                        if existing:
+                            b.id = existing.id
+                            if b.ai_summary is None:
+                                b.ai_summary = existing.ai_summary
+                            if b.markdown_content is None:
+                                b.markdown_content = existing.markdown_content
+                            b.created_at = existing.created_at
+                            stats["devto"]["updated"] += 1
+                        else:
+                            b.id = f"devto:{slugify(b.title)}"
+                            stats["devto"]["new"] += 1
+                        writes.append(b)
 
-                    progress.advance(task)
+                        progress.advance(task)
 
-        except Exception as e:
-            console.print(f"[bold red]Error fetching Dev.to:[/bold red] {e}")
+                    progress.update(task, description=f"[blue]Saving[/blue] [white]{len(writes)} posts...[/white]")
+                    await _save_all(blog_service, writes, "Dev.to blog", existing_blogs, stats["devto"])
+                timings["Dev.to"] = time.perf_counter() - stage_started
+
+            except Exception as e:
+                console.print(f"[bold red]Error fetching Dev.to:[/bold red] {e}")
+    finally:
+        # A stage that raised would otherwise leave the remaining fetches running after the run has ended
+        for pending in fetches.values():
+            pending.cancel()
+        await asyncio.gather(*fetches.values(), return_exceptions=True)
 
     # --- Manual YAML ---
     if yaml_file:
+        stage_started = time.perf_counter()
         console.print(f"[bold blue]Processing Manual YAML: {yaml_file}...[/bold blue]")
         try:
             with open(yaml_file) as f:
@@ -737,6 +1028,7 @@ async def ingest_resources(
                 console.print(f"Found {len(manual_blogs)} manual blogs.")
                 existing_blogs = await blog_service.list()
                 existing_blog_map = {normalize_url(b.url): b for b in existing_blogs if b.url}
+                writes = []
 
                 for blog_data in manual_blogs:
                     blog_data["is_manual"] = True
@@ -768,16 +1060,33 @@ async def ingest_resources(
                         if b.markdown_content is None:
                             b.markdown_content = existing.markdown_content
                         b.created_at = existing.created_at
-                        await blog_service.update(b.id, b.model_dump(exclude={"id"}))
                         console.print(f"Updated Manual: {b.title}")
                         stats["manual"]["updated"] += 1
                     else:
-                        await blog_service.create(b, item_id=desired_id)
+                        b.id = desired_id
                         console.print(f"Created Manual: {b.title} (ID: {desired_id})")
                         stats["manual"]["new"] += 1
+                    writes.append(b)
+
+                await _save_all(blog_service, writes, "manual blog", existing_blogs, stats["manual"])
 
         except Exception as e:
             console.print(f"[bold red]Error processing YAML:[/bold red] {e}")
+        timings["YAML"] = time.perf_counter() - stage_started
+
+    # --- Semantic Search Embeddings ---
+    if embed:
+        console.print("[bold blue]Updating semantic search embeddings...[/bold blue]")
+        try:
+            # Simulation runs must not call the embeddings API
+            provider = HashingEmbeddingProvider() if simulate else get_embedding_provider()
+            await _timed(
+                timings,
+                "Embeddings",
+                _update_embeddings(blog_service, project_service, embedding_service, provider, stats["embeddings"]),
+            )
+        except Exception as e:
+            console.print(f"[bold red]Error updating embeddings:[/bold red] {e}")
 
     # --- FINAL SUMMARY ---
     console.print("\n" + "=" * 50)
@@ -805,16 +1114,38 @@ async def ingest_resources(
                 summary_parts.append(f"New: {data['new']}")
             if data.get("updated"):
                 summary_parts.append(f"Updated/Patched: {data['updated']}")
+            if data.get("unchanged"):
+                summary_parts.append(f"Unchanged: {data['unchanged']}")
             if data.get("enriched"):
                 summary_parts.append(f"AI Enriched: {data['enriched']}")
             if data.get("skipped"):
                 summary_parts.append(f"Skipped (existing): {data['skipped']}")
+            if data.get("resumed"):
+                summary_parts.append(f"Resumed (already saved): {data['resumed']}")
             if data.get("filtered"):
                 summary_parts.append(f"Filtered (quickies): {data['filtered']}")
             if data.get("drafts"):
                 summary_parts.append(f"Drafts: {data['drafts']}")
+            if data.get("deleted"):
+                summary_parts.append(f"Deleted: {data['deleted']}")
             console.print("  " + ", ".join(summary_parts))
 
+    if enricher and (enricher.hits or enricher.misses):
+        console.print(
+            f"[bold cyan]AI ENRICHMENT[/bold cyan]\n  Cache hits: {enricher.hits}, Model calls: {enricher.misses}, "
+            f"Retries: {enricher.service.retries}"
+        )
+        if enricher.misses and not simulate:
+            try:
+                evicted = await enrichment_cache_service.prune(settings.enrichment_cache_max_entries)
+                if evicted:
+                    console.print(f"  Evicted from cache: {evicted}")
+            except Exception as e:
+                console.print(f"[yellow]Could not prune the enrichment cache:[/yellow] {e}")
+
+    timings["Total"] = time.perf_counter() - run_started
+    console.print("[bold cyan]TIMINGS[/bold cyan]")
+    console.print("  " + ", ".join(f"{stage}: {seconds:.1f}s" for stage, seconds in timings.items()))
     console.print("=" * 50)
 
 
@@ -829,11 +1160,15 @@ def main(
     about_file: str = typer.Option(None, help="Path to Markdown file for About page"),
     project_id: str = typer.Option(settings.google_cloud_project, help="GCP Project ID"),
     simulate: bool = typer.Option(False, "--simulate", help="Run in simulation mode without updating the database"),
+    embed: bool = typer.Option(False, "--embed", help="Refresh semantic search embeddings for blogs and projects"),
+    resume: bool = typer.Option(
+        False, "--resume", help="Skip Medium archive posts already saved by an interrupted run with the same zip"
+    ),
 ):
     """
     Ingest data from configured sources.
     """
-    if not any([github_user, medium_user, medium_zip, devto_user, yaml_file, about_file]):
+    if not any([github_user, medium_user, medium_zip, devto_user, yaml_file, about_file, embed]):
         typer.echo(ctx.get_help())
         raise typer.Exit()
 
@@ -844,7 +1179,18 @@ def main(
         raise typer.Exit(code=1)
 
     asyncio.run(
-        ingest_resources(github_user, medium_user, medium_zip, devto_user, yaml_file, about_file, project_id, simulate)
+        ingest_resources(
+            github_user,
+            medium_user,
+            medium_zip,
+            devto_user,
+            yaml_file,
+            about_file,
+            project_id,
+            simulate,
+            embed=embed,
+            resume=resume,
+        )
     )
 
 
@@ -1,102 +1,282 @@
 """
 Description: Tool for searching the portfolio.
 Why: Allows the agent to find projects, blogs, and videos based on user queries.
-How: Fetches all items from Firestore and filters them in-memory (for now).
+How: Keeps a module-level BM25 `SearchIndex` over titles, tags, descriptions and summaries.
+     Each call syncs the index with the current listings (only changed items are re-indexed), then ranks matches.
+     When running in the API, the app's shared (cached / mirrored) services are used via `use_services`. Elsewhere
+     the tool creates its own cached services once, so repeated searches don't re-read every collection.
+     With semantic search enabled, stored blog / project embeddings are loaded into a `VectorIndex`. The query is
+     embedded while the index is refreshed and searched by keyword, and the two rankings are merged with reciprocal
+     rank fusion.
+     Output is budgeted (`search_result_limit` results and `search_result_max_chars` characters per call, with long
+     descriptions truncated) to keep the tool output sent to the model small. The header gives per-type match counts,
+     and a continuation cursor lets the agent page through the remaining results.
 """
 
+import asyncio
 import logging
+from collections import Counter, OrderedDict
 
+from app.config import settings
 from app.services.blog_service import BlogService
+from app.services.embedding_provider import EmbeddingProvider, get_embedding_provider
+from app.services.embedding_service import EmbeddingService
 from app.services.firestore import get_client
+from app.services.firestore_base import new_collection_cache
 from app.services.project_service import ProjectService
+from app.services.search_index import SearchHit, SearchIndex, reciprocal_rank_fusion
+from app.services.vector_index import VectorIndex
 from app.services.video_service import VideoService
 
 logger = logging.getLogger(__name__)
 
+# Indexed fields and their boosts: a title match outranks a tag match, which outranks a body match
+PROJECT_FIELDS = {"title": 3.0, "tags": 2.0, "description": 1.0}
+BLOG_FIELDS = {"title": 3.0, "tags": 2.0, "summary": 1.0, "ai_summary": 0.5}
+VIDEO_FIELDS = {"title": 3.0, "description": 1.0}
+KINDS = ("project", "blog", "video")
 
-async def search_portfolio(query: str) -> str:
-    """
-    Searches for projects, blogs, and videos matching the query (title, description, tags).
+# Query embeddings are cached, as agents often repeat a search within a conversation
+QUERY_EMBEDDING_CACHE_SIZE = 256
 
-    Args:
-        query: The search term (e.g., "python", "react").
+_index = SearchIndex()
+_vectors = VectorIndex(
+    method=settings.vector_index_method,
+    n_lists=settings.vector_index_ivf_lists,
+    n_probe=settings.vector_index_ivf_probes,
+)
+_services: tuple[ProjectService, BlogService, VideoService] | None = None
+_embedding_service: EmbeddingService | None = None
+# Created on first use when no services have been injected, and kept so that their caches are reused
+_own_services: tuple[ProjectService, BlogService, VideoService] | None = None
+_own_embedding_service: EmbeddingService | None = None
+_provider: EmbeddingProvider | None = None
+_query_embeddings: OrderedDict[str, list[float]] = OrderedDict()
+
+
+def use_services(
+    project_service: ProjectService | None = None,
+    blog_service: BlogService | None = None,
+    video_service: VideoService | None = None,
+    embedding_service: EmbeddingService | None = None,
+) -> None:
+    """Makes the tool read through the given services. Call with no arguments to go back to creating its own."""
+    global _services, _embedding_service, _own_services, _own_embedding_service
+    # Services created earlier are dropped, so the next fallback reads through fresh ones
+    _own_services = _own_embedding_service = None
+    if project_service and blog_service and video_service:
+        _services = (project_service, blog_service, video_service)
+    else:
+        _services = None
+    _embedding_service = embedding_service
+
+
+def _get_services() -> tuple[ProjectService, BlogService, VideoService]:
+    global _own_services
+    if _services is not None:
+        return _services
+    if _own_services is None:
+        db = get_client()
+        _own_services = (
+            ProjectService(db, cache=new_collection_cache()),
+            BlogService(db, cache=new_collection_cache()),
+            VideoService(db, cache=new_collection_cache()),
+        )
+    return _own_services
+
+
+def _get_embedding_service() -> EmbeddingService:
+    global _own_embedding_service
+    if _embedding_service is not None:
+        return _embedding_service
+    if _own_embedding_service is None:
+        _own_embedding_service = EmbeddingService(get_client(), cache=new_collection_cache())
+    return _own_embedding_service
+
+
+def _get_provider() -> EmbeddingProvider:
+    global _provider
+    if _provider is None:
+        _provider = get_embedding_provider()
+    return _provider
 
-    Returns:
-        A formatted string of matching items.
-    """
-    logger.debug(f"Searching portfolio for: {query}")
-    db = get_client()
-    project_service = ProjectService(db)
-    blog_service = BlogService(db)
-    video_service = VideoService(db)
 
-    # Fetch all items (optimization: use firestore queries later)
+async def refresh_index() -> SearchIndex:
+    """Brings the search index up to date with Firestore, re-indexing only items that changed."""
+    project_service, blog_service, video_service = _get_services()
     projects = await project_service.list()
     blogs = await blog_service.list()
     videos = await video_service.list()
     logger.debug(f"Fetched {len(projects)} projects, {len(blogs)} blogs and {len(videos)} videos")
 
-    results = []
-    query_lower = query.lower()
+    _index.sync("project", projects, PROJECT_FIELDS)
+    _index.sync("blog", blogs, BLOG_FIELDS)
+    _index.sync("video", videos, VIDEO_FIELDS)
 
-    for p in projects:
-        # Check title
-        if query_lower in p.title.lower():
-            url = p.repo_url or p.demo_url or "No URL"
-            results.append(
-                f"[Project] ID: {p.id} | Title: {p.title} | Desc: {p.description} (URL: {url}, Tags: {', '.join(p.tags)})"
-            )
-            continue
-        # Check tags
-        if any(query_lower in t.lower() for t in p.tags):
-            url = p.repo_url or p.demo_url or "No URL"
-            results.append(
-                f"[Project] ID: {p.id} | Title: {p.title} | Desc: {p.description} (URL: {url}, Tags: {', '.join(p.tags)})"
-            )
-            continue
-        # Check description
-        if p.description and query_lower in p.description.lower():
-            url = p.repo_url or p.demo_url or "No URL"
-            results.append(
-                f"[Project] ID: {p.id} | Title: {p.title} | Desc: {p.description} (URL: {url}, Tags: {', '.join(p.tags)})"
-            )
-            continue
+    if settings.semantic_search_enabled:
+        embedding_service = _get_embedding_service()
+        model = _get_provider().name
+        # Only vectors from the current model are comparable with query vectors
+        _vectors.sync((e.id, e.content_hash, e.vector) for e in await embedding_service.list() if e.model == model)
+    return _index
 
-    for b in blogs:
-        # Check title
-        if query_lower in b.title.lower():
-            results.append(
-                f"[Blog] ID: {b.id} | Title: {b.title} | Summary: {b.summary} (URL: {b.url}, Tags: {', '.join(b.tags or [])})"
-            )
-            continue
-        # Check tags
-        if b.tags and any(query_lower in t.lower() for t in b.tags):
-            results.append(
-                f"[Blog] ID: {b.id} | Title: {b.title} | Summary: {b.summary} (URL: {b.url}, Tags: {', '.join(b.tags)})"
-            )
-            continue
-        # Check summary
-        if b.summary and query_lower in b.summary.lower():
-            results.append(
-                f"[Blog] ID: {b.id} | Title: {b.title} | Summary: {b.summary} (URL: {b.url}, Tags: {', '.join(b.tags or [])})"
-            )
-            continue
-        # Check AI summary
-        if b.ai_summary and query_lower in b.ai_summary.lower():
-            results.append(
-                f"[Blog] ID: {b.id} | Title: {b.title} | AI Summary: {b.ai_summary[:150]}... (URL: {b.url}, Tags: {', '.join(b.tags or [])})"
-            )
-            continue
 
-    for v in videos:
-        if query_lower in v.title.lower() or (v.description and query_lower in v.description.lower()):
-            results.append(
-                f"[Video] ID: {v.id} | Title: {v.title} | Desc: {v.description} (URL: {v.video_url}, Date: {v.publish_date})"
+async def _embed_query(query: str) -> list[float]:
+    key = query.strip().lower()
+    vector = _query_embeddings.get(key)
+    if vector is None:
+        (vector,) = await _get_provider().embed([query], task="query")
+        _query_embeddings[key] = vector
+        while len(_query_embeddings) > QUERY_EMBEDDING_CACHE_SIZE:
+            _query_embeddings.popitem(last=False)
+    _query_embeddings.move_to_end(key)
+    return vector
+
+
+async def semantic_search(query: str, k: int | None = None) -> list[SearchHit]:
+    """Returns the blogs and projects whose embeddings are nearest to the query's, best first."""
+    if not len(_vectors):
+        return []
+    return _nearest(await _embed_query(query), k)
+
+
+def _nearest(vector: list[float], k: int | None = None) -> list[SearchHit]:
+    hits = []
+    for key, score in _vectors.search(vector, k or settings.semantic_search_top_k):
+        item = _index.get(key)
+        # Skip embeddings of items that have since been deleted
+        if item is not None:
+            kind = key.split(":", 1)[0]
+            hits.append(SearchHit(key=key, kind=kind, item=item, score=score, matched_fields={"semantic"}))
+    return hits
+
+
+async def ranked_search(query: str) -> list[SearchHit]:
+    """
+    Returns every item matching `query`, best first.
+    With semantic search enabled, the query is embedded while the index is refreshed and searched by keyword, and
+    the keyword and vector rankings are fused. If semantic search fails, keyword matches are returned on their own.
+    """
+    if not settings.semantic_search_enabled:
+        index = await refresh_index()
+        return index.search(query)
+
+    # The embedding round trip overlaps the Firestore reads of the refresh
+    embedding = asyncio.create_task(_embed_query(query))
+    try:
+        index = await refresh_index()
+    except BaseException:
+        embedding.cancel()
+        raise
+    keyword_hits = index.search(query)
+    try:
+        semantic_hits = _nearest(await embedding)
+    except Exception as e:
+        logger.warning(f"Semantic search failed, using keyword matches only: {e}")
+        return keyword_hits
+    return reciprocal_rank_fusion([keyword_hits, semantic_hits], k=settings.search_rrf_k)
+
+
+async def warm_index() -> None:
+    """Builds the search index ahead of the first query. Failures are logged, not raised."""
+    try:
+        index = await refresh_index()
+        logger.info(f"Search index built with {len(index)} items")
+    except Exception as e:
+        logger.warning(f"Could not build search index: {e}")
+
+
+def _truncate(text: str | None, limit: int) -> str:
+    """Shortens text to at most `limit` characters, cutting at a word boundary where possible."""
+    text = " ".join((text or "").split())
+    if len(text) <= limit:
+        return text
+    cut = text[: max(limit - 3, 0)]
+    if " " in cut:
+        cut = cut.rsplit(" ", 1)[0]
+    return cut.rstrip(" ,.;:") + "..."
+
+
+def _format_hit(hit: SearchHit) -> str:
+    item = hit.item
+    snippet = settings.search_snippet_max_chars
+    score = f" | Score: {hit.score:.4g}"
+    if hit.kind == "project":
+        url = item.repo_url or item.demo_url or "No URL"
+        desc = _truncate(item.description, snippet)
+        return (
+            f"[Project] ID: {item.id} | Title: {item.title} | Desc: {desc} (URL: {url}, Tags: {', '.join(item.tags)}){score}"
+        )
+    if hit.kind == "blog":
+        tags = ", ".join(item.tags or [])
+        if hit.matched_fields - {"semantic"} == {"ai_summary"}:
+            summary = _truncate(item.ai_summary, snippet)
+            return (
+                f"[Blog] ID: {item.id} | Title: {item.title} | AI Summary: {summary} (URL: {item.url}, Tags: {tags}){score}"
             )
+        summary = _truncate(item.summary, snippet)
+        return f"[Blog] ID: {item.id} | Title: {item.title} | Summary: {summary} (URL: {item.url}, Tags: {tags}){score}"
+    desc = _truncate(item.description, snippet)
+    return f"[Video] ID: {item.id} | Title: {item.title} | Desc: {desc} (URL: {item.video_url}, Date: {item.publish_date}){score}"
 
-    total_count = len(projects) + len(blogs) + len(videos)
-    if not results:
-        return f"No projects, blogs or videos found matching '{query}'. (Database contains {total_count} items total)"
 
-    header = f"Found {len(results)} matching items (Database contains {total_count} items total):"
-    return header + "\n" + "\n".join(results)
+def _count_by_kind(hits: list[SearchHit]) -> str:
+    counts = Counter(hit.kind for hit in hits)
+    return ", ".join(f"{counts[kind]} {kind}{'' if counts[kind] == 1 else 's'}" for kind in KINDS if counts[kind])
+
+
+def format_results(hits: list[SearchHit], total_count: int, offset: int = 0) -> str:
+    """
+    Formats ranked hits from `offset` onwards within the output budget.
+    Lines are added until `search_result_limit` results or `search_result_max_chars` characters are reached
+    (the first result is always included). If results remain, a footer gives the cursor for the next page.
+    """
+    header = f"Found {len(hits)} matching items (Database contains {total_count} items total): {_count_by_kind(hits)}."
+    lines = []
+    used = len(header)
+    for hit in hits[offset : offset + settings.search_result_limit]:
+        line = _format_hit(hit)
+        if lines and used + 1 + len(line) > settings.search_result_max_chars:
+            break
+        lines.append(line)
+        used += 1 + len(line)
+
+    end = offset + len(lines)
+    if end < len(hits):
+        lines.append(
+            f"Showing results {offset + 1}-{end} of {len(hits)}. For more, call search_portfolio again "
+            f"with the same query and cursor='{end}'."
+        )
+    elif offset:
+        lines.append(f"Showing results {offset + 1}-{end} of {len(hits)}. There are no more results.")
+    return header + "\n" + "\n".join(lines)
+
+
+async def search_portfolio(query: str, cursor: str | None = None) -> str:
+    """
+    Searches for projects, blogs, and videos matching the query (title, description, tags).
+    Results are ranked by relevance, best first, and returned a page at a time.
+
+    Args:
+        query: The search term (e.g., "python", "react").
+        cursor: Where to continue from, as given at the end of a previous page of results for the same query.
+            Omit for the first page.
+
+    Returns:
+        A formatted string of matching items, with per-type counts and the cursor for the next page (if any).
+    """
+    logger.debug(f"Searching portfolio for: {query} (cursor: {cursor})")
+    offset = 0
+    if cursor:
+        if not cursor.isdigit():
+            return f"Invalid cursor '{cursor}'. Use the cursor given at the end of a previous page of results."
+        offset = int(cursor)
+
+    hits = await ranked_search(query)
+
+    total_count = len(_index)
+    if not hits:
+        return f"No projects, blogs or videos found matching '{query}'. (Database contains {total_count} items total)"
+    if offset >= len(hits):
+        return f"No more results for '{query}': all {len(hits)} matching items have been shown."
+    return format_results(hits, total_count, offset)
@@ -20,7 +20,7 @@ describe('contentService', () => {
     (apiClient.get as Mock).mockResolvedValueOnce({ data: mockData });
 
     const result = await getBlogs();
-    expect(apiClient.get).toHaveBeenCalledWith('/api/blogs');
+    expect(apiClient.get).toHaveBeenCalledWith('/api/blogs', { params: { view: 'summary' } });
     expect(result).toEqual(mockData);
   });
 
@@ -2,7 +2,8 @@ import apiClient from './api';
 import type { Project, Blog, Application, Content } from '../types';
 
 export const getBlogs = async (): Promise<Blog[]> => {
-  const response = await apiClient.get<Blog[]>('/api/blogs');
+  // The carousel only needs card fields, so skip full post bodies
+  const response = await apiClient.get<Blog[]>('/api/blogs', { params: { view: 'summary' } });
   return response.data;
 };
 
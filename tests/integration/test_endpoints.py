@@ -15,19 +15,22 @@ from app.dependencies import (
     get_project_service,
     get_video_service,
 )
+from app.services.firestore_base import EncodedSnapshot
 
 
 def test_get_projects():
     from app.fast_api_app import app
 
     mock_service = MagicMock()
-    mock_service.list = AsyncMock(return_value=[])
+    mock_service.list_json = AsyncMock(return_value=EncodedSnapshot.from_body(b"[]"))
     app.dependency_overrides[get_project_service] = lambda: mock_service
 
     try:
         with TestClient(app) as client:
             response = client.get("/api/projects")
             assert response.status_code == 200
+            assert response.json() == []
+            assert response.headers["etag"] == mock_service.list_json.return_value.etag
     finally:
         app.dependency_overrides.clear()
 
@@ -36,13 +39,15 @@ def test_get_blogs():
     from app.fast_api_app import app
 
     mock_service = MagicMock()
-    mock_service.list = AsyncMock(return_value=[])
+    mock_service.list_json = AsyncMock(return_value=EncodedSnapshot.from_body(b"[]"))
     app.dependency_overrides[get_blog_service] = lambda: mock_service
 
     try:
         with TestClient(app) as client:
             response = client.get("/api/blogs")
             assert response.status_code == 200
+            assert response.json() == []
+            assert response.headers["etag"] == mock_service.list_json.return_value.etag
     finally:
         app.dependency_overrides.clear()
 
@@ -51,13 +56,15 @@ def test_get_videos():
     from app.fast_api_app import app
 
     mock_service = MagicMock()
-    mock_service.list = AsyncMock(return_value=[])
+    mock_service.list_json = AsyncMock(return_value=EncodedSnapshot.from_body(b"[]"))
     app.dependency_overrides[get_video_service] = lambda: mock_service
 
     try:
         with TestClient(app) as client:
             response = client.get("/api/videos")
             assert response.status_code == 200
+            assert response.json() == []
+            assert response.headers["etag"] == mock_service.list_json.return_value.etag
     finally:
         app.dependency_overrides.clear()
 
@@ -66,13 +73,15 @@ def test_get_experience():
     from app.fast_api_app import app
 
     mock_service = MagicMock()
-    mock_service.list = AsyncMock(return_value=[])
+    mock_service.list_json = AsyncMock(return_value=EncodedSnapshot.from_body(b"[]"))
     app.dependency_overrides[get_experience_service] = lambda: mock_service
 
     try:
         with TestClient(app) as client:
             response = client.get("/api/experience")
             assert response.status_code == 200
+            assert response.json() == []
+            assert response.headers["etag"] == mock_service.list_json.return_value.etag
     finally:
         app.dependency_overrides.clear()
 
@@ -0,0 +1,19 @@
+"""
+Description: Shared fixtures for the unit tests.
+Why: Several ingestion test modules mock the Firestore services in the same way.
+How: Fixtures defined here are discovered by pytest for every module in this directory.
+"""
+
+import pytest
+
+from app.services.firestore_base import BulkWriteResult
+
+
+@pytest.fixture
+def saved_bulk_upsert():
+    """A `bulk_upsert` side effect that reports every item as saved."""
+
+    def bulk_upsert(items, **kwargs):
+        return [BulkWriteResult(id=item.id) for item in items]
+
+    return bulk_upsert
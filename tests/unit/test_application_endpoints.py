@@ -8,10 +8,12 @@ from unittest.mock import AsyncMock
 
 import pytest
 from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
 
 from app.dependencies import get_application_service
 from app.fast_api_app import app
 from app.models.application import Application
+from app.services.firestore_base import EncodedSnapshot
 
 client = TestClient(app)
 
@@ -38,7 +40,9 @@ def test_get_applications(mock_application_service):
             metadata_only=False,
         )
     ]
-    mock_application_service.list.return_value = mock_apps
+    mock_application_service.list_json.return_value = EncodedSnapshot.from_body(
+        TypeAdapter(list[Application]).dump_json(mock_apps)
+    )
 
     response = client.get("/api/applications")
 
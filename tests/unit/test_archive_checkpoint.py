@@ -0,0 +1,124 @@
+"""
+Description: Unit tests for the Medium archive checkpoint journal.
+Why: Verifies that an interrupted archive ingest can resume without re-processing posts that were already saved.
+How: Builds small Medium export zips in a temporary directory and drives ArchiveCheckpoint and the connector with them.
+"""
+
+import zipfile
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.archive_checkpoint import ArchiveCheckpoint
+from app.services.connectors.medium_archive_connector import MediumArchiveConnector
+from app.services.firestore_base import BulkWriteResult
+from app.tools.ingest import ingest_resources
+
+POST_HTML = """
+<html><head><title>{title}</title></head><body>
+<section class="e-content"><h3>Heading</h3><p>Body of {title}</p></section>
+<a class="u-url" href="https://medium.com/@user/{slug}">link</a>
+</body></html>
+"""
+
+
+def _write_zip(path, posts: dict[str, str]) -> str:
+    with zipfile.ZipFile(path, "w") as z:
+        for slug, title in posts.items():
+            z.writestr(f"posts/{slug}.html", POST_HTML.format(title=title, slug=slug))
+    return str(path)
+
+
+def test_resume_skips_recorded_members(tmp_path):
+    zip_path = _write_zip(tmp_path / "medium.zip", {"one": "One", "two": "Two"})
+
+    first = ArchiveCheckpoint(zip_path)
+    first.record(["posts/one.html", "posts/unknown.html"])
+
+    resumed = ArchiveCheckpoint(zip_path, resume=True)
+    assert resumed.is_done("posts/one.html")
+    assert not resumed.is_done("posts/two.html")
+    assert resumed.done_count == 1
+
+    # Without --resume the journal starts again
+    assert ArchiveCheckpoint(zip_path).done_count == 0
+    assert ArchiveCheckpoint(zip_path, resume=True).done_count == 0
+
+
+def test_journal_for_another_archive_is_ignored(tmp_path):
+    zip_path = _write_zip(tmp_path / "medium.zip", {"one": "One"})
+    ArchiveCheckpoint(zip_path).record(["posts/one.html"])
+
+    # A new export replaces the zip, and the same post's content has changed
+    _write_zip(tmp_path / "medium.zip", {"one": "One (edited)"})
+
+    assert not ArchiveCheckpoint(zip_path, resume=True).is_done("posts/one.html")
+
+
+def test_truncated_journal_line_is_ignored(tmp_path):
+    zip_path = _write_zip(tmp_path / "medium.zip", {"one": "One", "two": "Two"})
+    checkpoint = ArchiveCheckpoint(zip_path)
+    checkpoint.record(["posts/one.html"])
+    with open(checkpoint.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"member": "posts/two.ht')
+
+    resumed = ArchiveCheckpoint(zip_path, resume=True)
+
+    assert resumed.is_done("posts/one.html")
+    assert not resumed.is_done("posts/two.html")
+
+
+@pytest.mark.asyncio
+async def test_connector_skips_checkpointed_posts(tmp_path):
+    zip_path = _write_zip(tmp_path / "medium.zip", {"one": "One", "two": "Two"})
+    ArchiveCheckpoint(zip_path).record(["posts/one.html"])
+    ai_service = MagicMock()
+    ai_service.enrich_content = AsyncMock(return_value={"summary": "Summary", "tags": []})
+    connector = MediumArchiveConnector(ai_service=ai_service)
+
+    results = [
+        (status, blog.title if blog else None)
+        async for status, blog, _ in connector.fetch_posts(zip_path, checkpoint=ArchiveCheckpoint(zip_path, resume=True))
+    ]
+
+    assert results == [("skipped_checkpoint", None), ("processed", "Two")]
+    ai_service.enrich_content.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("app.tools.ingest.BlogService")
+@patch("app.tools.ingest.ProjectService")
+@patch("app.tools.ingest.ApplicationService")
+@patch("app.tools.ingest.VideoService")
+@patch("app.tools.ingest.ContentEnrichmentService")
+@patch("app.tools.ingest.firestore.AsyncClient")
+async def test_ingest_records_only_saved_posts(
+    mock_firestore,
+    mock_enrichment_service,
+    mock_video_service,
+    mock_app_service,
+    mock_project_service,
+    mock_blog_service,
+    tmp_path,
+):
+    zip_path = _write_zip(tmp_path / "medium.zip", {"one": "One", "two": "Two"})
+    for service in (mock_video_service, mock_app_service, mock_project_service, mock_blog_service):
+        service.return_value.list = AsyncMock(return_value=[])
+    mock_enrichment_service.return_value.enrich_content = AsyncMock(return_value={"summary": "AI", "tags": ["t"]})
+    blogs = mock_blog_service.return_value
+
+    # A run whose writes fail leaves nothing to resume from
+    blogs.bulk_upsert = AsyncMock(
+        side_effect=lambda items, **kwargs: [BulkWriteResult(id=i.id, error="down") for i in items]
+    )
+    await ingest_resources(None, None, zip_path, None, None, None, "project", resume=True)
+    assert ArchiveCheckpoint(zip_path, resume=True).done_count == 0
+
+    blogs.bulk_upsert = AsyncMock(side_effect=lambda items, **kwargs: [BulkWriteResult(id=i.id) for i in items])
+    await ingest_resources(None, None, zip_path, None, None, None, "project", resume=True)
+    assert len(blogs.bulk_upsert.call_args.args[0]) == 2
+
+    # Everything was saved, so a resumed run has nothing left to write
+    blogs.bulk_upsert.reset_mock()
+    await ingest_resources(None, None, zip_path, None, None, None, "project", resume=True)
+    blogs.bulk_upsert.assert_not_called()
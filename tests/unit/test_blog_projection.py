@@ -0,0 +1,166 @@
+"""
+Description: Unit tests for blog field projection and the single blog endpoint.
+Why: Verifies that lightweight blog listings are projected in Firestore and only carry the requested fields.
+How: Mocks the Firestore query chain for service tests and overrides the blog service dependency for API tests.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from google.cloud import firestore
+
+from app.config import settings
+from app.dependencies import get_blog_service
+from app.fast_api_app import app
+from app.models.blog import Blog
+from app.services.blog_service import BlogService
+from app.services.firestore_base import CollectionCache, EncodedSnapshot
+
+client = TestClient(app)
+
+
+def _mock_db_with_projected_docs(docs: list[dict]):
+    """Builds a mock Firestore client whose ordered, projected query streams the given documents."""
+    mock_db = MagicMock()
+    mock_collection = mock_db.collection.return_value
+    mock_query = mock_collection.order_by.return_value.select.return_value
+
+    def stream():
+        async def gen():
+            for d in docs:
+                snapshot = MagicMock()
+                snapshot.id = d["id"]
+                snapshot.to_dict.return_value = {k: v for k, v in d.items() if k != "id"}
+                yield snapshot
+
+        return gen()
+
+    mock_query.stream.side_effect = stream
+    return mock_db, mock_collection
+
+
+@pytest.mark.asyncio
+async def test_projection_is_pushed_down_to_firestore():
+    mock_db, mock_collection = _mock_db_with_projected_docs(
+        [{"id": "b1", "title": "Post", "url": "https://medium.com/post", "platform": "Medium"}]
+    )
+    service = BlogService(mock_db)
+
+    encoded = await service.list_json(fields=["url", "title", "author_url"])
+
+    mock_collection.order_by.assert_called_once_with("date", direction=firestore.Query.DESCENDING)
+    # author_url is computed from platform, so platform is read but not returned
+    mock_collection.order_by.return_value.select.assert_called_once_with(["title", "url", "author_url", "platform"])
+    assert json.loads(encoded.body) == [
+        {"id": "b1", "title": "Post", "url": "https://medium.com/post", "author_url": settings.medium_profile}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_projections_are_cached_separately():
+    mock_db, mock_collection = _mock_db_with_projected_docs([{"id": "b1", "title": "Post", "date": "2026-01-01"}])
+    service = BlogService(mock_db, cache=CollectionCache(ttl_seconds=60))
+
+    first = await service.list_json(fields=BlogService.SUMMARY_FIELDS)
+    again = await service.list_json(fields=reversed(BlogService.SUMMARY_FIELDS))
+    titles = await service.list_json(fields=["title"])
+
+    assert first is again
+    assert json.loads(titles.body) == [{"id": "b1", "title": "Post"}]
+    assert mock_collection.order_by.return_value.select.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_fields_are_rejected():
+    service = BlogService(MagicMock())
+
+    with pytest.raises(ValueError, match="nope"):
+        await service.list_json(fields=["title", "nope"])
+
+
+@pytest.fixture
+def mock_blog_service():
+    service = AsyncMock()
+    service.list_json.return_value = EncodedSnapshot.from_body(b"[]")
+    app.dependency_overrides[get_blog_service] = lambda: service
+    yield service
+    app.dependency_overrides.clear()
+
+
+def test_summary_view_requests_summary_fields(mock_blog_service):
+    response = client.get("/api/blogs?view=summary")
+
+    assert response.status_code == 200
+    mock_blog_service.list_json.assert_awaited_once_with(fields=BlogService.SUMMARY_FIELDS, limit=None, start_after=None)
+    assert "markdown_content" not in BlogService.SUMMARY_FIELDS
+
+
+def test_fields_parameter_is_split(mock_blog_service):
+    client.get("/api/blogs?fields=title, url,")
+
+    mock_blog_service.list_json.assert_awaited_once_with(fields=["title", "url"], limit=None, start_after=None)
+
+
+def test_invalid_fields_return_400(mock_blog_service):
+    mock_blog_service.list_json.side_effect = ValueError("Unknown field(s) for blogs: nope")
+
+    response = client.get("/api/blogs?fields=nope")
+
+    assert response.status_code == 400
+    assert "nope" in response.json()["detail"]
+
+
+def test_get_blog_returns_full_body(mock_blog_service):
+    mock_blog_service.get.return_value = Blog(
+        id="b1", title="Post", date="2026-01-01", platform="Medium", url="https://x", markdown_content="# Body"
+    )
+
+    response = client.get("/api/blogs/b1")
+
+    assert response.status_code == 200
+    assert response.json()["markdown_content"] == "# Body"
+    assert "etag" in response.headers
+    mock_blog_service.get.assert_awaited_once_with("b1")
+
+
+def test_get_blog_not_found(mock_blog_service):
+    mock_blog_service.get.return_value = None
+
+    response = client.get("/api/blogs/missing")
+
+    assert response.status_code == 404
+
+
+def test_fingerprint_is_not_served():
+    doc = MagicMock(id="b1", exists=True)
+    doc.to_dict.return_value = {
+        "title": "Post",
+        "date": "2026-01-01",
+        "platform": "Medium",
+        "url": "https://x",
+        "fingerprint": "abc123",
+    }
+
+    async def stream():
+        yield doc
+
+    mock_db = MagicMock()
+    mock_db.collection.return_value.order_by.return_value.stream.side_effect = stream
+    mock_db.collection.return_value.document.return_value.get = AsyncMock(return_value=doc)
+    service = BlogService(mock_db)
+    app.dependency_overrides[get_blog_service] = lambda: service
+    try:
+        listed = client.get("/api/blogs")
+        single = client.get("/api/blogs/b1")
+        projected = client.get("/api/blogs?fields=title,fingerprint")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert listed.status_code == 200
+    assert [blog["id"] for blog in listed.json()] == ["b1"]
+    assert "fingerprint" not in listed.json()[0]
+    assert single.status_code == 200
+    assert "fingerprint" not in single.json()
+    assert projected.status_code == 400
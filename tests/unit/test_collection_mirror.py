@@ -0,0 +1,165 @@
+"""
+Description: Unit tests for CollectionMirror and mirror-backed service reads.
+Why: Verifies that realtime deltas keep the in-memory mirror current and that services serve reads from it.
+How: Uses a local test double for a Firestore collection's `on_snapshot` listener, so no Firestore is needed.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from google.cloud.firestore_v1.watch import ChangeType
+
+from app.config import settings
+from app.services.blog_service import BlogService
+from app.services.collection_mirror import CollectionMirror
+from app.services.firestore_base import CollectionCache
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id: str, data: dict):
+        self.id = doc_id
+        self._data = data
+
+    def to_dict(self) -> dict:
+        return dict(self._data)
+
+
+class FakeWatch:
+    def __init__(self):
+        self.unsubscribed = False
+
+    def unsubscribe(self):
+        self.unsubscribed = True
+
+
+class FakeCollectionReference:
+    """Test double for a sync CollectionReference that lets tests push realtime deltas."""
+
+    def __init__(self, collection_id: str):
+        self.id = collection_id
+        self.callback = None
+        self.watch = FakeWatch()
+
+    def on_snapshot(self, callback):
+        self.callback = callback
+        return self.watch
+
+    def push(self, added=(), modified=(), removed=()):
+        changes = [SimpleNamespace(type=ChangeType.ADDED, document=FakeSnapshot(*d)) for d in added]
+        changes += [SimpleNamespace(type=ChangeType.MODIFIED, document=FakeSnapshot(*d)) for d in modified]
+        changes += [SimpleNamespace(type=ChangeType.REMOVED, document=FakeSnapshot(doc_id, {})) for doc_id in removed]
+        assert self.callback is not None, "on_snapshot was not called"
+        self.callback([], changes, None)
+
+
+def _blog(title: str, date: str) -> dict:
+    return {"title": title, "date": date, "platform": "Medium", "url": f"https://medium.com/{title}"}
+
+
+@pytest.fixture
+def mirrored_blog_service():
+    mock_db = MagicMock()
+    service = BlogService(mock_db, cache=CollectionCache(ttl_seconds=60))
+    ref = FakeCollectionReference("blogs")
+    mirror = CollectionMirror(ref)
+    service.attach_mirror(mirror)
+    mirror.start()
+    return service, ref, mock_db.collection.return_value
+
+
+@pytest.mark.asyncio
+async def test_list_served_from_mirror_in_date_order(mirrored_blog_service):
+    service, ref, async_collection = mirrored_blog_service
+
+    ref.push(added=[("b1", _blog("older", "2025-01-01")), ("b2", _blog("newer", "2026-01-01"))])
+    blogs = await service.list()
+
+    assert [b.id for b in blogs] == ["b2", "b1"]
+    # Blog enrichment still applies to mirrored documents
+    assert blogs[0].author_url is not None
+    async_collection.order_by.assert_not_called()
+    async_collection.stream.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_mirror_applies_deltas_and_invalidates_cache(mirrored_blog_service):
+    service, ref, _ = mirrored_blog_service
+
+    ref.push(added=[("b1", _blog("first", "2025-01-01"))])
+    assert [b.title for b in await service.list()] == ["first"]
+
+    ref.push(modified=[("b1", _blog("renamed", "2025-01-01"))], added=[("b2", _blog("second", "2025-06-01"))])
+    assert [b.title for b in await service.list()] == ["second", "renamed"]
+
+    ref.push(removed=["b2"])
+    assert [b.title for b in await service.list()] == ["renamed"]
+    assert await service.get("b2") is None
+    assert (await service.get("b1")).title == "renamed"
+    assert service.cache.stats()["invalidations"] == 3
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_firestore_until_first_snapshot():
+    mock_db = MagicMock()
+    mock_query = mock_db.collection.return_value.order_by.return_value
+
+    async def empty_stream():
+        if False:
+            yield None
+
+    mock_query.stream.return_value = empty_stream()
+
+    service = BlogService(mock_db)
+    ref = FakeCollectionReference("blogs")
+    service.attach_mirror(CollectionMirror(ref))
+
+    assert await service.list() == []
+    mock_query.stream.assert_called_once()
+
+
+def test_stop_unsubscribes_listener():
+    ref = FakeCollectionReference("blogs")
+    mirror = CollectionMirror(ref)
+    mirror.start()
+    ref.push(added=[("b1", _blog("first", "2025-01-01"))])
+    assert mirror.ready
+
+    mirror.stop()
+
+    assert ref.watch.unsubscribed
+    assert not mirror.ready
+
+
+def test_ordering_excludes_documents_missing_the_field():
+    ref = FakeCollectionReference("blogs")
+    mirror = CollectionMirror(ref)
+    mirror.start()
+    ref.push(added=[("a", {"date": "2025-01-01"}), ("b", {"title": "no date"}), ("c", {"date": "2025-01-01"})])
+
+    # Ties on the order field are broken by document ID, in the same direction
+    assert [d.id for d in mirror.documents(order_by="date")] == ["c", "a"]
+    assert [d.id for d in mirror.documents()] == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("semantic_search", [False, True])
+async def test_embeddings_are_mirrored_only_for_semantic_search(monkeypatch, semantic_search):
+    from app.fast_api_app import app, lifespan
+
+    monkeypatch.setattr(settings, "firestore_realtime_mirror", True)
+    monkeypatch.setattr(settings, "semantic_search_enabled", semantic_search)
+    sync_db = MagicMock()
+    with (
+        patch("app.fast_api_app.get_client"),
+        patch("app.fast_api_app.close_client"),
+        patch("app.fast_api_app.get_sync_client", return_value=sync_db),
+        patch("app.fast_api_app.CollectionMirror"),
+        patch("app.fast_api_app.portfolio_search.warm_index", new=AsyncMock()),
+    ):
+        async with lifespan(app):
+            pass
+
+    mirrored = {call.args[0] for call in sync_db.collection.call_args_list}
+    assert ("embeddings" in mirrored) is semantic_search
+    assert "blogs" in mirrored
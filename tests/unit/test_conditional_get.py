@@ -0,0 +1,103 @@
+"""
+Description: Unit tests for conditional GET support on the /api endpoints.
+Why: Verifies that ETag / Last-Modified validators produce 304 responses and Cache-Control follows settings.
+How: Uses FastAPI TestClient with dependency overrides returning pre-encoded snapshots.
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.dependencies import get_blog_service, get_content_service
+from app.fast_api_app import app
+from app.models.blog import Blog
+from app.models.content import Content
+from app.services.firestore_base import EncodedSnapshot
+
+client = TestClient(app)
+
+SNAPSHOT = EncodedSnapshot.from_body(b"[]", last_modified=datetime(2026, 1, 20, 12, 0, 0, tzinfo=UTC))
+
+
+@pytest.fixture
+def mock_blog_service():
+    service = AsyncMock()
+    service.list_json.return_value = SNAPSHOT
+    app.dependency_overrides[get_blog_service] = lambda: service
+    yield service
+    app.dependency_overrides.clear()
+
+
+def test_list_returns_validators(mock_blog_service):
+    response = client.get("/api/blogs")
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == SNAPSHOT.etag
+    assert response.headers["last-modified"] == "Tue, 20 Jan 2026 12:00:00 GMT"
+    assert response.headers["cache-control"] == f"public, max-age={settings.http_cache_max_age['blogs']}"
+
+
+def test_if_none_match_returns_304(mock_blog_service):
+    response = client.get("/api/blogs", headers={"If-None-Match": f'"other", W/{SNAPSHOT.etag}'})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == SNAPSHOT.etag
+
+
+def test_stale_etag_returns_body(mock_blog_service):
+    # A matching date must not win over a mismatched ETag
+    response = client.get(
+        "/api/blogs", headers={"If-None-Match": '"stale"', "If-Modified-Since": "Wed, 21 Jan 2026 00:00:00 GMT"}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_if_modified_since(mock_blog_service):
+    not_modified = client.get("/api/blogs", headers={"If-Modified-Since": "Tue, 20 Jan 2026 12:00:00 GMT"})
+    modified = client.get("/api/blogs", headers={"If-Modified-Since": "Mon, 19 Jan 2026 12:00:00 GMT"})
+
+    assert not_modified.status_code == 304
+    assert modified.status_code == 200
+
+
+def test_cache_control_is_tunable_per_collection(mock_blog_service, monkeypatch):
+    monkeypatch.setitem(settings.http_cache_max_age, "blogs", 0)
+
+    response = client.get("/api/blogs")
+
+    assert response.headers["cache-control"] == "no-cache"
+
+
+def test_content_conditional_get():
+    service = AsyncMock()
+    service.get.return_value = Content(
+        id="about", title="About Me", body="Body", last_updated=datetime(2026, 1, 24, 12, 0, 0, tzinfo=UTC)
+    )
+    app.dependency_overrides[get_content_service] = lambda: service
+    try:
+        first = client.get("/api/content/about")
+        assert first.status_code == 200
+        assert first.json()["title"] == "About Me"
+        assert first.headers["last-modified"] == "Sat, 24 Jan 2026 12:00:00 GMT"
+
+        second = client.get("/api/content/about", headers={"If-None-Match": first.headers["etag"]})
+        assert second.status_code == 304
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_blog_detail_is_validated_by_etag_only(mock_blog_service):
+    mock_blog_service.get.return_value = Blog(id="b1", title="Post", date="2026-01-20", platform="Medium", url="u")
+
+    first = client.get("/api/blogs/b1")
+    assert first.status_code == 200
+    # A blog has no modification time, so no Last-Modified is sent and If-Modified-Since can't produce a 304
+    assert "last-modified" not in first.headers
+    assert client.get("/api/blogs/b1", headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}).status_code == 200
+    assert client.get("/api/blogs/b1", headers={"If-None-Match": first.headers["etag"]}).status_code == 304
@@ -1,9 +1,12 @@
 """
 Description: Unit tests for Dev.to Connector.
 Why: Verifies that the Dev.to connector correctly fetches posts via API and maps them to Blog models.
-How: Mocks httpx.AsyncClient responses with JSON and asserts on the resulting Blog objects.
+How: Mocks httpx.AsyncClient responses with JSON and asserts on the resulting Blog objects. Concurrent detail
+     fetching and throttling are exercised against an httpx.MockTransport server with artificial latency, and a fake
+     limiter records how requests acquire and release it.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -130,3 +133,118 @@ async def test_fetch_posts_content_retrieval():
 
         # Verify calls
         assert mock_get.call_count == 2
+
+
+def _articles(count: int) -> list[dict]:
+    return [
+        {"id": i, "title": f"Post {i}", "url": f"https://dev.to/u/post-{i}", "published_at": "2026-01-01T10:00:00Z"}
+        for i in range(1, count + 1)
+    ]
+
+
+class DetailServer:
+    """A mock Dev.to API whose detail responses take `latency` seconds, recording the peak requests in flight."""
+
+    def __init__(self, count: int, latency: float = 0.0, throttled: dict[int, str] | None = None):
+        self.articles = _articles(count)
+        self.latency = latency
+        # Article id -> Retry-After value returned (once) with a 429
+        self.throttled = dict(throttled or {})
+        self.active = 0
+        self.peak = 0
+        self.requests: list[str] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.url.path)
+        if request.url.path == "/api/articles":
+            return httpx.Response(200, json=self.articles)
+        article_id = int(request.url.path.rsplit("/", 1)[1])
+        if article_id in self.throttled:
+            return httpx.Response(429, headers={"Retry-After": self.throttled.pop(article_id)})
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.latency)
+        self.active -= 1
+        return httpx.Response(200, json={"body_markdown": f"Body of {article_id} " + "word " * 250})
+
+
+class FakeLimiter:
+    """Stands in for `AdaptiveLimiter` without pausing, recording how requests acquire and release it."""
+
+    def __init__(self, max_limit: int):
+        self.max_limit = max_limit
+        self.in_flight = 0
+        self.calls: list[str] = []
+        self.delays: list[float] = []
+
+    async def __aenter__(self) -> "FakeLimiter":
+        self.in_flight += 1
+        self.calls.append("acquire")
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.in_flight -= 1
+        self.calls.append("release")
+
+    def on_success(self) -> None:
+        self.calls.append("success")
+
+    def on_throttled(self, delay: float) -> None:
+        self.calls.append("throttled")
+        self.delays.append(delay)
+
+
+async def _fetch(server: DetailServer, **kwargs) -> tuple[list, DevToConnector]:
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+        connector = DevToConnector(client=client, **kwargs)
+        blogs = await connector.fetch_posts("u")
+        return blogs, connector
+
+
+@pytest.mark.asyncio
+async def test_details_are_fetched_concurrently_in_listing_order():
+    server = DetailServer(20, latency=0.02)
+
+    blogs, _ = await _fetch(server, detail_concurrency=8)
+
+    assert server.peak == 8
+    assert [b.title for b in blogs] == [f"Post {i}" for i in range(1, 21)]
+
+
+@pytest.mark.asyncio
+@patch("app.services.connectors.devto_connector.AdaptiveLimiter", FakeLimiter)
+async def test_every_request_acquires_and_releases_the_limiter():
+    server = DetailServer(5)
+
+    _, connector = await _fetch(server, detail_concurrency=3)
+
+    limiter = connector.limiter
+    assert limiter.max_limit == 3
+    # The listing plus one detail request per article
+    assert len(server.requests) == 6
+    assert limiter.calls.count("acquire") == limiter.calls.count("release") == limiter.calls.count("success") == 6
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+@patch("app.services.connectors.devto_connector.AdaptiveLimiter", FakeLimiter)
+async def test_throttled_detail_is_retried_after_retry_after():
+    server = DetailServer(6, throttled={2: "0.05"})
+
+    blogs, connector = await _fetch(server, detail_concurrency=4)
+
+    assert [b.markdown_content.split(" word")[0] for b in blogs] == [f"Body of {i}" for i in range(1, 7)]
+    assert server.requests.count("/api/articles/2") == 2
+    # The limiter is told to pause for the server's Retry-After
+    assert connector.limiter.delays == [0.05]
+    assert connector.limiter.calls.count("acquire") == connector.limiter.calls.count("release") == 8
+
+
+@pytest.mark.asyncio
+async def test_detail_is_skipped_when_retries_run_out():
+    server = DetailServer(2, throttled={1: "0"})
+
+    blogs, _ = await _fetch(server, max_retries=0)
+
+    # As with any failed detail request, the post is kept without its content
+    assert [(b.title, b.markdown_content is None) for b in blogs] == [("Post 1", True), ("Post 2", False)]
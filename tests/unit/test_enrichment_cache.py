@@ -0,0 +1,163 @@
+"""
+Description: Unit tests for the content-hash keyed enrichment cache.
+Why: Verifies that repeated and cross-posted content is enriched by the model only once.
+How: Uses an in-memory SimulatedFirestoreService as the cache store and an AsyncMock enrichment service.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.models.enrichment import Enrichment
+from app.services.enrichment_cache import CachedEnrichmentService, EnrichmentCacheService, enrichment_key
+from app.services.simulated_service import SimulatedFirestoreService
+
+RESULT = {"summary": "Describes Cloud Run", "tags": ["cloud-run", "gcp"]}
+
+
+def _store() -> SimulatedFirestoreService:
+    real_service = AsyncMock()
+    real_service.list.return_value = []
+    return SimulatedFirestoreService(real_service)
+
+
+def _model_service(result: dict = RESULT) -> AsyncMock:
+    service = AsyncMock()
+    service.enrich_content.return_value = result
+    return service
+
+
+def test_key_ignores_formatting_but_not_model_or_prompt():
+    markdown = "# Deploying to *Cloud Run*\n\nSee [the docs](https://cloud.google.com/run)."
+    plain = "Deploying to Cloud Run  See the docs https cloud google com run"
+
+    assert enrichment_key("gemini", markdown) == enrichment_key("gemini", plain)
+    assert enrichment_key("gemini", markdown) != enrichment_key("other-model", markdown)
+    assert enrichment_key("gemini", markdown) != enrichment_key("gemini", markdown, prompt_version="2")
+    assert enrichment_key("gemini", markdown) != enrichment_key("gemini", "Something else")
+
+
+@pytest.mark.asyncio
+async def test_repeated_content_is_served_from_cache():
+    store, model_service = _store(), _model_service()
+
+    first = CachedEnrichmentService(model_service, store, model="gemini")
+    assert await first.enrich_content("# Cloud Run") == RESULT
+    # A later run, e.g. a cross-post of the same article, reads the persisted enrichment
+    second = CachedEnrichmentService(model_service, store, model="gemini")
+    assert await second.enrich_content("Cloud Run") == RESULT
+
+    model_service.enrich_content.assert_awaited_once_with("# Cloud Run")
+    assert (first.misses, second.hits) == (1, 1)
+    cached = await store.get(enrichment_key("gemini", "Cloud Run"))
+    assert cached.summary == RESULT["summary"]
+    assert cached.last_used_at >= cached.created_at
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_content_shares_one_call():
+    model_service = _model_service()
+
+    async def slow_enrich(text):
+        await asyncio.sleep(0.01)
+        return RESULT
+
+    model_service.enrich_content.side_effect = slow_enrich
+    enricher = CachedEnrichmentService(model_service, _store(), model="gemini")
+
+    results = await asyncio.gather(*(enricher.enrich_content("Same post") for _ in range(3)))
+
+    assert results == [RESULT] * 3
+    assert model_service.enrich_content.await_count == 1
+    # Results are independent copies
+    results[0]["tags"].append("extra")
+    assert results[1]["tags"] == RESULT["tags"]
+
+
+@pytest.mark.asyncio
+async def test_incomplete_results_and_failures_are_not_cached():
+    store = _store()
+    model_service = _model_service({"summary": "raw model text", "tags": []})
+    enricher = CachedEnrichmentService(model_service, store, model="gemini")
+
+    await enricher.enrich_content("post")
+    model_service.enrich_content.side_effect = RuntimeError("quota")
+    with pytest.raises(RuntimeError):
+        await enricher.enrich_content("other post")
+    model_service.enrich_content.side_effect = None
+    model_service.enrich_content.return_value = RESULT
+
+    assert await enricher.enrich_content("other post") == RESULT
+    assert await store.list() != []
+    assert await store.get(enrichment_key("gemini", "post")) is None
+
+
+@pytest.mark.asyncio
+async def test_unavailable_cache_falls_back_to_model():
+    store = AsyncMock()
+    store.get.side_effect = RuntimeError("Firestore unavailable")
+    store.create.side_effect = RuntimeError("Firestore unavailable")
+    enricher = CachedEnrichmentService(_model_service(), store, model="gemini")
+
+    assert await enricher.enrich_content("post") == RESULT
+    assert enricher.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_hits_refresh_last_used_at_at_most_daily():
+    store = AsyncMock()
+    enricher = CachedEnrichmentService(_model_service(), store, model="gemini")
+    stale = Enrichment(
+        id="stale", **RESULT, model="gemini", prompt_version="1", last_used_at=datetime.now() - timedelta(days=2)
+    )
+    fresh = Enrichment(id="fresh", **RESULT, model="gemini", prompt_version="1")
+
+    store.get.return_value = stale
+    assert await enricher.enrich_content("old post") == RESULT
+    store.get.return_value = fresh
+    assert await enricher.enrich_content("new post") == RESULT
+
+    store.update_fields.assert_awaited_once()
+    assert store.update_fields.await_args.args[0] == enrichment_key("gemini", "old post")
+    store.update.assert_not_awaited()
+    assert enricher.hits == 2
+
+
+def _prune_db(count: int, doc_ids: list[str]) -> MagicMock:
+    mock_db = MagicMock()
+    collection = mock_db.collection.return_value
+    collection.count.return_value.get = AsyncMock(return_value=[[MagicMock(value=count)]])
+
+    async def stream():
+        for doc_id in doc_ids:
+            yield MagicMock(id=doc_id, reference=f"ref:{doc_id}")
+
+    collection.order_by.return_value.limit.return_value.select.return_value.stream.return_value = stream()
+    mock_db.batch.return_value.commit = AsyncMock()
+    return mock_db
+
+
+@pytest.mark.asyncio
+async def test_prune_evicts_least_recently_used():
+    mock_db = _prune_db(102, ["old1", "old2"])
+
+    assert await EnrichmentCacheService(mock_db).prune(100) == 2
+
+    collection = mock_db.collection.return_value
+    collection.order_by.assert_called_once_with("last_used_at", direction="ASCENDING")
+    collection.order_by.return_value.limit.assert_called_once_with(2)
+    batch = mock_db.batch.return_value
+    assert [c.args for c in batch.delete.call_args_list] == [("ref:old1",), ("ref:old2",)]
+    batch.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_prune_within_limit_reads_no_documents():
+    mock_db = _prune_db(100, [])
+
+    assert await EnrichmentCacheService(mock_db).prune(100) == 0
+
+    mock_db.collection.return_value.order_by.assert_not_called()
+    mock_db.batch.assert_not_called()
@@ -0,0 +1,123 @@
+"""
+Description: Unit tests for the AI enrichment scheduler.
+Why: Verifies bounded concurrency, rate limiting, retries of transient errors and in-order results.
+How: Drives the scheduler with SimulatedContentEnrichmentService and small AsyncMock stand-ins; no Gemini calls.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+from google.genai import errors
+
+from app.services.enrichment_scheduler import EnrichmentScheduler, TokenBucket, is_retryable, ordered_map
+from app.services.simulated_service import SimulatedContentEnrichmentService
+
+
+class CountingService:
+    """Records the most enrichment calls in flight at once."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.active = 0
+        self.peak = 0
+
+    async def enrich_content(self, text: str) -> dict:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.latency)
+        self.active -= 1
+        return {"summary": text, "tags": []}
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded_and_results_are_ordered():
+    service = CountingService(latency=0.01)
+    scheduler = EnrichmentScheduler(service, concurrency=3, requests_per_minute=0)
+
+    results = [
+        (item, result)
+        async for item, result, _ in ordered_map([str(i) for i in range(10)], scheduler.enrich_content, window=10)
+    ]
+
+    assert results == [(str(i), {"summary": str(i), "tags": []}) for i in range(10)]
+    assert service.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_simulated_enrichment_speeds_up_with_concurrency():
+    texts = ["post"] * 10
+
+    async def run(concurrency: int) -> float:
+        scheduler = EnrichmentScheduler(
+            SimulatedContentEnrichmentService(latency_seconds=0.02), concurrency=concurrency, requests_per_minute=0
+        )
+        start = time.perf_counter()
+        async for _ in ordered_map(texts, scheduler.enrich_content, window=concurrency):
+            pass
+        return time.perf_counter() - start
+
+    assert await run(10) * 3 < await run(1)
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried():
+    service = AsyncMock()
+    service.enrich_content.side_effect = [
+        errors.ClientError(429, {"error": {"message": "Resource exhausted"}}),
+        errors.ServerError(503, {"error": {"message": "Unavailable"}}),
+        {"summary": "ok", "tags": []},
+    ]
+    scheduler = EnrichmentScheduler(service, requests_per_minute=0, retry_base_seconds=0)
+
+    assert await scheduler.enrich_content("text") == {"summary": "ok", "tags": []}
+    assert service.enrich_content.await_count == 3
+    assert scheduler.retries == 2
+
+
+@pytest.mark.asyncio
+async def test_permanent_errors_and_exhausted_retries_are_raised():
+    service = AsyncMock()
+    service.enrich_content.side_effect = errors.ClientError(400, {"error": {"message": "Bad request"}})
+    scheduler = EnrichmentScheduler(service, requests_per_minute=0, max_retries=2, retry_base_seconds=0)
+
+    with pytest.raises(errors.ClientError):
+        await scheduler.enrich_content("text")
+    assert service.enrich_content.await_count == 1
+
+    service.enrich_content.side_effect = TimeoutError()
+    service.enrich_content.reset_mock()
+    with pytest.raises(TimeoutError):
+        await scheduler.enrich_content("text")
+    assert service.enrich_content.await_count == 3
+
+
+def test_is_retryable():
+    assert is_retryable(errors.ServerError(500, {}))
+    assert not is_retryable(errors.ClientError(404, {}))
+    assert not is_retryable(ValueError("bad JSON"))
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=100, capacity=1)
+
+    start = time.perf_counter()
+    for _ in range(4):
+        await bucket.acquire()
+
+    # The first token is available immediately; the next three wait 10ms each
+    assert time.perf_counter() - start >= 0.025
+
+
+@pytest.mark.asyncio
+async def test_ordered_map_reports_errors_per_item():
+    async def invert(n: int) -> float:
+        if n == 0:
+            raise ZeroDivisionError("zero")
+        return 1 / n
+
+    outcomes = [(item, error is not None) async for item, _, error in ordered_map([2, 0, 4], invert, window=2)]
+
+    assert outcomes == [(2, False), (0, True), (4, False)]
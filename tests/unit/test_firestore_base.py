@@ -4,7 +4,8 @@ Why: Verifies that generic Firestore service methods are callable and handle imp
 How: Uses mocks for Firestore client/collection/document.
 """
 
-from unittest.mock import MagicMock
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -45,3 +46,279 @@ async def test_firestore_service_create():
     except Exception:
         # We expect some failure if implementation is missing, but import failure is the "Red" signal here
         pass
+
+
+def _mock_db_with_docs(docs: list[dict]):
+    """Builds a mock Firestore client whose collection streams the given documents."""
+    mock_db = MagicMock()
+    mock_collection = mock_db.collection.return_value
+
+    def stream():
+        async def gen():
+            for d in docs:
+                snapshot = MagicMock()
+                snapshot.id = d["id"]
+                snapshot.to_dict.return_value = {k: v for k, v in d.items() if k != "id"}
+                yield snapshot
+
+        return gen()
+
+    mock_collection.stream.side_effect = stream
+    mock_collection.document.return_value.set = AsyncMock()
+    mock_collection.document.return_value.update = AsyncMock()
+    mock_collection.document.return_value.delete = AsyncMock()
+    mock_collection.document.return_value.get = AsyncMock(return_value=MagicMock(exists=False))
+    return mock_db, mock_collection
+
+
+@pytest.mark.asyncio
+async def test_list_served_from_cache_until_write():
+    from app.services.firestore_base import CollectionCache, FirestoreService
+
+    mock_db, mock_collection = _mock_db_with_docs([{"id": "p1", "title": "One", "description": "D"}])
+    cache = CollectionCache(ttl_seconds=60)
+    service = FirestoreService(db=mock_db, collection_name="projects", model_class=Project, cache=cache)
+
+    first = await service.list()
+    second = await service.list()
+
+    assert [p.id for p in first] == ["p1"]
+    assert second == first
+    assert mock_collection.stream.call_count == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+    # Each kind of write invalidates the snapshot
+    await service.create(Project(title="Two", description="D"), item_id="p2")
+    await service.list()
+    assert mock_collection.stream.call_count == 2
+
+    await service.update("p1", {"title": "Changed"})
+    await service.list()
+    assert mock_collection.stream.call_count == 3
+
+    await service.delete("p1")
+    await service.list()
+    assert mock_collection.stream.call_count == 4
+    assert cache.stats()["invalidations"] == 3
+
+
+@pytest.mark.asyncio
+async def test_cache_expires_after_ttl():
+    from app.services.firestore_base import CollectionCache, FirestoreService
+
+    mock_db, mock_collection = _mock_db_with_docs([{"id": "p1", "title": "One", "description": "D"}])
+    service = FirestoreService(
+        db=mock_db, collection_name="projects", model_class=Project, cache=CollectionCache(ttl_seconds=0)
+    )
+
+    await service.list()
+    await service.list()
+
+    assert mock_collection.stream.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_memory_bounds():
+    from app.services.firestore_base import CollectionCache
+
+    cache = CollectionCache(ttl_seconds=60, max_entries=2, max_items=3)
+
+    cache.put("too-big", [1, 2, 3, 4])
+    assert cache.get("too-big") is None
+
+    cache.put("a", [1])
+    cache.put("b", [2])
+    cache.get("a")  # "b" becomes least recently used
+    cache.put("c", [3])
+
+    assert cache.get("a") == (1,)
+    assert cache.get("b") is None
+    assert cache.get("c") == (3,)
+    assert cache.stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_are_coalesced():
+    import asyncio
+
+    from app.services.firestore_base import CollectionCache
+
+    cache = CollectionCache(ttl_seconds=60)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return ["item"]
+
+    results = await asyncio.gather(*(cache.get_or_load("list", loader) for _ in range(5)))
+
+    assert calls == 1
+    assert all(r == ["item"] for r in results)
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 4
+
+
+@pytest.mark.asyncio
+async def test_misses_for_different_keys_load_concurrently():
+    import asyncio
+
+    from app.services.firestore_base import CollectionCache
+
+    cache = CollectionCache(ttl_seconds=60)
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_loader():
+        started.set()
+        await release.wait()
+        return ["page"]
+
+    async def fast_loader():
+        return ["list"]
+
+    slow = asyncio.create_task(cache.get_or_load("page:a", slow_loader))
+    await started.wait()
+
+    # A miss for another key doesn't queue behind the load still in flight
+    assert await asyncio.wait_for(cache.get_or_load("list", fast_loader), timeout=1) == ["list"]
+    release.set()
+    assert await slow == ["page"]
+
+
+@pytest.mark.asyncio
+async def test_miss_after_invalidation_does_not_join_stale_load():
+    import asyncio
+
+    from app.services.firestore_base import CollectionCache
+
+    cache = CollectionCache(ttl_seconds=60)
+    release = asyncio.Event()
+
+    async def stale_loader():
+        await release.wait()
+        return ["old"]
+
+    async def fresh_loader():
+        return ["new"]
+
+    stale = asyncio.create_task(cache.get_or_load("list", stale_loader))
+    await asyncio.sleep(0)
+    cache.invalidate()
+
+    assert await cache.get_or_load("list", fresh_loader) == ["new"]
+    release.set()
+    assert await stale == ["old"]
+    # The stale load finished after the write, so it didn't replace the fresh snapshot
+    assert cache.get("list") == ("new",)
+
+
+@pytest.mark.asyncio
+async def test_list_json_encodes_once_per_snapshot():
+    import json
+    from unittest.mock import patch
+
+    from fastapi.encoders import jsonable_encoder
+
+    from app.services.firestore_base import CollectionCache, FirestoreService
+
+    mock_db, _ = _mock_db_with_docs([{"id": "p1", "title": "One", "description": "D", "created_at": "2026-01-01T10:00:00Z"}])
+    service = FirestoreService(db=mock_db, collection_name="projects", model_class=Project, cache=CollectionCache())
+
+    with patch.object(service, "_encode_list", wraps=service._encode_list) as encode:
+        first = await service.list_json()
+        second = await service.list_json()
+        assert encode.call_count == 1
+        assert second is first
+
+        # Body is identical to what the handlers previously produced per request
+        assert json.loads(first.body) == jsonable_encoder(await service.list())
+        assert first.etag.startswith('"') and first.etag.endswith('"')
+
+        await service.update("p1", {"title": "Changed"})
+        await service.list_json()
+        assert encode.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_unchanged_body_keeps_last_modified_across_invalidation():
+    from app.services.firestore_base import CollectionCache, FirestoreService
+
+    mock_db, _ = _mock_db_with_docs([{"id": "p1", "title": "One", "description": "D", "created_at": "2026-01-01T10:00:00Z"}])
+    service = FirestoreService(db=mock_db, collection_name="projects", model_class=Project, cache=CollectionCache())
+
+    first = await service.list_json()
+    service.cache.invalidate()
+    second = await service.list_json()
+
+    assert second.etag == first.etag
+    assert second.last_modified == first.last_modified
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_batches_writes():
+    from app.services.firestore_base import CollectionCache, FirestoreService
+
+    mock_db = MagicMock()
+    batches = []
+
+    def new_batch():
+        batch = MagicMock()
+        batch.commit = AsyncMock(side_effect=RuntimeError("quota") if len(batches) == 1 else None)
+        batches.append(batch)
+        return batch
+
+    mock_db.batch.side_effect = new_batch
+    service = FirestoreService(db=mock_db, collection_name="projects", model_class=Project, cache=CollectionCache())
+    service.cache.put("list", [])
+
+    items = [Project(id=item_id, title=item_id, description="d") for item_id in ("a", "b", "c", "a", "d")]
+    items.insert(2, Project(title="No ID", description="d"))
+    results = await service.bulk_upsert(items, batch_size=3)
+
+    # [a, b, c] fills a batch; the repeated "a" starts the next one with "d"
+    assert [batch.set.call_count for batch in batches] == [3, 2]
+    assert mock_db.batch.call_count == 2
+    data = batches[0].set.call_args_list[0].args[1]
+    assert "id" not in data
+    assert batches[0].set.call_args_list[0].kwargs == {"merge": True}
+    assert [(r.id, r.error) for r in results] == [
+        ("a", None),
+        ("b", None),
+        (None, "Item has no ID"),
+        ("c", None),
+        ("a", "quota"),
+        ("d", "quota"),
+    ]
+    assert service.cache.get("list") is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_skips_unchanged_content():
+    from app.services.firestore_base import CollectionCache, FirestoreService, content_fingerprint
+
+    mock_db = MagicMock()
+    mock_db.batch.return_value.commit = AsyncMock()
+    service = FirestoreService(db=mock_db, collection_name="projects", model_class=Project, cache=CollectionCache())
+    stored = Project(id="p1", title="Tool", description="d")
+    fingerprints = {"p1": content_fingerprint(stored)}
+
+    # The ID and created_at are not content
+    same = Project(id="p1", title="Tool", description="d", created_at=datetime(2020, 1, 1))
+    service.cache.put("list", [])
+    results = await service.bulk_upsert([same], fingerprints=fingerprints)
+
+    assert results[0].unchanged and results[0].ok
+    assert same.fingerprint == fingerprints["p1"]
+    mock_db.batch.assert_not_called()
+    assert service.cache.get("list") == ()
+
+    edited = Project(id="p1", title="Tool", description="edited")
+    results = await service.bulk_upsert([edited], fingerprints=fingerprints)
+
+    assert not results[0].unchanged
+    data = mock_db.batch.return_value.set.call_args.args[1]
+    assert data["fingerprint"] == content_fingerprint(edited) != fingerprints["p1"]
+    assert service.cache.get("list") is None
@@ -1,7 +1,8 @@
 """
 Description: Unit tests for GitHub Connector.
 Why: Verifies that the GitHub connector correctly fetches repositories and maps them to Project models.
-How: Mocks httpx.AsyncClient responses and asserts on the resulting Project objects.
+How: Mocks httpx.AsyncClient responses and asserts on the resulting Project objects. Pagination and ETag
+     revalidation use an httpx.MockTransport server and an in-memory HTTP cache.
 """
 
 from datetime import UTC, datetime
@@ -10,7 +11,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 import pytest
 
-from app.services.connectors.github_connector import GitHubConnector
+from app.services.connectors.github_connector import REPO_FIELDS, GitHubConnector
+from app.services.simulated_service import SimulatedFirestoreService
 
 
 @pytest.mark.asyncio
@@ -49,6 +51,7 @@ async def test_fetch_repositories():
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
         mock_response.json.return_value = mock_repos
+        mock_response.links = {}
         mock_get.return_value = mock_response
 
         projects = await connector.fetch_repositories("testuser")
@@ -64,3 +67,68 @@ async def test_fetch_repositories():
         assert project.stargazers_count == 10
         assert project.created_at == datetime(2023, 1, 1, 12, 0, 0, tzinfo=UTC)
         assert project.updated_at == datetime(2023, 1, 2, 12, 0, 0, tzinfo=UTC)
+
+
+class PagedRepoServer:
+    """A mock GitHub API serving `count` repositories 100 per page, with an ETag per page that honours If-None-Match."""
+
+    def __init__(self, count: int):
+        self.repos = [
+            {"name": f"repo-{i}", "html_url": f"https://github.com/user/repo-{i}", "private": False, "owner": {}}
+            for i in range(count)
+        ]
+        self.version = 1
+        self.statuses: list[int] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", "1"))
+        per_page = int(request.url.params["per_page"])
+        etag = f'W/"page-{page}-v{self.version}"'
+        if request.headers.get("If-None-Match") == etag:
+            self.statuses.append(304)
+            return httpx.Response(304, headers={"ETag": etag})
+
+        headers = {"ETag": etag}
+        if page * per_page < len(self.repos):
+            next_url = request.url.copy_set_param("page", page + 1)
+            headers["Link"] = f'<{next_url}>; rel="next"'
+        self.statuses.append(200)
+        return httpx.Response(200, json=self.repos[(page - 1) * per_page : page * per_page], headers=headers)
+
+
+def _http_cache() -> SimulatedFirestoreService:
+    real_service = AsyncMock()
+    real_service.list.return_value = []
+    return SimulatedFirestoreService(real_service)
+
+
+@pytest.mark.asyncio
+async def test_fetch_repositories_follows_pagination_and_revalidates_pages():
+    server, cache = PagedRepoServer(150), _http_cache()
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+        first = await GitHubConnector(client=client, cache=cache).fetch_repositories("user")
+        connector = GitHubConnector(client=client, cache=cache)
+        second = await connector.fetch_repositories("user")
+
+    assert len(first) == 150
+    assert [p.title for p in second] == [p.title for p in first]
+    assert server.statuses == [200, 200, 304, 304]
+    assert (connector.pages, connector.not_modified) == (2, 2)
+    # Only the fields used by the mapping are cached
+    (entry, _) = await cache.list()
+    assert set(entry.data[0]) == set(REPO_FIELDS)
+
+
+@pytest.mark.asyncio
+async def test_changed_page_is_downloaded_again():
+    server, cache = PagedRepoServer(150), _http_cache()
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+        await GitHubConnector(client=client, cache=cache).fetch_repositories("user")
+        server.version = 2
+        server.repos[0]["description"] = "Now described"
+        projects = await GitHubConnector(client=client, cache=cache).fetch_repositories("user")
+
+    assert server.statuses[2:] == [200, 200]
+    assert projects[0].description == "Now described"
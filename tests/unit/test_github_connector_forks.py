@@ -42,6 +42,7 @@ async def test_fetch_repositories_filters_forks():
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
         mock_response.json.return_value = mock_repos
+        mock_response.links = {}
         mock_get.return_value = mock_response
 
         projects = await connector.fetch_repositories("testuser")
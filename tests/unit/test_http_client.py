@@ -0,0 +1,143 @@
+"""
+Description: Unit tests for the shared ingestion HTTP client.
+Why: Verifies that connectors reuse an injected client instead of opening their own, and that the ingest run closes it.
+     Also covers Retry-After parsing and the adaptive limiter that backs off when an API throttles requests.
+How: Injects an httpx.AsyncClient backed by httpx.MockTransport and counts the requests it serves.
+"""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.services.connectors.devto_connector import DevToConnector
+from app.services.connectors.github_connector import GitHubConnector
+from app.services.http_client import AdaptiveLimiter, borrow_client, create_http_client, retry_after_seconds
+from app.tools.ingest import ingest_resources
+
+
+def _devto_handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/api/articles":
+        articles = [
+            {"id": i, "title": f"Post {i}", "url": f"https://dev.to/u/post-{i}", "published_at": "2026-01-01T10:00:00Z"}
+            for i in range(1, 4)
+        ]
+        return httpx.Response(200, json=articles)
+    return httpx.Response(200, json={"body_markdown": "word " * 250})
+
+
+def test_client_is_configured_from_settings():
+    client = create_http_client()
+
+    assert client.timeout.connect == settings.http_client_connect_timeout_seconds
+    assert client.timeout.read == settings.http_client_timeout_seconds
+
+
+@pytest.mark.asyncio
+async def test_borrowed_client_is_left_open():
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_devto_handler)) as client:
+        async with borrow_client(client) as borrowed:
+            assert borrowed is client
+        assert not client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_connector_requests_share_the_injected_client():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return _devto_handler(request)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        blogs = await DevToConnector(client=client).fetch_posts("u")
+        # The client stays usable by the next connector
+        assert not client.is_closed
+
+    assert [b.title for b in blogs] == ["Post 1", "Post 2", "Post 3"]
+    assert requests == ["/api/articles", "/api/articles/1", "/api/articles/2", "/api/articles/3"]
+
+
+@pytest.mark.asyncio
+@patch("app.tools.ingest.GitHubConnector")
+@patch("app.tools.ingest.ProjectService")
+@patch("app.tools.ingest.BlogService")
+@patch("app.tools.ingest.ApplicationService")
+@patch("app.tools.ingest.VideoService")
+@patch("app.tools.ingest.firestore.AsyncClient")
+async def test_ingest_closes_the_shared_client(
+    mock_firestore, mock_video_service, mock_app_service, mock_blog_service, mock_project_service, mock_github
+):
+    for service in (mock_video_service, mock_app_service, mock_blog_service, mock_project_service):
+        service.return_value.list = AsyncMock(return_value=[])
+    mock_github.return_value.fetch_repositories = AsyncMock(return_value=[])
+    clients = []
+
+    def create():
+        clients.append(httpx.AsyncClient(transport=httpx.MockTransport(_devto_handler)))
+        return clients[-1]
+
+    with patch("app.tools.ingest.create_http_client", side_effect=create):
+        await ingest_resources("u", None, None, None, None, None, "project")
+
+    (client,) = clients
+    assert mock_github.call_args.kwargs["client"] is client
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_connector_without_client_uses_a_temporary_one():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=[]))
+
+    with patch("app.services.http_client.create_http_client", return_value=httpx.AsyncClient(transport=transport)):
+        assert await GitHubConnector().fetch_repositories("u") == []
+
+
+def test_retry_after_accepts_seconds_and_dates():
+    in_a_minute = format_datetime(datetime.now(UTC) + timedelta(seconds=60), usegmt=True)
+
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "2.5"})) == 2.5
+    delay = retry_after_seconds(httpx.Response(429, headers={"Retry-After": in_a_minute}))
+    assert delay is not None and 55 < delay <= 60
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "soon"})) is None
+    assert retry_after_seconds(httpx.Response(429)) is None
+
+
+@pytest.mark.asyncio
+async def test_limiter_pauses_and_backs_off_when_throttled():
+    limiter = AdaptiveLimiter(4)
+
+    limiter.on_throttled(0.05)
+    assert limiter.limit == 2
+    start = time.perf_counter()
+    async with limiter:
+        pass
+    assert time.perf_counter() - start >= 0.04
+
+    # Additive increase: a run of `limit` successes raises the limit by one, up to the maximum
+    for _ in range(2 + 3):
+        limiter.on_success()
+    assert limiter.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_limiter_caps_requests_in_flight():
+    limiter = AdaptiveLimiter(2)
+    active = peak = 0
+
+    async def request():
+        nonlocal active, peak
+        async with limiter:
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(request() for _ in range(6)))
+
+    assert peak == 2
@@ -10,6 +10,7 @@ from typer.testing import CliRunner
 
 runner = CliRunner()
 
+
 YAML_CONTENT_APPS = """
 applications:
   - title: "My Awesome App"
@@ -23,11 +24,10 @@ applications:
 @patch("app.tools.ingest.ApplicationService")
 @patch("app.tools.ingest.BlogService")
 @patch("app.tools.ingest.firestore.AsyncClient")
-def test_ingest_applications_yaml(mock_firestore, mock_blog_service, mock_app_service):
+def test_ingest_applications_yaml(mock_firestore, mock_blog_service, mock_app_service, saved_bulk_upsert):
     mock_app_svc = mock_app_service.return_value
-    mock_app_svc.create = AsyncMock()
+    mock_app_svc.bulk_upsert = AsyncMock(side_effect=saved_bulk_upsert)
     mock_app_svc.list = AsyncMock(return_value=[])
-    mock_app_svc.update = AsyncMock()
 
     mock_blog_svc = mock_blog_service.return_value
     mock_blog_svc.list = AsyncMock(return_value=[])
@@ -43,9 +43,8 @@ def test_ingest_applications_yaml(mock_firestore, mock_blog_service, mock_app_se
     assert "Found 1 manual applications" in result.stdout
 
     # Verify Application creation calls
-    assert mock_app_svc.create.call_count == 1
-    call_args = mock_app_svc.create.call_args_list[0]
-    app_obj, _ = call_args[0][0], call_args[1]
+    assert mock_app_svc.bulk_upsert.call_count == 1
+    (app_obj,) = mock_app_svc.bulk_upsert.call_args.args[0]
 
     assert app_obj.title == "My Awesome App"
     assert app_obj.featured is True
@@ -63,7 +62,7 @@ def test_ingest_applications_yaml(mock_firestore, mock_blog_service, mock_app_se
     pass
 
 
-def test_slugify_trailing_slash():
+def test_slugify_trailing_slash(saved_bulk_upsert):
     # We can't import slugify directly easily if it's not exported or if we want to test the full flow
     # So we'll test via the app invocation with a new YAML
     YAML_TRAILING = """
@@ -75,7 +74,7 @@ applications:
     from unittest.mock import MagicMock
 
     mock_app_svc = MagicMock()
-    mock_app_svc.create = AsyncMock()
+    mock_app_svc.bulk_upsert = AsyncMock(side_effect=saved_bulk_upsert)
     mock_app_svc.list = AsyncMock(return_value=[])
 
     from app.tools.ingest import app
@@ -89,16 +88,16 @@ applications:
         result = runner.invoke(app, ["--yaml-file", "trailing.yaml"])
 
     assert result.exit_code == 0
-    call_args = mock_app_svc.create.call_args
+    (saved,) = mock_app_svc.bulk_upsert.call_args.args[0]
     # item_id should not be empty or random
     # https://trailing.com/ -> split -> trailing.com -> slugify -> trailing-com
-    assert call_args[1]["item_id"] == "application:trailing-com"
+    assert saved.id == "application:trailing-com"
 
 
 @patch("app.tools.ingest.ApplicationService")
 @patch("app.tools.ingest.BlogService")
 @patch("app.tools.ingest.firestore.AsyncClient")
-def test_ingest_applications_validation_error(mock_firestore, mock_blog_service, mock_app_service):
+def test_ingest_applications_validation_error(mock_firestore, mock_blog_service, mock_app_service, saved_bulk_upsert):
     # Missing demo_url for an application
     YAML_INVALID = """
 applications:
@@ -106,7 +105,7 @@ applications:
     description: "Missing demo url"
 """
     mock_app_svc = mock_app_service.return_value
-    mock_app_svc.create = AsyncMock()
+    mock_app_svc.bulk_upsert = AsyncMock(side_effect=saved_bulk_upsert)
     mock_app_svc.list = AsyncMock(return_value=[])
 
     mock_blog_svc = mock_blog_service.return_value
@@ -119,4 +118,4 @@ applications:
 
     # Should report error about missing demo_url
     assert "missing the required 'demo_url'" in result.stdout
-    assert mock_app_svc.create.call_count == 0
+    mock_app_svc.bulk_upsert.assert_not_called()
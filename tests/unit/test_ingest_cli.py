@@ -30,6 +30,7 @@ def test_ingest_command(
     mock_devto,
     mock_medium,
     mock_github,
+    saved_bulk_upsert,
 ):
     from app.models.blog import Blog
     from app.models.project import Project
@@ -69,14 +70,14 @@ def test_ingest_command(
     mock_dev_instance.fetch_posts = AsyncMock(return_value=[])
 
     mock_proj_svc_instance = mock_project_service.return_value
-    mock_proj_svc_instance.create = AsyncMock()
+    mock_proj_svc_instance.bulk_upsert = AsyncMock(side_effect=saved_bulk_upsert)
     mock_proj_svc_instance.list = AsyncMock(return_value=[])  # Mock existing items check if implemented
 
     mock_app_svc_instance = mock_application_service.return_value
     mock_app_svc_instance.list = AsyncMock(return_value=[])
 
     mock_blog_svc_instance = mock_blog_service.return_value
-    mock_blog_svc_instance.create = AsyncMock()
+    mock_blog_svc_instance.bulk_upsert = AsyncMock(side_effect=saved_bulk_upsert)
     mock_blog_svc_instance.list = AsyncMock(return_value=[])
 
     mock_content_svc_instance = mock_content_service.return_value
@@ -87,20 +88,18 @@ def test_ingest_command(
 
     assert result.exit_code == 0
     mock_gh_instance.fetch_repositories.assert_called_once_with("testuser")
-    mock_med_instance.fetch_posts.assert_called_once_with("testuser")
+    mock_med_instance.fetch_posts.assert_called_once_with("testuser", existing_urls=set())
     mock_dev_instance.fetch_posts.assert_called_once_with("testuser", existing_urls=set())
 
-    # Verify GitHub create called with slug
-    # We expect create(project, item_id="github:test-repo")
-    args, kwargs = mock_proj_svc_instance.create.call_args
-    assert args[0].title == "Test Repo"
-    assert kwargs.get("item_id") == "github:test-repo"
+    # Verify GitHub project saved with slug "github:test-repo"
+    (project,) = mock_proj_svc_instance.bulk_upsert.call_args.args[0]
+    assert project.title == "Test Repo"
+    assert project.id == "github:test-repo"
 
-    # Verify Medium create called with slug
-    # We expect create(blog, item_id="medium:test-blog")
-    args, kwargs = mock_blog_svc_instance.create.call_args
-    assert args[0].title == "Test Blog"
-    assert kwargs["item_id"] == "medium:test-blog"
+    # Verify Medium blog saved with slug "medium:test-blog"
+    (blog,) = mock_blog_svc_instance.bulk_upsert.call_args.args[0]
+    assert blog.title == "Test Blog"
+    assert blog.id == "medium:test-blog"
 
 
 def test_ingest_command_no_args():
@@ -191,10 +190,62 @@ def test_ingest_simulate_mode(
     assert "AFTER SNAPSHOT" in result.stdout
     assert "AI Enriched:" in result.stdout
 
-    # Real service create shouldn't be called because SimulatedService intercepts it
+    # Real service writes shouldn't be called because SimulatedService intercepts them
     mock_proj_svc_instance.create.assert_not_called()
     mock_blog_svc_instance.create.assert_not_called()
+    mock_proj_svc_instance.bulk_upsert.assert_not_called()
+    mock_blog_svc_instance.bulk_upsert.assert_not_called()
 
     # The real enrichment service should not have been called
     mock_enrichment_instance = mock_enrichment_service.return_value
     mock_enrichment_instance.enrich_content.assert_not_called()
+
+
+@patch("app.tools.ingest.GitHubConnector")
+@patch("app.tools.ingest.ProjectService")
+@patch("app.tools.ingest.BlogService")
+@patch("app.tools.ingest.ApplicationService")
+@patch("app.tools.ingest.ContentService")
+@patch("app.tools.ingest.firestore.AsyncClient")
+def test_ingest_reports_unchanged_projects(
+    mock_firestore_client,
+    mock_content_service,
+    mock_application_service,
+    mock_blog_service,
+    mock_project_service,
+    mock_github,
+    saved_bulk_upsert,
+):
+    from app.models.project import Project
+    from app.services.firestore_base import content_fingerprint
+    from app.tools.ingest import app
+
+    def fetched():
+        return Project(
+            title="Test Repo",
+            description="Desc",
+            repo_url="http://gh.com/repo",
+            source_platform="github",
+            is_manual=False,
+        )
+
+    stored = fetched().model_copy(update={"id": "github:test-repo"})
+    stored.fingerprint = content_fingerprint(stored)
+    mock_github.return_value.fetch_repositories = AsyncMock(return_value=[fetched()])
+    mock_project_service.return_value.list = AsyncMock(return_value=[stored])
+    mock_project_service.return_value.bulk_upsert = AsyncMock(side_effect=saved_bulk_upsert)
+    for service in (mock_application_service, mock_blog_service, mock_content_service):
+        service.return_value.list = AsyncMock(return_value=[])
+
+    result = runner.invoke(app, ["--github-user", "testuser"])
+
+    assert result.exit_code == 0
+    assert mock_project_service.return_value.bulk_upsert.call_args.kwargs["fingerprints"] == {
+        "github:test-repo": stored.fingerprint
+    }
+    # Run against the simulated store, which honours fingerprints like Firestore does
+    result = runner.invoke(app, ["--github-user", "testuser", "--simulate"])
+
+    assert result.exit_code == 0
+    assert "Unchanged: 1" in result.stdout
+    assert "Updated/Patched" not in result.stdout
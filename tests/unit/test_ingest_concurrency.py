@@ -0,0 +1,118 @@
+"""
+Description: Unit tests for the concurrent source fetches in ingest_resources.
+Why: Verifies that the GitHub, Medium RSS and Dev.to fetches overlap, that a failed fetch only affects its source,
+     and that a failed stage cancels the fetches still running.
+How: Mocks connectors whose fetches wait until all of them have started, and in-memory service mocks.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.models.blog import Blog
+from app.models.project import Project
+from app.tools.ingest import ingest_resources
+
+
+def _blog(title: str, platform: str, url: str) -> Blog:
+    return Blog(title=title, summary="Sum", date="2026-01-01", platform=platform, url=url, is_manual=False)
+
+
+@pytest.mark.asyncio
+@patch("app.tools.ingest.GitHubConnector")
+@patch("app.tools.ingest.MediumConnector")
+@patch("app.tools.ingest.DevToConnector")
+@patch("app.tools.ingest.ProjectService")
+@patch("app.tools.ingest.BlogService")
+@patch("app.tools.ingest.ApplicationService")
+@patch("app.tools.ingest.ContentService")
+@patch("app.tools.ingest.VideoService")
+@patch("app.tools.ingest.ContentEnrichmentService")
+@patch("app.tools.ingest.firestore.AsyncClient")
+async def test_source_fetches_run_concurrently(
+    mock_firestore_client,
+    mock_enrichment_service,
+    mock_video_service,
+    mock_content_service,
+    mock_application_service,
+    mock_blog_service,
+    mock_project_service,
+    mock_devto,
+    mock_medium,
+    mock_github,
+    capsys,
+    saved_bulk_upsert,
+):
+    started = []
+    all_started = asyncio.Event()
+
+    def fetch(name, result):
+        async def wait_for_others(*args, **kwargs):
+            started.append(name)
+            if len(started) == 3:
+                all_started.set()
+            # Deadlocks (and times out) if the fetches are awaited one after another
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        return AsyncMock(side_effect=wait_for_others)
+
+    mock_github.return_value.fetch_repositories = fetch(
+        "github", [Project(title="Repo", description="d", repo_url="https://github.com/u/repo", is_manual=False)]
+    )
+    mock_medium.return_value.fetch_posts = fetch("medium", RuntimeError("feed unavailable"))
+    mock_devto.return_value.fetch_posts = fetch("devto", [_blog("Post", "Dev.to", "https://dev.to/u/post")])
+    for service in (mock_project_service, mock_blog_service, mock_application_service, mock_video_service):
+        service.return_value.list = AsyncMock(return_value=[])
+        service.return_value.bulk_upsert = AsyncMock(side_effect=saved_bulk_upsert)
+    mock_enrichment_service.return_value.enrich_content = AsyncMock(return_value={"summary": "AI", "tags": []})
+
+    await ingest_resources("u", "u", None, "u", None, None, "project")
+
+    assert sorted(started) == ["devto", "github", "medium"]
+    # The failed Medium fetch doesn't stop the other sources being saved
+    (project,) = mock_project_service.return_value.bulk_upsert.call_args.args[0]
+    assert project.id == "github:repo"
+    (blog,) = mock_blog_service.return_value.bulk_upsert.call_args.args[0]
+    assert blog.id == "devto:post"
+
+    output = capsys.readouterr().out
+    assert "Error fetching Medium RSS" in output
+    assert "Fetch GitHub:" in output
+    assert "Total:" in output
+
+
+@pytest.mark.asyncio
+@patch("app.tools.ingest._migrate_existing_items", new_callable=AsyncMock)
+@patch("app.tools.ingest.DevToConnector")
+@patch("app.tools.ingest.BlogService")
+@patch("app.tools.ingest.firestore.AsyncClient")
+async def test_failed_stage_cancels_pending_fetches(mock_firestore_client, mock_blog_service, mock_devto, mock_migrate):
+    fetching, cancelled = asyncio.Event(), asyncio.Event()
+    run = asyncio.current_task()
+
+    async def never_finishes(*args, **kwargs):
+        fetching.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def list_blogs():
+        if asyncio.current_task() is not run:
+            return []
+        # The Medium section reads the stored blogs while the Dev.to fetch is still in flight
+        await fetching.wait()
+        raise RuntimeError("Firestore unavailable")
+
+    mock_devto.return_value.fetch_posts = AsyncMock(side_effect=never_finishes)
+    mock_blog_service.return_value.list = AsyncMock(side_effect=list_blogs)
+
+    with pytest.raises(RuntimeError, match="Firestore unavailable"):
+        await ingest_resources(None, None, "posts.zip", "u", None, None, "project")
+
+    assert cancelled.is_set()
@@ -9,7 +9,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from app.models.blog import Blog
-from app.tools.ingest import ingest_resources
+from app.tools.ingest import ingest_resources, normalize_url
 
 
 @pytest.mark.asyncio
@@ -28,6 +28,7 @@ async def test_medium_hybrid_logic(
     mock_archive_connector,
     mock_rss_connector,
     mock_zipfile,
+    saved_bulk_upsert,
 ):
     # Mock ZipFile to pass the file count check
     mock_zip = mock_zipfile.return_value.__enter__.return_value
@@ -83,8 +84,7 @@ async def test_medium_hybrid_logic(
 
     mock_blog_svc_instance = mock_blog_service.return_value
     mock_blog_svc_instance.list = AsyncMock(return_value=[])
-    mock_blog_svc_instance.create = AsyncMock()
-    mock_blog_svc_instance.update = AsyncMock()
+    mock_blog_svc_instance.bulk_upsert = AsyncMock(side_effect=saved_bulk_upsert)
 
     # Run ingestion for Medium
     await ingest_resources(
@@ -97,12 +97,9 @@ async def test_medium_hybrid_logic(
         project_id="test-project",
     )
 
-    # Verify create calls
-    # We expect 2 create calls
-    assert mock_blog_svc_instance.create.call_count == 2
-
-    # Get created blogs from call arguments
-    created_blogs = [call.args[0] for call in mock_blog_svc_instance.create.call_args_list]
+    # Get saved blogs from the batched writes; we expect 2
+    created_blogs = [blog for call in mock_blog_svc_instance.bulk_upsert.call_args_list for blog in call.args[0]]
+    assert len(created_blogs) == 2
 
     # Check the merged blog (RSS + Archive)
     merged_blog = next(b for b in created_blogs if b.url == "http://medium.com/test")
@@ -116,3 +113,57 @@ async def test_medium_hybrid_logic(
     archive_only = next(b for b in created_blogs if b.url == "http://medium.com/archive-only")
     assert archive_only.title == "Archive Only"
     assert archive_only.summary == "Archive AI Summary"  # AI Summary
+
+
+@pytest.mark.asyncio
+@patch("app.tools.ingest.zipfile.ZipFile")
+@patch("app.tools.ingest.MediumConnector")
+@patch("app.tools.ingest.MediumArchiveConnector")
+@patch("app.tools.ingest.BlogService")
+@patch("app.tools.ingest.firestore.AsyncClient")
+@patch("app.tools.ingest.ContentEnrichmentService")
+async def test_large_archive_merge_is_linear(
+    mock_enrichment_service,
+    mock_firestore,
+    mock_blog_service,
+    mock_archive_connector,
+    mock_rss_connector,
+    mock_zipfile,
+    saved_bulk_upsert,
+):
+    count = 2000
+    mock_zipfile.return_value.__enter__.return_value.namelist.return_value = [f"posts/{i}.html" for i in range(count)]
+
+    def blog(i: int, source: str, url_suffix: str = "") -> Blog:
+        return Blog(
+            title=f"{source} {i}",
+            summary="Summary",
+            date="2026-01-01",
+            platform="Medium",
+            url=f"https://medium.com/@user/post-{i}{url_suffix}",
+            source_platform=source,
+            is_manual=False,
+            ai_summary="AI Summary",
+        )
+
+    # The feed lists the posts newest first, with tracking parameters on its links
+    mock_rss_connector.return_value.fetch_posts = AsyncMock(
+        return_value=[blog(i, "medium_rss", "?source=rss") for i in reversed(range(count))]
+    )
+
+    async def archive_posts(*args, **kwargs):
+        for i in range(count):
+            yield "processed", blog(i, "medium_archive"), f"posts/{i}.html"
+
+    mock_archive_connector.return_value.fetch_posts = archive_posts
+    mock_blog_service.return_value.list = AsyncMock(return_value=[])
+    mock_blog_service.return_value.bulk_upsert = AsyncMock(side_effect=saved_bulk_upsert)
+
+    with patch("app.tools.ingest.normalize_url", wraps=normalize_url) as normalize:
+        await ingest_resources(None, "user", "medium.zip", None, None, None, "project")
+
+    saved = [b for call in mock_blog_service.return_value.bulk_upsert.call_args_list for b in call.args[0]]
+    assert len(saved) == count
+    assert all(b.title == f"medium_rss {b.url.rsplit('-', 1)[1]}" for b in saved)
+    # A constant number of normalisations per post, rather than one per (archive post, RSS post) pair
+    assert normalize.call_count <= 4 * count
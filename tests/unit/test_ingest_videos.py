@@ -10,6 +10,7 @@ from typer.testing import CliRunner
 
 runner = CliRunner()
 
+
 YAML_CONTENT_VIDEOS = """
 videos:
   - title: "Cool YouTube Tutorial"
@@ -25,11 +26,12 @@ videos:
 @patch("app.tools.ingest.BlogService")
 @patch("app.tools.ingest.ProjectService")
 @patch("app.tools.ingest.firestore.AsyncClient")
-def test_ingest_videos_yaml(mock_firestore, mock_project_service, mock_blog_service, mock_app_service, mock_video_service):
+def test_ingest_videos_yaml(
+    mock_firestore, mock_project_service, mock_blog_service, mock_app_service, mock_video_service, saved_bulk_upsert
+):
     mock_video_svc = mock_video_service.return_value
-    mock_video_svc.create = AsyncMock()
+    mock_video_svc.bulk_upsert = AsyncMock(side_effect=saved_bulk_upsert)
     mock_video_svc.list = AsyncMock(return_value=[])
-    mock_video_svc.update = AsyncMock()
 
     # Other services need to return empty lists for migration pass
     mock_app_service.return_value.list = AsyncMock(return_value=[])
@@ -43,12 +45,10 @@ def test_ingest_videos_yaml(mock_firestore, mock_project_service, mock_blog_serv
 
     assert result.exit_code == 0
     assert "Found 1 manual videos" in result.stdout
-    assert mock_video_svc.create.call_count == 1
+    assert mock_video_svc.bulk_upsert.call_count == 1
 
-    call_args = mock_video_svc.create.call_args
-    video_obj = call_args[0][0]
-    item_id = call_args[1]["item_id"]
+    (video_obj,) = mock_video_svc.bulk_upsert.call_args.args[0]
 
     assert video_obj.title == "Cool YouTube Tutorial"
     assert video_obj.source_platform == "youtube"
-    assert item_id == "youtube:dQw4w9WgXcQ"
+    assert video_obj.id == "youtube:dQw4w9WgXcQ"
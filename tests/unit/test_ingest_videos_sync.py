@@ -10,6 +10,7 @@ import pytest
 from typer.testing import CliRunner
 
 from app.models.video import Video
+from app.services.firestore_base import BulkWriteResult
 
 runner = CliRunner()
 
@@ -22,6 +23,7 @@ def mock_video_svc():
         svc.update = AsyncMock()
         svc.delete = AsyncMock()
         svc.create = AsyncMock()
+        svc.bulk_upsert = AsyncMock(side_effect=lambda items, **kwargs: [BulkWriteResult(id=item.id) for item in items])
         yield svc
 
 
@@ -76,9 +78,10 @@ def test_ingest_videos_replacement_detection(
 
     assert result.exit_code == 0
     assert mock_confirm.called
-    # With improved logic, replacement calls create (new ID) and delete (old ID)
-    assert mock_video_svc.create.called
-    assert mock_video_svc.delete.called
+    # With improved logic, replacement saves the new ID, then deletes the old ID
+    (saved,) = mock_video_svc.bulk_upsert.call_args.args[0]
+    assert saved.id == "youtube:newIDxyz456"
+    mock_video_svc.delete.assert_awaited_once_with("youtube:oldIDabc123")
     assert not mock_video_svc.update.called
 
 
@@ -10,6 +10,7 @@ from typer.testing import CliRunner
 
 runner = CliRunner()
 
+
 YAML_CONTENT = """
 projects:
   - id: explicit-proj-id
@@ -46,10 +47,10 @@ blogs:
 @patch("app.tools.ingest.ProjectService")
 @patch("app.tools.ingest.BlogService")
 @patch("app.tools.ingest.firestore.AsyncClient")
-def test_ingest_yaml(mock_firestore, mock_blog_service, mock_project_service):
+def test_ingest_yaml(mock_firestore, mock_blog_service, mock_project_service, saved_bulk_upsert):
     # Setup mocks
     mock_proj_svc = mock_project_service.return_value
-    mock_proj_svc.create = AsyncMock()
+    mock_proj_svc.bulk_upsert = AsyncMock(side_effect=saved_bulk_upsert)
 
     # Mock existing projects with duplicates for Ambiguous Project
     from app.models.project import Project
@@ -60,12 +61,10 @@ def test_ingest_yaml(mock_firestore, mock_blog_service, mock_project_service):
             Project(title="Ambiguous Project", description="Desc", id="dup-2"),
         ]
     )
-    mock_proj_svc.update = AsyncMock()
 
     mock_blog_svc = mock_blog_service.return_value
-    mock_blog_svc.create = AsyncMock()
+    mock_blog_svc.bulk_upsert = AsyncMock(side_effect=saved_bulk_upsert)
     mock_blog_svc.list = AsyncMock(return_value=[])
-    mock_blog_svc.update = AsyncMock()
 
     # Import app inside to ensure mocks are applied if needed, though patch handles it
     from app.tools.ingest import app
@@ -79,36 +78,26 @@ def test_ingest_yaml(mock_firestore, mock_blog_service, mock_project_service):
     # Verify we found projects
     assert "Found 3 manual projects" in result.stdout, f"Output: {result.stdout}"
 
-    # Verify Project creation calls
-    # Should have 2 calls
-    assert mock_proj_svc.create.call_count == 2, (
-        f"Expected 2 create calls, got {mock_proj_svc.create.call_count}. Output: {result.stdout}"
-    )
+    # Verify Project writes: one batch of 2 (the ambiguous title is skipped)
+    projects = mock_proj_svc.bulk_upsert.call_args.args[0]
+    assert len(projects) == 2, f"Expected 2 projects saved, got {len(projects)}. Output: {result.stdout}"
 
     # 1. Explicit ID
-    call_args_1 = mock_proj_svc.create.call_args_list[0]
-    proj_1, kwargs_1 = call_args_1[0][0], call_args_1[1]
-    assert proj_1.title == "Project With ID"
-    assert kwargs_1["item_id"] == "explicit-proj-id"
+    assert projects[0].title == "Project With ID"
+    assert projects[0].id == "explicit-proj-id"
 
     # 2. Fallback to Repo URL slug (fallback-repo -> fallback-repo)
-    call_args_2 = mock_proj_svc.create.call_args_list[1]
-    proj_2, kwargs_2 = call_args_2[0][0], call_args_2[1]
-    assert proj_2.title == "Project No ID"
-    assert kwargs_2["item_id"] == "manual:fallback-repo"
+    assert projects[1].title == "Project No ID"
+    assert projects[1].id == "manual:fallback-repo"
 
-    # Verify Blog creation calls
-    # Should have 2 calls
-    assert mock_blog_svc.create.call_count == 2
+    # Verify Blog writes: one batch of 2
+    blogs = mock_blog_svc.bulk_upsert.call_args.args[0]
+    assert len(blogs) == 2
 
     # 1. Explicit ID
-    call_args_b1 = mock_blog_svc.create.call_args_list[0]
-    blog_1, kwargs_b1 = call_args_b1[0][0], call_args_b1[1]
-    assert blog_1.title == "Blog With ID"
-    assert kwargs_b1["item_id"] == "explicit-blog-id"
+    assert blogs[0].title == "Blog With ID"
+    assert blogs[0].id == "explicit-blog-id"
 
     # 2. Fallback to URL slug (fallback-blog -> fallback-blog)
-    call_args_b2 = mock_blog_svc.create.call_args_list[1]
-    blog_2, kwargs_b2 = call_args_b2[0][0], call_args_b2[1]
-    assert blog_2.title == "Blog No ID"
-    assert kwargs_b2["item_id"] == "manual:fallback-blog"
+    assert blogs[1].title == "Blog No ID"
+    assert blogs[1].id == "manual:fallback-blog"
@@ -28,6 +28,7 @@ async def test_platform_scoped_ids(
     mock_devto,
     mock_medium,
     mock_github,
+    saved_bulk_upsert,
 ):
     from app.tools.ingest import ingest_resources
 
@@ -73,29 +74,25 @@ async def test_platform_scoped_ids(
 
     mock_blog_svc = mock_blog_service.return_value
     mock_blog_svc.list = AsyncMock(return_value=[])
-    mock_blog_svc.create = AsyncMock()
+    mock_blog_svc.bulk_upsert = AsyncMock(side_effect=saved_bulk_upsert)
 
     mock_proj_svc = mock_project_service.return_value
     mock_proj_svc.list = AsyncMock(return_value=[])
-    mock_proj_svc.create = AsyncMock()
+    mock_proj_svc.bulk_upsert = AsyncMock(side_effect=saved_bulk_upsert)
 
     await ingest_resources("user", "user", None, "user", None, None, "project")
 
     # Verify Project ID has prefix
-    _, kwargs = mock_proj_svc.create.call_args
-    assert kwargs["item_id"] == "github:my-project"
+    (saved_projects,) = mock_proj_svc.bulk_upsert.call_args.args
+    assert [p.id for p in saved_projects] == ["github:my-project"]
 
     # Verify Blog IDs have prefixes
+    saved_ids = [b.id for call in mock_blog_svc.bulk_upsert.call_args_list for b in call.args[0]]
     # Medium
-    # We need to find the call for Medium
-    medium_call = [c for c in mock_blog_svc.create.call_args_list if c[1]["item_id"].startswith("medium:")]
-    assert len(medium_call) == 1
-    assert medium_call[0][1]["item_id"] == "medium:my-blog"
+    assert [i for i in saved_ids if i.startswith("medium:")] == ["medium:my-blog"]
 
     # Dev.to
-    devto_call = [c for c in mock_blog_svc.create.call_args_list if c[1]["item_id"].startswith("devto:")]
-    assert len(devto_call) == 1
-    assert devto_call[0][1]["item_id"] == "devto:my-blog"
+    assert [i for i in saved_ids if i.startswith("devto:")] == ["devto:my-blog"]
 
 
 @pytest.mark.asyncio
@@ -103,7 +100,9 @@ async def test_platform_scoped_ids(
 @patch("app.tools.ingest.BlogService")
 @patch("app.tools.ingest.ContentEnrichmentService")
 @patch("app.tools.ingest.firestore.AsyncClient")
-async def test_metadata_patching(mock_firestore_client, mock_enrich_service, mock_blog_service, mock_devto):
+async def test_metadata_patching(
+    mock_firestore_client, mock_enrich_service, mock_blog_service, mock_devto, saved_bulk_upsert
+):
     from app.tools.ingest import ingest_resources
 
     # 1. Blog exists with ai_summary -> should skip enrichment
@@ -130,8 +129,7 @@ async def test_metadata_patching(mock_firestore_client, mock_enrich_service, moc
 
     mock_blog_svc = mock_blog_service.return_value
     mock_blog_svc.list = AsyncMock(return_value=[existing_blog_with_summary, existing_blog_no_summary])
-    mock_blog_svc.update = AsyncMock()
-    mock_blog_svc.create = AsyncMock()
+    mock_blog_svc.bulk_upsert = AsyncMock(side_effect=saved_bulk_upsert)
     mock_blog_svc.delete = AsyncMock()
 
     mock_dev_instance = mock_devto.return_value
@@ -167,13 +165,9 @@ async def test_metadata_patching(mock_firestore_client, mock_enrich_service, moc
     assert mock_enrich_instance.enrich_content.call_count == 1
     mock_enrich_instance.enrich_content.assert_called_once_with("Content " * 50)
 
-    # Verify update called ONLY for "Patch Me"
-    calls = mock_blog_svc.update.call_args_list
-    assert len(calls) == 1
-
-    # Check "Patch Me" update
-    assert calls[0][0][0] == "devto:patch"
-    assert calls[0][0][1]["ai_summary"] == "New Summary"
+    # Verify "Patch Me" was saved with its new summary
+    saved = {b.id: b for call in mock_blog_svc.bulk_upsert.call_args_list for b in call.args[0]}
+    assert saved["devto:patch"].ai_summary == "New Summary"
 
 
 @pytest.mark.asyncio
@@ -225,3 +219,43 @@ async def test_devto_quickie_filtering(mock_httpx_client):
     # Boost is skipped by title, Quickie is skipped by word count
     assert len(blogs) == 1
     assert blogs[0].title == "Full Article"
+
+
+@pytest.mark.asyncio
+@patch("app.tools.ingest.MediumConnector")
+@patch("app.tools.ingest.BlogService")
+@patch("app.tools.ingest.ContentEnrichmentService")
+@patch("app.tools.ingest.firestore.AsyncClient")
+async def test_cached_rss_post_is_enriched_from_stored_content(
+    mock_firestore_client,
+    mock_enrichment_service,
+    mock_blog_service,
+    mock_medium,
+    saved_bulk_upsert,
+):
+    from app.tools.ingest import ingest_resources
+
+    stored = Blog(
+        id="medium:cached",
+        title="Cached",
+        summary="Sum",
+        platform="Medium",
+        url="http://med.com/cached",
+        date="2026-01-01",
+        markdown_content="Stored content " * 50,
+    )
+    mock_blog_svc = mock_blog_service.return_value
+    mock_blog_svc.list = AsyncMock(return_value=[stored])
+    mock_blog_svc.bulk_upsert = AsyncMock(side_effect=saved_bulk_upsert)
+    # Reused from the RSS cache, so the feed item comes without its content
+    mock_medium.return_value.fetch_posts = AsyncMock(
+        return_value=[stored.model_copy(update={"id": None, "markdown_content": None})]
+    )
+    mock_enrichment_service.return_value.enrich_content = AsyncMock(return_value={"summary": "New Summary", "tags": ["tag"]})
+
+    await ingest_resources(None, "user", None, None, None, None, "project")
+
+    mock_medium.return_value.fetch_posts.assert_awaited_once_with("user", existing_urls={"http://med.com/cached"})
+    mock_enrichment_service.return_value.enrich_content.assert_awaited_once_with("Stored content " * 50)
+    (saved,) = mock_blog_svc.bulk_upsert.call_args.args[0]
+    assert (saved.id, saved.ai_summary) == ("medium:cached", "New Summary")
@@ -0,0 +1,147 @@
+"""
+Description: Unit tests for reconciling manual YAML entries against existing items.
+Why: Verifies that duplicate entries within one YAML file are detected, and that large files reconcile in linear time.
+How: Calls the manual project and video helpers directly with AsyncMock services.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.models.application import Application
+from app.models.project import Project
+from app.models.video import Video
+from app.services.firestore_base import BulkWriteResult
+from app.tools.ingest import ReconciliationIndex, _process_manual_projects, _process_manual_videos, normalize_url
+
+
+def _service(existing: list) -> AsyncMock:
+    service = AsyncMock()
+    service.list.return_value = existing
+    service.bulk_upsert.side_effect = lambda items, **kwargs: [BulkWriteResult(id=item.id) for item in items]
+    return service
+
+
+def _stats() -> dict:
+    return {"new": 0, "updated": 0, "unchanged": 0, "skipped": 0}
+
+
+def test_index_matches_by_url_and_title_and_flags_ambiguous_titles():
+    items = [
+        Project(id="a", title="Shared", description="", repo_url="https://github.com/u/a/"),
+        Project(id="b", title="Shared", description="", demo_url="https://b.example.com?ref=x"),
+        Project(id="c", title="Unique", description=""),
+    ]
+
+    index = ReconciliationIndex(items, ("repo_url", "demo_url"))
+
+    assert index.by_url("repo_url", "https://github.com/u/a").id == "a"
+    assert index.by_url("demo_url", "https://b.example.com").id == "b"
+    assert index.by_url("repo_url", None) is None
+    assert index.by_title("Unique").id == "c"
+    assert index.ambiguous_titles == {"Shared"}
+
+
+@pytest.mark.asyncio
+async def test_duplicate_project_entries_in_one_file_are_skipped():
+    service, stats = _service([]), _stats()
+    entries = [
+        {"title": "Tool", "description": "First", "repo_url": "https://github.com/u/tool"},
+        {"title": "Tool (again)", "description": "Copy", "repo_url": "https://github.com/u/tool/"},
+        {"title": "Tool", "description": "Same title", "demo_url": "https://tool.example.com"},
+        {"title": "Other", "description": "Different", "repo_url": "https://github.com/u/other"},
+    ]
+
+    await _process_manual_projects(entries, service, "manual", stats)
+
+    (saved,) = service.bulk_upsert.call_args.args
+    assert [(p.id, p.description) for p in saved] == [("manual:tool", "First"), ("manual:other", "Different")]
+    assert (stats["new"], stats["skipped"]) == (2, 2)
+
+
+@pytest.mark.asyncio
+async def test_application_matched_twice_is_updated_once():
+    existing = Application(id="app:demo", title="Demo", description="Old", demo_url="https://demo.example.com")
+    service, stats = _service([existing]), _stats()
+    entries = [
+        {"title": "Demo", "description": "New", "demo_url": "https://demo.example.com"},
+        {"title": "Demo", "description": "Newer", "demo_url": "https://demo.example.com/"},
+    ]
+
+    await _process_manual_projects(entries, service, "app", stats, model_class=Application)
+
+    (saved,) = service.bulk_upsert.call_args.args
+    assert [(a.id, a.description) for a in saved] == [("app:demo", "New")]
+    assert (stats["updated"], stats["skipped"]) == (1, 1)
+
+
+@pytest.mark.asyncio
+@patch("typer.confirm")
+async def test_duplicate_video_entries_in_one_file_are_skipped(mock_confirm):
+    service, stats = _service([]), _stats()
+    url = "https://www.youtube.com/watch?v=abcdefghijk"
+    entries = [
+        {"title": "Talk", "description": "First", "video_url": url},
+        {"title": "Talk (copy)", "description": "Copy", "video_url": url},
+    ]
+
+    await _process_manual_videos(entries, service, stats)
+
+    (saved,) = service.bulk_upsert.call_args.args
+    assert [v.id for v in saved] == ["youtube:abcdefghijk"]
+    assert (stats["new"], stats["skipped"]) == (1, 1)
+    # The duplicate is not mistaken for an update of the video just created
+    mock_confirm.assert_not_called()
+
+
+class IterationCountingList(list):
+    """A list that counts how many times it is iterated over."""
+
+    iterations = 0
+
+    def __iter__(self):
+        self.iterations += 1
+        return super().__iter__()
+
+
+@pytest.mark.asyncio
+async def test_large_yaml_file_reconciles_in_linear_time():
+    count = 2000
+    existing = IterationCountingList(
+        Project(id=f"manual:p{i}", title=f"Project {i}", description="", repo_url=f"https://github.com/u/p{i}")
+        for i in range(count)
+    )
+    entries = [
+        {"title": f"Project {i}", "description": "Updated", "repo_url": f"https://github.com/u/p{i}"} for i in range(count)
+    ]
+    service, stats = _service(existing), _stats()
+    existing.iterations = 0
+
+    with patch("app.tools.ingest.normalize_url", wraps=normalize_url) as normalize:
+        await _process_manual_projects(entries, service, "manual", stats)
+
+    assert stats["updated"] == count
+    # Existing items are indexed once, rather than once per YAML entry
+    assert existing.iterations <= 2
+    assert normalize.call_count <= 8 * count
+
+
+@pytest.mark.asyncio
+@patch("typer.confirm", return_value=False)
+async def test_existing_video_matched_twice_prompts_once(mock_confirm):
+    existing = Video(
+        id="youtube:abcdefghijk",
+        title="Talk",
+        description="Old",
+        video_url="https://www.youtube.com/watch?v=abcdefghijk",
+        is_manual=True,
+        source_platform="youtube",
+    )
+    service, stats = _service([existing]), _stats()
+    entries = [{"title": "Talk", "description": "New", "video_url": existing.video_url} for _ in range(2)]
+
+    await _process_manual_videos(entries, service, stats)
+
+    # The first entry's update was declined; the second is a duplicate of it and isn't asked about again
+    mock_confirm.assert_called_once()
+    assert stats["skipped"] == 2
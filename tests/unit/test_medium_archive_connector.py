@@ -4,11 +4,14 @@ Why: Verifies that Medium export zips are correctly parsed, converted to markdow
 How: Mocks zipfile and ContentEnrichmentService to test the ingestion logic.
 """
 
+import asyncio
+import pickle
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.services.connectors.medium_archive_connector import MediumArchiveConnector
+from app.services.connectors.medium_html import init_parse_worker, parse_in_worker, parse_post_html, prefilter_post
 
 
 @pytest.fixture
@@ -106,3 +109,120 @@ async def test_parse_archive(mock_ai_service):
         # Check frontmatter
         assert "subtitle: This is a subtitle" in blog.markdown_content
         assert "tags:" in blog.markdown_content
+
+
+@pytest.mark.asyncio
+async def test_concurrent_enrichment_keeps_archive_order():
+    html = (
+        '<html><head><title>{0}</title></head><body><section class="e-content"><h3>H</h3><p>{0}</p></section></body></html>'
+    )
+    files = ["posts/a.html", "posts/draft_b.html", "posts/c.html", "posts/d.html"]
+
+    async def enrich(text):
+        # The first post is the slowest to enrich, and the last one fails
+        post = text.strip()[-1]
+        await asyncio.sleep({"a": 0.03, "c": 0.01}.get(post, 0))
+        if post == "d":
+            raise ValueError("bad response")
+        return {"summary": f"summary {text}", "tags": []}
+
+    service = MagicMock()
+    service.enrich_content = AsyncMock(side_effect=enrich)
+
+    with patch("zipfile.ZipFile") as MockZip:
+        mock_zip_instance = MockZip.return_value.__enter__.return_value
+        mock_zip_instance.namelist.return_value = files
+        mock_zip_instance.open.side_effect = lambda name: MagicMock(
+            __enter__=lambda _: MagicMock(read=lambda: html.format(name[6]).encode("utf-8")),
+            __exit__=lambda *args: None,
+        )
+
+        connector = MediumArchiveConnector(ai_service=service, concurrency=4)
+        results = [(status, filename) async for status, _, filename in connector.fetch_posts("archive.zip")]
+
+    assert results == [
+        ("processed", "posts/a.html"),
+        ("skipped_draft", "posts/draft_b.html"),
+        ("processed", "posts/c.html"),
+        ("error", "posts/d.html"),
+    ]
+
+
+def test_parse_worker_skips_existing_urls_and_results_pickle():
+    html = (
+        b"<html><head><title>Post</title></head><body>"
+        b'<section class="e-content"><h3>H</h3><p>Body</p></section>'
+        b'<a class="u-url" href="https://medium.com/@user/post?source=rss">link</a></body></html>'
+    )
+
+    init_parse_worker(frozenset({"https://medium.com/@user/post"}))
+    try:
+        assert parse_in_worker(html) == ("skipped_existing", None)
+    finally:
+        init_parse_worker(frozenset())
+
+    # Results travel back from the worker processes by pickling
+    status, post = pickle.loads(pickle.dumps(parse_in_worker(html)))
+    assert status == "parsed"
+    assert (post.title, post.url) == ("Post", "https://medium.com/@user/post")
+    assert "### H" in post.markdown_body
+
+
+BLOG_HTML = (
+    "<html><head><title>Post</title></head><body>"
+    '<section class="e-content"><h3>Heading</h3><p>Body mentions class="u-in-reply-to" as text</p></section>'
+    '<a class="p-canonical" href="https://medium.com/@user/canonical">c</a>'
+    '<a href="https://medium.com/@user/post/?source=rss&amp;x=1" class="h-cite u-url">link</a></body></html>'
+)
+PREFILTER_CASES = {
+    "blog": BLOG_HTML,
+    "reply": BLOG_HTML.replace("<body>", '<body><section class="p-in-reply-to">Re</section>'),
+    "no content section": BLOG_HTML.replace("e-content", "e-other"),
+    "no subheading": BLOG_HTML.replace("h3", "p"),
+    "reply-like class": BLOG_HTML.replace("<body>", '<body><div class="u-in-reply-to-list"></div>'),
+    "url without href": BLOG_HTML.replace('href="https://medium.com/@user/post/', 'data-x="'),
+}
+
+
+@pytest.mark.parametrize("case", PREFILTER_CASES)
+def test_prefilter_agrees_with_full_parse(case):
+    html = PREFILTER_CASES[case]
+    for existing in (
+        frozenset(),
+        frozenset({"https://medium.com/@user/post"}),
+        frozenset({"https://medium.com/@user/canonical"}),
+    ):
+        status = prefilter_post(html.encode("utf-8"), existing)
+        full_status, _ = parse_post_html(html, existing)
+        # The pre-filter may leave a rejection to the full parse, but never rejects a post the full parse would keep
+        assert status in (None, full_status)
+
+    assert prefilter_post(PREFILTER_CASES["blog"].encode("utf-8"), frozenset()) is None
+    assert prefilter_post(PREFILTER_CASES["reply"].encode("utf-8"), frozenset()) == "skipped_not_blog"
+    assert prefilter_post(BLOG_HTML.encode("utf-8"), frozenset({"https://medium.com/@user/post"})) == "skipped_existing"
+
+
+@pytest.mark.asyncio
+async def test_rejected_posts_are_not_sent_to_parse_workers():
+    files = {"posts/reply.html": PREFILTER_CASES["reply"], "posts/blog.html": BLOG_HTML}
+
+    with (
+        patch("zipfile.ZipFile") as MockZip,
+        patch("app.services.connectors.medium_archive_connector.ProcessPoolExecutor") as MockPool,
+    ):
+        mock_zip_instance = MockZip.return_value.__enter__.return_value
+        mock_zip_instance.namelist.return_value = list(files)
+        mock_zip_instance.open.side_effect = lambda name: MagicMock(
+            __enter__=lambda _: MagicMock(read=lambda: files[name].encode("utf-8")),
+            __exit__=lambda *args: None,
+        )
+        connector = MediumArchiveConnector(ai_service=None, parse_workers=1)
+        results = [
+            (status, filename)
+            async for status, _, filename in connector.fetch_posts(
+                "archive.zip", existing_urls={"https://medium.com/@user/post"}
+            )
+        ]
+
+    assert results == [("skipped_not_blog", "posts/reply.html"), ("skipped_existing", "posts/blog.html")]
+    MockPool.return_value.submit.assert_not_called()
@@ -1,15 +1,18 @@
 """
 Description: Unit tests for Medium Connector.
 Why: Verifies that the Medium connector correctly fetches posts via RSS and maps them to Blog models.
-How: Mocks httpx.AsyncClient responses with RSS XML and asserts on the resulting Blog objects.
+How: Mocks httpx.AsyncClient responses with RSS XML and asserts on the resulting Blog objects. Conditional fetching
+     uses an httpx.MockTransport feed server and an in-memory HTTP cache.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
+from markdownify import markdownify as md
 
 from app.services.connectors.medium_connector import MediumConnector
+from app.services.simulated_service import SimulatedFirestoreService
 
 
 @pytest.mark.asyncio
@@ -29,13 +32,10 @@ async def test_fetch_posts():
     </rss>
     """
 
-    connector = MediumConnector()
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, text=mock_rss))
 
-    with patch("httpx.AsyncClient.get", new_callable=AsyncMock) as mock_get:
-        mock_response = MagicMock(spec=httpx.Response)
-        mock_response.status_code = 200
-        mock_response.text = mock_rss
-        mock_get.return_value = mock_response
+    async with httpx.AsyncClient(transport=transport) as client:
+        connector = MediumConnector(client=client)
 
         blogs = await connector.fetch_posts("derailed.dash")
 
@@ -49,3 +49,120 @@ async def test_fetch_posts():
         assert blog.summary == "A summary of the post..."
         # Date should be ISO formatted
         assert blog.date.startswith("2026-01-18")
+
+
+class FeedServer:
+    """A mock Medium RSS endpoint. With `etags`, it answers a matching If-None-Match with 304 Not Modified."""
+
+    def __init__(self, posts: dict[str, str], etags: bool = True):
+        self.posts = posts
+        self.etags = etags
+        self.statuses: list[int] = []
+
+    def feed(self) -> str:
+        items = "".join(
+            f"<item><title>{slug}</title><link>https://medium.com/@user/{slug}?source=rss</link>"
+            f"<pubDate>Sun, 18 Jan 2026 10:00:00 GMT</pubDate>"
+            f"<content:encoded><![CDATA[<p>{body}</p>]]></content:encoded></item>"
+            for slug, body in self.posts.items()
+        )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<rss xmlns:content="http://purl.org/rss/1.0/modules/content/" version="2.0">'
+            f"<channel>{items}</channel></rss>"
+        )
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = self.feed()
+        etag = f'"{hash(body)}"'
+        if self.etags and request.headers.get("If-None-Match") == etag:
+            self.statuses.append(304)
+            return httpx.Response(304)
+        self.statuses.append(200)
+        return httpx.Response(200, text=body, headers={"ETag": etag} if self.etags else {})
+
+
+def _http_cache() -> SimulatedFirestoreService:
+    real_service = AsyncMock()
+    real_service.list.return_value = []
+    return SimulatedFirestoreService(real_service)
+
+
+async def _fetch(server: FeedServer, cache, existing_urls: set[str]) -> tuple[list, MediumConnector, int]:
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+        connector = MediumConnector(client=client, cache=cache)
+        with patch("app.services.connectors.medium_connector.md", wraps=md) as conversions:
+            blogs = await connector.fetch_posts("user", existing_urls=existing_urls)
+    return blogs, connector, conversions.call_count
+
+
+STORED = {"https://medium.com/@user/one", "https://medium.com/@user/two"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("etags", [True, False])
+async def test_unchanged_feed_is_not_parsed_again(etags):
+    server, cache = FeedServer({"one": "First", "two": "Second"}, etags=etags), _http_cache()
+
+    first, _, first_conversions = await _fetch(server, cache, set())
+    second, connector, conversions = await _fetch(server, cache, STORED)
+
+    assert first_conversions == 2
+    # A 304, or an identical body when the server has no ETags, is answered from the cache
+    assert server.statuses == ([200, 304] if etags else [200, 200])
+    assert connector.not_modified
+    assert conversions == 0
+    assert [(b.title, b.url, b.date, b.summary) for b in second] == [(b.title, b.url, b.date, b.summary) for b in first]
+    assert all(b.markdown_content is None for b in second)
+
+
+@pytest.mark.asyncio
+async def test_only_new_or_changed_items_are_converted():
+    server, cache = FeedServer({"one": "First", "two": "Second"}), _http_cache()
+    await _fetch(server, cache, set())
+
+    server.posts = {"three": "Third", "one": "First", "two": "Second, edited"}
+    blogs, connector, conversions = await _fetch(server, cache, STORED)
+
+    assert conversions == 2
+    assert connector.reused == 1
+    assert [(b.title, b.markdown_content) for b in blogs] == [
+        ("three", "Third"),
+        ("one", None),
+        ("two", "Second, edited"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cache_is_not_used_for_posts_missing_from_the_database():
+    server, cache = FeedServer({"one": "First", "two": "Second"}), _http_cache()
+    await _fetch(server, cache, set())
+
+    # "two" was deleted from Firestore, so its content must come from the feed again
+    blogs, connector, conversions = await _fetch(server, cache, {"https://medium.com/@user/one"})
+
+    assert server.statuses == [200, 200]
+    assert not connector.not_modified
+    assert conversions == 1
+    assert blogs[1].markdown_content == "Second"
+
+
+@pytest.mark.asyncio
+async def test_posts_are_yielded_while_the_feed_is_still_arriving():
+    body = FeedServer({"one": "First", "two": "Second"}).feed().encode()
+    second_item = body.index(b"<item>", body.index(b"</item>"))
+    sent = []
+
+    async def chunks():
+        for chunk in (body[:second_item], body[second_item:]):
+            sent.append(chunk)
+            yield chunk
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=chunks()))
+    async with httpx.AsyncClient(transport=transport) as client:
+        stream = MediumConnector(client=client).stream_posts("user")
+
+        first = await anext(stream)
+        # The first post is parsed before the rest of the feed has been received
+        assert (first.title, len(sent)) == ("one", 1)
+        assert [blog.title async for blog in stream] == ["two"]
@@ -0,0 +1,151 @@
+"""
+Description: Unit tests for cursor-based pagination of FirestoreService listings.
+Why: Verifies that pages are stable across ties in the sort field and that cursors reach the /api routes.
+How: Builds Firestore queries against mocks, walks pages of an in-memory mirror, and calls the API with overrides.
+"""
+
+import json
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from google.cloud import firestore
+from google.cloud.firestore_v1.watch import ChangeType
+
+from app.dependencies import get_project_service
+from app.fast_api_app import app
+from app.services.blog_service import BlogService
+from app.services.collection_mirror import CollectionMirror
+from app.services.firestore_base import CollectionCache, EncodedSnapshot, decode_cursor, encode_cursor
+from app.services.project_service import ProjectService
+
+client = TestClient(app)
+
+
+class FakeSnapshot:
+    def __init__(self, doc_id: str, data: dict):
+        self.id = doc_id
+        self._data = data
+
+    def to_dict(self) -> dict:
+        return dict(self._data)
+
+
+def _mirrored_blog_service(docs: dict[str, str]) -> BlogService:
+    """Returns a BlogService served from a mirror holding blogs with the given {id: date}."""
+    ref = MagicMock()
+    mirror = CollectionMirror(ref)
+    service = BlogService(MagicMock(), cache=CollectionCache(ttl_seconds=60))
+    service.attach_mirror(mirror)
+    changes = [
+        SimpleNamespace(
+            type=ChangeType.ADDED,
+            document=FakeSnapshot(doc_id, {"title": doc_id, "date": date, "platform": "Medium", "url": "https://x"}),
+        )
+        for doc_id, date in docs.items()
+    ]
+    mirror._on_snapshot([], changes, None)
+    return service
+
+
+def test_cursor_round_trip():
+    when = datetime(2026, 1, 1, tzinfo=UTC)
+
+    assert decode_cursor(encode_cursor("2026-01-01", "medium:post")) == ("2026-01-01", "medium:post")
+    assert decode_cursor(encode_cursor(when, "p1")) == (when, "p1")
+    assert decode_cursor(encode_cursor(None, "p1")) == (None, "p1")
+
+
+@pytest.mark.parametrize("token", ["not-a-cursor", encode_cursor("x", "")[:-2], "W10"])
+def test_invalid_cursor_raises(token):
+    with pytest.raises(ValueError, match="Invalid start_after cursor"):
+        decode_cursor(token)
+
+
+@pytest.mark.asyncio
+async def test_pages_walk_collection_without_gaps_across_ties():
+    dates = {"a": "2026-01-03", "b": "2026-01-02", "c": "2026-01-02", "d": "2026-01-02", "e": "2026-01-01"}
+    service = _mirrored_blog_service(dates)
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = await service.list_page(2, start_after=cursor)
+        seen.extend(b.id for b in page)
+        if cursor is None:
+            break
+
+    assert seen == [b.id for b in await service.list()] == ["a", "d", "c", "b", "e"]
+
+
+@pytest.mark.asyncio
+async def test_page_json_carries_next_cursor():
+    service = _mirrored_blog_service({"a": "2026-01-02", "b": "2026-01-01"})
+
+    first = await service.list_json(fields=["title"], limit=1)
+    last = await service.list_json(fields=["title"], limit=1, start_after=first.next_cursor)
+
+    assert json.loads(first.body) == [{"id": "a", "title": "a"}]
+    assert json.loads(last.body) == [{"id": "b", "title": "b"}]
+    assert last.next_cursor is None
+    assert first.etag != last.etag
+
+
+@pytest.mark.asyncio
+async def test_page_query_orders_by_document_id_and_limits():
+    mock_db = MagicMock()
+    ordered = mock_db.collection.return_value.order_by.return_value.order_by.return_value
+    paged = ordered.start_after.return_value.limit.return_value
+
+    async def stream():
+        for doc_id in ("p3", "p2"):
+            yield FakeSnapshot(doc_id, {"title": doc_id, "description": "d", "created_at": "2026-01-01T00:00:00"})
+
+    paged.stream.return_value = stream()
+    service = ProjectService(mock_db)
+
+    items, cursor = await service.list_page(1, start_after=encode_cursor("2026-01-02T00:00:00", "p4"))
+
+    mock_db.collection.return_value.order_by.assert_called_once_with("created_at", direction=firestore.Query.DESCENDING)
+    ordered.start_after.assert_called_once_with({"created_at": "2026-01-02T00:00:00", "__name__": "p4"})
+    # One extra document is read to detect the next page
+    ordered.start_after.return_value.limit.assert_called_once_with(2)
+    assert [p.id for p in items] == ["p3"]
+    assert decode_cursor(cursor) == ("2026-01-01T00:00:00", "p3")
+
+
+@pytest.fixture
+def mock_project_service():
+    service = AsyncMock()
+    app.dependency_overrides[get_project_service] = lambda: service
+    yield service
+    app.dependency_overrides.clear()
+
+
+def test_api_exposes_next_cursor(mock_project_service):
+    mock_project_service.list_json.return_value = EncodedSnapshot.from_body(b"[]", next_cursor="abc")
+
+    response = client.get("/api/projects?limit=10")
+
+    assert response.status_code == 200
+    assert response.headers["x-next-cursor"] == "abc"
+    assert response.headers["link"] == '<http://testserver/api/projects?limit=10&start_after=abc>; rel="next"'
+    mock_project_service.list_json.assert_awaited_once_with(fields=None, limit=10, start_after=None)
+
+
+def test_api_defaults_page_size_for_cursor(mock_project_service):
+    mock_project_service.list_json.return_value = EncodedSnapshot.from_body(b"[]")
+
+    response = client.get("/api/projects?start_after=abc")
+
+    assert response.status_code == 200
+    assert "x-next-cursor" not in response.headers
+    mock_project_service.list_json.assert_awaited_once_with(fields=None, limit=50, start_after="abc")
+
+
+def test_api_rejects_bad_cursor_and_limit(mock_project_service):
+    mock_project_service.list_json.side_effect = ValueError("Invalid start_after cursor")
+
+    assert client.get("/api/projects?start_after=zzz").status_code == 400
+    assert client.get("/api/projects?limit=0").status_code == 422
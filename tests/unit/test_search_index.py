@@ -0,0 +1,158 @@
+"""
+Description: Unit tests for the BM25 search index behind search_portfolio.
+Why: Verifies ranking with field boosts, multi-term matching and incremental re-indexing.
+How: Indexes in-memory Blog / Project models directly; no Firestore needed.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.config import settings
+from app.models.blog import Blog
+from app.models.project import Project
+from app.services.search_index import SearchHit, SearchIndex, reciprocal_rank_fusion, tokenize
+from app.tools import portfolio_search
+
+BOOSTS = {"title": 3.0, "tags": 2.0, "summary": 1.0, "ai_summary": 0.5}
+
+
+def _blog(blog_id: str, title: str, summary: str = "", tags: list[str] | None = None, ai_summary: str | None = None):
+    return Blog(
+        id=blog_id,
+        title=title,
+        summary=summary,
+        tags=tags or [],
+        ai_summary=ai_summary,
+        url=f"https://x/{blog_id}",
+        date="2026-01-01",
+        platform="Medium",
+    )
+
+
+def test_tokenize():
+    assert tokenize("Deploying ADK agents to Cloud-Run!") == ["deploying", "adk", "agents", "to", "cloud", "run"]
+
+
+def test_field_boosts_rank_title_matches_first():
+    index = SearchIndex()
+    index.sync(
+        "blog",
+        [
+            _blog("body", "Notes", summary="some gemini notes"),
+            _blog("title", "Gemini deep dive"),
+            _blog("tag", "Notes", tags=["gemini"]),
+        ],
+        BOOSTS,
+    )
+
+    assert [hit.item.id for hit in index.search("gemini")] == ["title", "tag", "body"]
+
+
+def test_all_terms_must_match_and_prefixes_count():
+    index = SearchIndex()
+    index.sync(
+        "blog",
+        [_blog("b1", "Python and TypeScript"), _blog("b2", "Python only"), _blog("b3", "TypeScript only")],
+        BOOSTS,
+    )
+
+    assert [hit.item.id for hit in index.search("python type")] == ["b1"]
+    assert {hit.item.id for hit in index.search("typescript")} == {"b1", "b3"}
+    assert index.search("java") == []
+
+
+def test_matched_fields_are_reported():
+    index = SearchIndex()
+    index.sync("blog", [_blog("b1", "Notes", ai_summary="All about Kubernetes")], BOOSTS)
+
+    (hit,) = index.search("kubernetes")
+
+    assert hit.matched_fields == {"ai_summary"}
+
+
+def test_sync_is_incremental():
+    index = SearchIndex()
+    blogs = [_blog("b1", "Gemini"), _blog("b2", "Python")]
+    assert index.sync("blog", blogs, BOOSTS) == 2
+
+    # Same objects, or equal content in new objects, need no re-indexing
+    assert index.sync("blog", blogs, BOOSTS) == 0
+    assert index.sync("blog", [b.model_copy() for b in blogs], BOOSTS) == 0
+
+    # One changed, one removed
+    assert index.sync("blog", [_blog("b1", "Gemini CLI")], BOOSTS) == 2
+    assert len(index) == 1
+    assert index.search("python") == []
+    assert [hit.item.title for hit in index.search("cli")] == ["Gemini CLI"]
+
+
+def test_kinds_are_synced_independently():
+    index = SearchIndex()
+    index.sync("blog", [_blog("b1", "Python tips")], BOOSTS)
+    index.sync("project", [Project(id="p1", title="Python tool", description="d")], {"title": 3.0})
+
+    index.sync("blog", [], BOOSTS)
+
+    assert index.count("blog") == 0
+    assert [hit.kind for hit in index.search("python")] == ["project"]
+    assert [hit.kind for hit in index.search("python", kinds=["blog"])] == []
+
+
+def _hit(key: str, fields: set[str]) -> SearchHit:
+    return SearchHit(key=key, kind="blog", item=key, score=0.0, matched_fields=fields)
+
+
+def test_reciprocal_rank_fusion_favours_agreement():
+    keyword = [_hit("a", {"title"}), _hit("b", {"title"}), _hit("c", {"tags"})]
+    semantic = [_hit("c", {"semantic"}), _hit("d", {"semantic"}), _hit("a", {"semantic"})]
+
+    fused = reciprocal_rank_fusion([keyword, semantic], k=60)
+
+    assert [hit.key for hit in fused] == ["a", "c", "b", "d"]
+    assert fused[0].score == pytest.approx(1 / 61 + 1 / 63)
+    assert fused[0].matched_fields == {"title", "semantic"}
+    # Inputs are left untouched
+    assert keyword[0].matched_fields == {"title"}
+
+
+@pytest.mark.asyncio
+async def test_search_portfolio_caps_results(monkeypatch):
+    projects, blogs, videos = AsyncMock(), AsyncMock(), AsyncMock()
+    projects.list.return_value = [Project(id=f"p{i}", title=f"Python tool {i}", description="d") for i in range(5)]
+    blogs.list.return_value = []
+    videos.list.return_value = []
+    monkeypatch.setattr(settings, "search_result_limit", 2)
+
+    portfolio_search.use_services(projects, blogs, videos)
+    try:
+        result = await portfolio_search.search_portfolio("python")
+    finally:
+        portfolio_search.use_services()
+
+    lines = result.split("\n")
+    assert lines[0] == "Found 5 matching items (Database contains 5 items total): 5 projects."
+    assert len(lines) == 4
+    assert "| Score: " in lines[1]
+    assert lines[3] == (
+        "Showing results 1-2 of 5. For more, call search_portfolio again with the same query and cursor='2'."
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_portfolio_reads_through_shared_services():
+    projects, blogs, videos = AsyncMock(), AsyncMock(), AsyncMock()
+    projects.list.return_value = [Project(id="p1", title="Python tool", description="d")]
+    blogs.list.return_value = []
+    videos.list.return_value = []
+
+    portfolio_search.use_services(projects, blogs, videos)
+    try:
+        with patch("app.tools.portfolio_search.get_client") as mock_get_client:
+            result = await portfolio_search.search_portfolio("python")
+        mock_get_client.assert_not_called()
+    finally:
+        portfolio_search.use_services()
+
+    assert result.startswith("Found 1 matching items (Database contains 1 items total):")
+    assert "[Project] ID: p1 | Title: Python tool" in result
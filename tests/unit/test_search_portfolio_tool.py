@@ -8,12 +8,22 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from app.config import settings
 from app.models.blog import Blog
 from app.models.project import Project
 from app.models.video import Video
+from app.tools import portfolio_search
 from app.tools.portfolio_search import search_portfolio
 
 
+@pytest.fixture(autouse=True)
+def fresh_services():
+    # The tool keeps the services it creates, so each test must start without them
+    portfolio_search.use_services()
+    yield
+    portfolio_search.use_services()
+
+
 @pytest.fixture
 def mock_projects():
     return [
@@ -239,3 +249,78 @@ async def test_search_priority_and_deduplication(mock_projects):
         # Check total matched lines
         lines = result.strip().split("\n")
         assert len(lines) == 6  # Header + 5 unique blogs matched
+
+
+@pytest.fixture
+def many_blogs():
+    return [
+        Blog(
+            id=f"b{i}",
+            title=f"Cloud post {i}",
+            summary="Cloud " + "word " * 100,
+            url=f"https://x/{i}",
+            date="2025",
+            platform="p",
+        )
+        for i in range(5)
+    ]
+
+
+async def _search_blogs(blogs: list[Blog], query: str, cursor: str | None = None) -> str:
+    projects, blog_service, videos = AsyncMock(), AsyncMock(), AsyncMock()
+    projects.list.return_value = [Project(id="p1", title="Cloud tool", description="d")]
+    blog_service.list.return_value = blogs
+    videos.list.return_value = []
+    portfolio_search.use_services(projects, blog_service, videos)
+    try:
+        return await search_portfolio(query, cursor=cursor)
+    finally:
+        portfolio_search.use_services()
+
+
+@pytest.mark.asyncio
+async def test_results_are_paged_with_cursor(monkeypatch, many_blogs):
+    monkeypatch.setattr(settings, "search_result_limit", 4)
+
+    first = await _search_blogs(many_blogs, "cloud")
+    second = await _search_blogs(many_blogs, "cloud", cursor="4")
+
+    assert first.startswith("Found 6 matching items (Database contains 6 items total): 1 project, 5 blogs.")
+    assert first.endswith("cursor='4'.")
+    assert second.split("\n")[-1] == "Showing results 5-6 of 6. There are no more results."
+    assert len(second.split("\n")) == 4  # Header, two results and footer
+    assert "No more results" in await _search_blogs(many_blogs, "cloud", cursor="6")
+    assert "Invalid cursor" in await _search_blogs(many_blogs, "cloud", cursor="abc")
+
+
+@pytest.mark.asyncio
+async def test_output_respects_character_budget(monkeypatch, many_blogs):
+    monkeypatch.setattr(settings, "search_snippet_max_chars", 50)
+    monkeypatch.setattr(settings, "search_result_max_chars", 600)
+
+    result = await _search_blogs(many_blogs, "cloud")
+
+    # The budget covers the header and results; the continuation footer comes on top
+    assert len(result.rsplit("\n", 1)[0]) <= 600
+    assert "Summary: Cloud word word word word word word word word..." in result
+    assert result.split("\n")[-1].endswith("with the same query and cursor='3'.")
+
+
+@pytest.mark.asyncio
+async def test_own_services_are_created_once_with_caches(mock_projects, mock_blogs, mock_videos):
+    with (
+        patch("app.tools.portfolio_search.ProjectService") as MockProjectService,
+        patch("app.tools.portfolio_search.BlogService") as MockBlogService,
+        patch("app.tools.portfolio_search.VideoService") as MockVideoService,
+        patch("app.tools.portfolio_search.get_client"),
+    ):
+        MockProjectService.return_value.list = AsyncMock(return_value=mock_projects)
+        MockBlogService.return_value.list = AsyncMock(return_value=mock_blogs)
+        MockVideoService.return_value.list = AsyncMock(return_value=mock_videos)
+
+        await search_portfolio("python")
+        await search_portfolio("dashboard")
+
+    # Both searches read through the same cached services, rather than new uncached ones per call
+    MockProjectService.assert_called_once()
+    assert MockProjectService.call_args.kwargs["cache"] is not None
@@ -0,0 +1,164 @@
+"""
+Description: Unit tests for the semantic search pipeline.
+Why: Verifies the local embedding stand-in, the ingest embedding stage and vector results in search_portfolio.
+How: Uses HashingEmbeddingProvider and AsyncMock services, so neither Gemini nor Firestore is called.
+"""
+
+import asyncio
+from collections import OrderedDict
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+from app.config import settings
+from app.models.blog import Blog
+from app.models.embedding import Embedding
+from app.models.project import Project
+from app.services.embedding_provider import HashingEmbeddingProvider, get_embedding_provider
+from app.services.embedding_service import content_hash, document_text
+from app.services.firestore_base import BulkWriteResult
+from app.tools import portfolio_search
+from app.tools.ingest import _update_embeddings
+
+
+def _blog(blog_id: str, title: str, summary: str) -> Blog:
+    return Blog(id=blog_id, title=title, summary=summary, url=f"https://x/{blog_id}", date="2026-01-01", platform="Medium")
+
+
+@pytest.mark.asyncio
+async def test_hashing_provider_is_deterministic_and_normalised():
+    provider = HashingEmbeddingProvider(dimensions=64)
+
+    first, second, other = await provider.embed(["Cloud Run agents", "Cloud Run agents", "Baking bread"])
+
+    assert first == second
+    assert np.linalg.norm(first) == pytest.approx(1.0)
+    assert np.dot(first, second) > np.dot(first, other)
+
+
+def test_unknown_provider():
+    with pytest.raises(ValueError, match="Unknown embedding provider"):
+        get_embedding_provider("nope")
+
+
+@pytest.mark.asyncio
+async def test_update_embeddings_only_embeds_changes():
+    provider = HashingEmbeddingProvider(dimensions=8)
+    unchanged = _blog("b1", "Same", "Unchanged post")
+    blogs = AsyncMock()
+    blogs.list.return_value = [unchanged, _blog("b2", "New", "Brand new post")]
+    projects = AsyncMock()
+    projects.list.return_value = [Project(id="p1", title="Tool", description="Edited")]
+    embeddings = AsyncMock()
+    embeddings.list.return_value = [
+        Embedding(
+            id="blog:b1",
+            kind="blog",
+            item_id="b1",
+            model=provider.name,
+            vector=[0.0] * 8,
+            content_hash=content_hash(provider.name, document_text(unchanged)),
+        ),
+        Embedding(id="project:p1", kind="project", item_id="p1", model=provider.name, vector=[0.0] * 8, content_hash="old"),
+        Embedding(id="blog:gone", kind="blog", item_id="gone", model=provider.name, vector=[0.0] * 8, content_hash="x"),
+    ]
+    embeddings.bulk_upsert.side_effect = lambda items: [BulkWriteResult(id=item.id) for item in items]
+    stats = {"new": 0, "updated": 0, "skipped": 0, "deleted": 0}
+
+    await _update_embeddings(blogs, projects, embeddings, provider, stats)
+
+    assert stats == {"new": 1, "updated": 1, "skipped": 1, "deleted": 1}
+    written = {item.id for call in embeddings.bulk_upsert.await_args_list for item in call.args[0]}
+    assert written == {"blog:b2", "project:p1"}
+    embeddings.delete.assert_awaited_once_with("blog:gone")
+
+
+@pytest.mark.asyncio
+async def test_search_portfolio_includes_semantic_matches(monkeypatch):
+    provider = HashingEmbeddingProvider()
+    items = [
+        _blog("b1", "Serverless containers", "Deploying agents to Cloud Run"),
+        _blog("b2", "Sourdough", "Baking bread at home"),
+    ]
+    vectors = await provider.embed([document_text(b) for b in items])
+
+    blogs, projects, videos, embeddings = AsyncMock(), AsyncMock(), AsyncMock(), AsyncMock()
+    blogs.list.return_value = items
+    projects.list.return_value = []
+    videos.list.return_value = []
+    embeddings.list.return_value = [
+        Embedding(id=f"blog:{b.id}", kind="blog", item_id=b.id, model=provider.name, vector=v, content_hash=b.id)
+        for b, v in zip(items, vectors, strict=True)
+    ]
+
+    monkeypatch.setattr(settings, "semantic_search_enabled", True)
+    monkeypatch.setattr(settings, "semantic_search_top_k", 1)
+    monkeypatch.setattr(portfolio_search, "_provider", provider)
+    portfolio_search.use_services(projects, blogs, videos, embedding_service=embeddings)
+    try:
+        # "on" appears in neither post, so there are no keyword matches; the first post is the nearest neighbour
+        result = await portfolio_search.search_portfolio("agents on cloud run")
+    finally:
+        portfolio_search.use_services()
+
+    assert "Serverless containers" in result
+    assert "Sourdough" not in result
+
+
+@pytest.mark.asyncio
+async def test_semantic_failure_falls_back_to_keyword_matches(monkeypatch):
+    blogs, projects, videos, embeddings = AsyncMock(), AsyncMock(), AsyncMock(), AsyncMock()
+    blogs.list.return_value = [_blog("b1", "Cloud Run agents", "Deploying agents")]
+    projects.list.return_value = []
+    videos.list.return_value = []
+    embeddings.list.return_value = []
+
+    monkeypatch.setattr(settings, "semantic_search_enabled", True)
+    monkeypatch.setattr(portfolio_search, "_provider", HashingEmbeddingProvider())
+    monkeypatch.setattr(portfolio_search, "_embed_query", AsyncMock(side_effect=RuntimeError("quota exceeded")))
+    portfolio_search.use_services(projects, blogs, videos, embedding_service=embeddings)
+    try:
+        hits = await portfolio_search.ranked_search("agents")
+    finally:
+        portfolio_search.use_services()
+
+    assert [hit.key for hit in hits] == ["blog:b1"]
+    portfolio_search._embed_query.assert_awaited_once_with("agents")
+
+
+@pytest.mark.asyncio
+async def test_query_is_embedded_while_the_index_refreshes(monkeypatch):
+    embedding_started = asyncio.Event()
+    listed = asyncio.Event()
+
+    class SlowProvider(HashingEmbeddingProvider):
+        async def embed(self, texts, task="document"):
+            embedding_started.set()
+            # Only finishes once the refresh has read Firestore, so it fails if the two run one after the other
+            await asyncio.wait_for(listed.wait(), timeout=1)
+            return await super().embed(texts, task)
+
+    async def list_blogs():
+        await asyncio.wait_for(embedding_started.wait(), timeout=1)
+        listed.set()
+        return [_blog("b1", "Cloud Run agents", "Deploying agents")]
+
+    blogs, projects, videos, embeddings = AsyncMock(), AsyncMock(), AsyncMock(), AsyncMock()
+    blogs.list.side_effect = list_blogs
+    projects.list.return_value = []
+    videos.list.return_value = []
+    embeddings.list.return_value = []
+
+    monkeypatch.setattr(settings, "semantic_search_enabled", True)
+    monkeypatch.setattr(portfolio_search, "_provider", SlowProvider())
+    # An empty query cache, so the query is sent to the provider
+    monkeypatch.setattr(portfolio_search, "_query_embeddings", OrderedDict())
+    portfolio_search.use_services(projects, blogs, videos, embedding_service=embeddings)
+    try:
+        hits = await portfolio_search.ranked_search("cloud run agents")
+    finally:
+        portfolio_search.use_services()
+
+    assert [hit.key for hit in hits] == ["blog:b1"]
+    assert embedding_started.is_set() and listed.is_set()
@@ -0,0 +1,62 @@
+"""
+Description: Unit tests for the in-memory vector index.
+Why: Verifies exact top-k retrieval, the approximate IVF option and incremental syncing.
+How: Uses small synthetic NumPy vectors; no embedding provider needed.
+"""
+
+import numpy as np
+import pytest
+
+from app.services.vector_index import VectorIndex
+
+
+def test_flat_search_returns_nearest_first():
+    index = VectorIndex()
+    index.sync([("a", "1", [1.0, 0.0]), ("b", "1", [0.7, 0.7]), ("c", "1", [0.0, 1.0])])
+
+    results = index.search([1.0, 0.1], k=2)
+
+    assert [key for key, _ in results] == ["a", "b"]
+    assert results[0][1] == pytest.approx(0.995, abs=1e-3)
+
+
+def test_sync_is_incremental():
+    index = VectorIndex()
+    assert index.sync([("a", "1", [1.0, 0.0]), ("b", "1", [0.0, 1.0])]) == 2
+    assert index.sync([("a", "1", [1.0, 0.0]), ("b", "1", [0.0, 1.0])]) == 0
+
+    # "b" changes, "a" is removed
+    assert index.sync([("b", "2", [1.0, 0.0])]) == 2
+    assert len(index) == 1
+    assert index.search([1.0, 0.0], k=5) == [("b", pytest.approx(1.0))]
+
+
+def test_mismatched_dimensions():
+    index = VectorIndex()
+    index.sync([("a", "1", [1.0, 0.0]), ("b", "1", [1.0, 0.0, 0.0])])
+
+    assert len(index) == 1
+    with pytest.raises(ValueError, match="dimensions"):
+        index.search([1.0, 0.0, 0.0], k=1)
+
+
+def test_ivf_matches_flat_on_clustered_data():
+    rng = np.random.default_rng(42)
+    centres = rng.normal(size=(8, 32))
+    vectors = np.concatenate([c + 0.05 * rng.normal(size=(50, 32)) for c in centres])
+    entries = [(f"v{i}", "1", v.tolist()) for i, v in enumerate(vectors)]
+
+    flat = VectorIndex()
+    ivf = VectorIndex(method="ivf", n_lists=8, n_probe=2)
+    flat.sync(entries)
+    ivf.sync(entries)
+
+    for query in centres:
+        expected = {key for key, _ in flat.search(query.tolist(), k=10)}
+        actual = {key for key, _ in ivf.search(query.tolist(), k=10)}
+        assert len(expected & actual) >= 9
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError, match="hnsw"):
+        VectorIndex(method="hnsw")